@@ -0,0 +1,38 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the cost of broadphase collision filtering in a swarm scene.
+# Spheres are packed so tightly that neighbours overlap, but they are
+# spread over several collision groups of which only one pair collides.
+# Most candidate pairs are therefore rejected by the collision group
+# filter in the simulator's nearCallback rather than by the solver.
+
+EVAL_STEPS = 200
+NUM_GROUPS = 8
+
+def build(num_bodies):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    side = int(np.ceil(np.sqrt(num_bodies)))
+    for i in range(num_bodies):
+        x, y = i % side, i // side
+        sim.send_sphere(position=(x * 0.15, y * 0.15, 0.2 + 0.05 * (i % 3)),
+                        radius=0.2,
+                        collision_group='group' + str(i % NUM_GROUPS))
+    sim.assign_collision('group0', 'group1')
+    return sim
+
+print('{:>10} {:>10} {:>12}'.format('bodies', 'total s', 'ms/step'))
+for num_bodies in [100, 400, 1600]:
+    sim = build(num_bodies)
+
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    total = time.time() - start_time
+
+    print('{:>10} {:>10.3f} {:>12.4f}'.format(
+        num_bodies, total, 1000.0 * total / EVAL_STEPS))
@@ -0,0 +1,48 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the per step cost of the broadphase collision spaces as the
+# number of bodies in a large flat arena grows. Small boxes are placed
+# at random in the arena, without gravity and resting on nothing, so
+# almost all of the cost of a step is finding the pairs of geoms which
+# may touch. Each configuration is run for a short and a long simulation
+# and the difference is divided by the extra steps, so start up is not
+# counted.
+
+SHORT_STEPS = 20
+LONG_STEPS = 220
+ARENA_SIZE = 200.0
+REPEATS = 3
+
+def build(num_bodies, collision_space, eval_steps):
+    sim = pyrosim.Simulator(eval_steps=eval_steps, play_blind=True,
+                            sensor_format='float32', log_level='quiet',
+                            collision_space=collision_space)
+    sim.set_gravity(0, 0, 0)
+    positions = np.random.RandomState(0).uniform(
+        -ARENA_SIZE / 2, ARENA_SIZE / 2, (num_bodies, 2))
+    for x, y in positions:
+        sim.send_box(position=(x, y, 1.0), sides=(0.2, 0.2, 0.2))
+    sim.assign_collision('None', 'None')
+    return sim
+
+def run(num_bodies, collision_space, eval_steps):
+    sim = build(num_bodies, collision_space, eval_steps)
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    return time.time() - start_time
+
+print('{:>10} {:>10} {:>12}'.format('bodies', 'space', 'us/step'))
+for num_bodies in [100, 1000, 4000]:
+    for collision_space in ['hash', 'sap', 'quadtree']:
+        extra = (min(run(num_bodies, collision_space, LONG_STEPS)
+                     for _ in range(REPEATS)) -
+                 min(run(num_bodies, collision_space, SHORT_STEPS)
+                     for _ in range(REPEATS)))
+        print('{:>10} {:>10} {:>12.1f}'.format(
+            num_bodies, collision_space,
+            1e6 * extra / (LONG_STEPS - SHORT_STEPS)))
@@ -0,0 +1,75 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the time per genome of a neuroevolution loop in a session.
+# Each genome is either evaluated by building its robot from scratch or
+# by writing its synapse weights into a compiled scene, which is encoded
+# once. Python time is the time spent before the scene is sent.
+
+EVALUATIONS = 20
+EVAL_STEPS = 50
+HIDDEN = 16
+
+def build(num_legs, weights):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    torso = sim.send_box(position=(0, 0, 0.5), sides=(0.4, 0.4, 0.1))
+    sensor = sim.send_position_x_sensor(torso)
+    inputs, motors = [sim.send_bias_neuron()], []
+    for i in range(num_legs):
+        angle = 2 * np.pi * i / num_legs
+        dx, dy = np.cos(angle), np.sin(angle)
+        leg = sim.send_cylinder(position=(0.4 * dx, 0.4 * dy, 0.5),
+                                orientation=(dx, dy, 0),
+                                length=0.4, radius=0.05)
+        joint = sim.send_hinge_joint(torso, leg,
+                                     anchor=(0.2 * dx, 0.2 * dy, 0.5),
+                                     axis=(-dy, dx, 0))
+        motors.append(sim.send_motor_neuron(sim.send_rotary_actuator(joint)))
+        inputs.append(sim.send_sensor_neuron(sim.send_touch_sensor(leg)))
+        inputs.append(sim.send_sensor_neuron(
+            sim.send_proprioceptive_sensor(joint)))
+    hidden = [sim.send_hidden_neuron() for _ in range(HIDDEN)]
+    weights = iter(weights)
+    for source in inputs:
+        for target in hidden:
+            sim.send_synapse(source, target, next(weights))
+    for source in hidden:
+        for target in motors:
+            sim.send_synapse(source, target, next(weights))
+    return sim, sensor
+
+def num_weights(num_legs):
+    return (2 * num_legs + 1) * HIDDEN + HIDDEN * num_legs
+
+print('{:>6} {:>9} {:>10} {:>12} {:>12}'.format(
+    'legs', 'synapses', 'scene', 'python ms', 'total ms'))
+for num_legs in [4, 16, 64]:
+    random = np.random.RandomState(0)
+    population = random.uniform(-1, 1, (EVALUATIONS, num_weights(num_legs)))
+    results = {}
+    with pyrosim.SimulatorSession(log_level='quiet') as session:
+        for mode in ['built', 'compiled']:
+            python_time = 0.0
+            start_time = time.time()
+            if mode == 'compiled':
+                scene = build(num_legs, population[0])[0].compile()
+            for weights in population:
+                build_start = time.time()
+                if mode == 'built':
+                    sim = build(num_legs, weights)[0]
+                    sim._get_scene_bytes()
+                else:
+                    sim = scene.evaluate(weights)
+                python_time += time.time() - build_start
+                session.run(sim)
+            total = time.time() - start_time
+            results[mode] = sim.get_all_sensor_data().array
+
+            print('{:>6} {:>9} {:>10} {:>12.3f} {:>12.3f}'.format(
+                num_legs, population.shape[1], mode,
+                1e3 * python_time / EVALUATIONS, 1e3 * total / EVALUATIONS))
+    assert np.array_equal(results['built'], results['compiled'])
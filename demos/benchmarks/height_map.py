@@ -0,0 +1,60 @@
+import sys
+sys.path.insert(0, '../../')
+import os
+import resource
+import subprocess
+import tempfile
+import time
+import numpy as np
+import pyrosim
+
+# Measures the time to send, parse and build large height maps and the
+# peak memory of the simulator doing so. Maps are sent either as a
+# binary blob through the pipe, as the path of a .npy file which the
+# simulator memory maps, or are generated by the simulator from a seed.
+# Each case runs in its own python process so the peak memory of one
+# simulator does not hide that of the next.
+
+EVAL_STEPS = 1
+
+def run(size, transfer):
+    heights = np.random.RandomState(0).uniform(0.0, 1.0, (size, size))
+    file_name = None
+    if transfer == 'file':
+        handle, file_name = tempfile.mkstemp(suffix='.npy')
+        os.close(handle)
+        np.save(file_name, heights)
+
+    start_time = time.time()
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    if transfer == 'procedural':
+        sim.send_procedural_height_map(samples=size, size=10.0)
+    else:
+        sim.send_height_map(heights if file_name is None else file_name,
+                            size=10.0)
+    sim.start()
+    sim.wait_to_finish()
+    total = time.time() - start_time
+
+    if file_name is not None:
+        os.remove(file_name)
+
+    # kilobytes on linux
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    print(total, peak)
+
+if len(sys.argv) == 3:
+    run(int(sys.argv[1]), sys.argv[2])
+    sys.exit()
+
+print('{:>10} {:>10} {:>10} {:>12}'.format(
+    'samples', 'transfer', 'total s', 'peak MB'))
+for size in [50, 256, 1024, 2048]:
+    for transfer in ['binary', 'file', 'procedural']:
+        output = subprocess.check_output(
+            [sys.executable, __file__, str(size), transfer])
+        total, peak = output.split()
+        print('{:>10} {:>10} {:>10.3f} {:>12.1f}'.format(
+            str(size) + 'x' + str(size), transfer,
+            float(total), float(peak) / 1024.0))
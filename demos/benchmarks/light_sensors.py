@@ -0,0 +1,46 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import pyrosim
+
+# Measures how the per step cost of light sensors scales with the
+# number of sensors and light sources. Bodies float without gravity
+# and far enough apart not to collide. Each configuration is run for a
+# short and a long simulation and the difference is divided by the
+# extra steps, so start up is not counted.
+
+SHORT_STEPS = 100
+LONG_STEPS = 1100
+NUM_BODIES = 500
+REPEATS = 3
+
+def build(num_sensors, num_sources, eval_steps):
+    sim = pyrosim.Simulator(eval_steps=eval_steps, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    sim.set_gravity(0, 0, 0)
+    bodies = [sim.send_box(position=(i % 25, i // 25, 1.0),
+                           sides=(0.1, 0.1, 0.1))
+              for i in range(NUM_BODIES)]
+    for body in bodies[-num_sources:]:
+        sim.add_light_to_body(body)
+    for body in bodies[:num_sensors]:
+        sim.send_light_sensor(body)
+    return sim
+
+def run(num_sensors, num_sources, eval_steps):
+    sim = build(num_sensors, num_sources, eval_steps)
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    return time.time() - start_time
+
+print('{:>10} {:>10} {:>12}'.format('sensors', 'sources', 'us/step'))
+for num_sensors in [1, 20, 100]:
+    for num_sources in [1, 20, 200]:
+        extra = (min(run(num_sensors, num_sources, LONG_STEPS)
+                     for _ in range(REPEATS)) -
+                 min(run(num_sensors, num_sources, SHORT_STEPS)
+                     for _ in range(REPEATS)))
+        print('{:>10} {:>10} {:>12.2f}'.format(
+            num_sensors, num_sources,
+            1e6 * extra / (LONG_STEPS - SHORT_STEPS)))
@@ -0,0 +1,86 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the per step cost of large sparse and dense recurrent
+# neural networks next to many idle bodies. Each configuration is run for a short and a long
+# simulation and the difference is divided by the extra steps, so start
+# up and scene sending are not counted. The best of several repeats is
+# reported. Before timing, a network fed an infinite sensor value is run
+# with sparse and dense weights, which have to move the robot the same.
+
+SHORT_STEPS = 100
+LONG_STEPS = 1100
+NUM_BODIES = 200
+REPEATS = 3
+
+def build(num_neurons, synapses_per_neuron, eval_steps):
+    sim = pyrosim.Simulator(eval_steps=eval_steps, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    sim.set_gravity(0, 0, 0)
+    rng = np.random.RandomState(0)
+
+    # idle floating bodies spread out so they do not collide
+    for i in range(NUM_BODIES):
+        sim.send_box(position=(i % 20, i // 20, 1.0),
+                     sides=(0.1, 0.1, 0.1))
+
+    bias = sim.send_bias_neuron()
+    neurons = [sim.send_hidden_neuron(alpha=0.5, tau=0.5)
+               for _ in range(num_neurons)]
+    for neuron in neurons:
+        sim.send_synapse(bias, neuron, rng.uniform(-1, 1))
+        for source in rng.choice(num_neurons, synapses_per_neuron,
+                                 replace=False):
+            sim.send_synapse(neurons[source], neuron, rng.uniform(-1, 1))
+    return sim
+
+def run_infinite_sensor(dense):
+    sim = pyrosim.Simulator(eval_steps=100, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    box = sim.send_box(position=(0, 0, 0.5))
+    arm = sim.send_box(position=(0, 0, 1.5))
+    joint = sim.send_hinge_joint(box, arm, anchor=(0, 0, 1.0))
+    motor = sim.send_rotary_actuator(joint)
+    angle = sim.send_proprioceptive_sensor(joint)
+
+    # a light sensor on the body of the light reads infinity
+    sim.add_light_to_body(box)
+    light = sim.send_light_sensor(box)
+
+    sensor_neuron = sim.send_sensor_neuron(light)
+    hidden = sim.send_hidden_neuron()
+    sim.send_motor_neuron(motor)
+    sim.send_synapse(sensor_neuron, hidden, 1.0)
+    if dense:
+        # fills enough of the weights to store them dense
+        sim.send_synapse(hidden, hidden, 1.0)
+    sim.start()
+    sim.wait_to_finish()
+    return sim.get_sensor_data(angle)
+
+sparse_angles = run_infinite_sensor(dense=False)
+dense_angles = run_infinite_sensor(dense=True)
+assert np.all(np.isfinite(dense_angles))
+assert np.array_equal(sparse_angles, dense_angles), (
+    'Dense and sparse networks differ on an infinite sensor value')
+
+def run(num_neurons, synapses_per_neuron, eval_steps):
+    sim = build(num_neurons, synapses_per_neuron, eval_steps)
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    return time.time() - start_time
+
+print('{:>10} {:>10} {:>12}'.format('neurons', 'synapses', 'us/step'))
+for num_neurons, synapses_per_neuron in [(100, 4), (1000, 4), (10000, 4),
+                                        (500, 500)]:
+    extra = (min(run(num_neurons, synapses_per_neuron, LONG_STEPS)
+                 for _ in range(REPEATS)) -
+             min(run(num_neurons, synapses_per_neuron, SHORT_STEPS)
+                 for _ in range(REPEATS)))
+    print('{:>10} {:>10} {:>12.2f}'.format(
+        num_neurons, num_neurons * (synapses_per_neuron + 1),
+        1e6 * extra / (LONG_STEPS - SHORT_STEPS)))
@@ -0,0 +1,48 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import pyrosim
+
+# Measures the cost and the stability of stepping the physics with a
+# small dt, either for every step or as substeps of a larger control
+# step. Each scene stacks small boxes, which drift and topple when the
+# physics step is too long, and runs a fully connected network and
+# sensors on every box. The stack stood if the top box is still at its
+# starting height.
+
+SIMULATED_SECONDS = 10.0
+STACK_HEIGHT = 10
+NUM_HIDDEN = 100
+SIDE = 0.05
+
+def build(dt, physics_substeps):
+    sim = pyrosim.Simulator(eval_steps=int(round(SIMULATED_SECONDS / dt)),
+                            dt=dt, physics_substeps=physics_substeps,
+                            play_blind=True, sensor_format='float32',
+                            log_level='quiet')
+    for i in range(STACK_HEIGHT):
+        box = sim.send_box(position=(0, 0, SIDE * (i + 0.5)),
+                           sides=(SIDE, SIDE, SIDE))
+        sim.send_position_x_sensor(box)
+        sim.send_position_y_sensor(box)
+        z = sim.send_position_z_sensor(box)
+    sim.assign_collision('None', 'None')
+    hidden = [sim.send_hidden_neuron() for _ in range(NUM_HIDDEN)]
+    for source in hidden:
+        for target in hidden:
+            sim.send_synapse(source, target, 0.01)
+    return sim, z
+
+print('{:>8} {:>10} {:>8} {:>10} {:>10} {:>10}'.format(
+    'dt', 'substeps', 'steps', 'MB', 'total s', 'top z'))
+for dt, physics_substeps in [(0.01, 1), (0.001, 1), (0.01, 10)]:
+    sim, z = build(dt, physics_substeps)
+
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    total = time.time() - start_time
+
+    print('{:>8} {:>10} {:>8} {:>10.3f} {:>10.3f} {:>10.4f}'.format(
+        dt, physics_substeps, sim.steps_run, len(sim._raw_cout) / 1e6,
+        total, sim.get_sensor_data(z)[-1]))
@@ -0,0 +1,34 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures how fast scenes of increasing size are sent to the simulator.
+# Large user neurons and height maps used to stall Simulator.start()
+# once the simulator's stderr echo filled the pipe buffer.
+
+EVAL_STEPS = 10
+
+def build(num_values):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32')
+    box = sim.send_box(position=(0, 0, 1))
+    sim.send_position_z_sensor(box)
+    sim.send_user_neuron(np.sin(np.arange(num_values) / 10.0))
+    return sim
+
+print('{:>10} {:>10} {:>10} {:>10} {:>10}'.format(
+    'values', 'MB', 'start s', 'total s', 'MB/s'))
+for num_values in [10**3, 10**4, 10**5, 10**6]:
+    sim = build(num_values)
+    megabytes = len(sim._strings_to_send) / 1e6
+
+    start_time = time.time()
+    sim.start()
+    started = time.time() - start_time
+    sim.wait_to_finish()
+    total = time.time() - start_time
+
+    print('{:>10} {:>10.2f} {:>10.4f} {:>10.3f} {:>10.2f}'.format(
+        num_values, megabytes, started, total, megabytes / total))
@@ -0,0 +1,43 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import pyrosim
+
+# Measures the cost of recording and writing back the values of many
+# sensors over a long simulation, recording every step, only every k-th
+# step, or only a mean reduced in the simulator ('mean' rows). Bodies
+# float without gravity so physics stays cheap.
+
+EVAL_STEPS = 20000
+NUM_BODIES = 100
+
+def build(record_every, sensor_format):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format=sensor_format, log_level='quiet',
+                            record_every=1 if record_every == 'mean'
+                                         else record_every)
+    sim.set_gravity(0, 0, 0)
+    for i in range(NUM_BODIES):
+        body = sim.send_box(position=(i % 10, i // 10, 1.0),
+                            sides=(0.1, 0.1, 0.1))
+        for dimension in 'xyz':
+            sensor = sim.send_position_sensor(
+                body, which_dimension=dimension,
+                write_back=record_every != 'mean')
+            if record_every == 'mean':
+                sim.send_sensor_reducer(sensor, 'mean')
+    return sim
+
+print('{:>10} {:>10} {:>10} {:>10}'.format(
+    'format', 'every', 'MB', 'total s'))
+for sensor_format in ['float32', 'text']:
+    for record_every in [1, 10, 100, 'mean']:
+        sim = build(record_every, sensor_format)
+
+        start_time = time.time()
+        sim.start()
+        sim.wait_to_finish()
+        total = time.time() - start_time
+
+        print('{:>10} {:>10} {:>10.4f} {:>10.3f}'.format(
+            sensor_format, record_every, len(sim._raw_cout) / 1e6, total))
@@ -0,0 +1,48 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import pyrosim
+
+# Measures the steps per second of the exact and the quick solver as
+# the number of bodies grows. Each scene is a chain of boxes linked by
+# hinge joints, falling onto the ground, so the whole chain is one
+# group of constraints for the solver. Each configuration is run for a
+# short and a long simulation and the difference is divided by the
+# extra steps, so start up is not counted. The exact solver is only run
+# for the smaller chains, it takes minutes for the larger ones.
+
+SHORT_STEPS = 20
+LONG_STEPS = 100
+MAX_EXACT_BODIES = 40
+SIDE = 0.1
+
+def build(num_bodies, solver, eval_steps):
+    sim = pyrosim.Simulator(eval_steps=eval_steps, play_blind=True,
+                            sensor_format='float32', log_level='quiet',
+                            solver=solver)
+    bodies = [sim.send_box(position=(SIDE * i, 0, 0.5),
+                           sides=(0.9 * SIDE, SIDE, SIDE))
+              for i in range(num_bodies)]
+    for i in range(num_bodies - 1):
+        sim.send_hinge_joint(bodies[i], bodies[i + 1],
+                             anchor=(SIDE * (i + 0.5), 0, 0.5),
+                             axis=(0, 1, 0))
+    sim.send_position_z_sensor(bodies[-1])
+    return sim
+
+def run(num_bodies, solver, eval_steps):
+    sim = build(num_bodies, solver, eval_steps)
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    return time.time() - start_time
+
+print('{:>10} {:>10} {:>12}'.format('bodies', 'solver', 'steps/s'))
+for num_bodies in [10, 20, 40, 100, 200, 400]:
+    for solver in ['exact', 'quick']:
+        if solver == 'exact' and num_bodies > MAX_EXACT_BODIES:
+            continue
+        extra = run(num_bodies, solver, LONG_STEPS) - \
+            run(num_bodies, solver, SHORT_STEPS)
+        print('{:>10} {:>10} {:>12.0f}'.format(
+            num_bodies, solver, (LONG_STEPS - SHORT_STEPS) / extra))
@@ -0,0 +1,35 @@
+import sys
+sys.path.insert(0, '../../')
+import os
+import subprocess
+import time
+import pyrosim
+
+# Measures the start up latency of the simulator and of the headless
+# simulator, which does not load drawstuff, OpenGL and GLUT. Both play
+# the same empty one step scene blind, so the time is almost entirely
+# loading the executable, initializing ODE and writing back.
+
+REPEATS = 50
+
+sim = pyrosim.Simulator(eval_steps=1, play_blind=True,
+                        sensor_format='float32', log_level='quiet')
+scene = sim._get_scene_bytes()
+
+def run(executable):
+    start_time = time.time()
+    pipe = subprocess.Popen([executable, '-blind', '-loglevel', '0'],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, cwd=sim._simulator_path)
+    pipe.communicate(scene)
+    return time.time() - start_time
+
+print('{:>20} {:>10} {:>10}'.format('executable', 'min ms', 'mean ms'))
+for name in ['simulator', 'simulator_headless']:
+    executable = os.path.join(sim._simulator_path, name)
+    if not os.path.exists(executable):
+        print('{:>20} {:>10}'.format(name, 'not built'))
+        continue
+    times = [run(executable) for _ in range(REPEATS)]
+    print('{:>20} {:>10.2f} {:>10.2f}'.format(
+        name, 1e3 * min(times), 1e3 * sum(times) / len(times)))
@@ -0,0 +1,55 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the cost of the walls of a maze built from free bodies
+# resting on the ground, from bodies pinned to the world by hinge joints
+# without range, and from static bodies. A few balls are pushed through
+# the maze and bounce off the walls. Each configuration is run for a
+# short and a long simulation and the difference is divided by the
+# extra steps, so start up is not counted.
+
+SHORT_STEPS = 20
+LONG_STEPS = 220
+MAZE_SIZE = 16
+NUM_BALLS = 10
+REPEATS = 3
+
+def build(walls, num_walls, eval_steps):
+    sim = pyrosim.Simulator(eval_steps=eval_steps, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    rng = np.random.RandomState(0)
+    cells = rng.permutation(MAZE_SIZE * MAZE_SIZE * 2)[:num_walls]
+    for cell in cells:
+        x, y = cell // 2 % MAZE_SIZE, cell // 2 // MAZE_SIZE
+        sides = (1.0, 0.1, 0.5) if cell % 2 else (0.1, 1.0, 0.5)
+        wall = sim.send_box(position=(x, y, 0.25), sides=sides,
+                            static=walls == 'static')
+        if walls == 'pinned':
+            sim.send_hinge_joint(wall, -1, anchor=(x, y, 0.25),
+                                 joint_range=(0, 0))
+    for i in range(NUM_BALLS):
+        ball = sim.send_sphere(position=(i + 0.5, 0.5, 0.2), radius=0.2)
+        sim.add_impulse_to_body(ball, (0.5, 2.0, 0))
+        sim.send_position_y_sensor(ball)
+    sim.assign_collision('None', 'None')
+    return sim
+
+def run(walls, num_walls, eval_steps):
+    sim = build(walls, num_walls, eval_steps)
+    start_time = time.time()
+    sim.start()
+    sim.wait_to_finish()
+    return time.time() - start_time
+
+print('{:>10} {:>10} {:>12}'.format('walls', 'type', 'us/step'))
+for num_walls in [100, 300]:
+    for walls in ['free', 'pinned', 'static']:
+        extra = (min(run(walls, num_walls, LONG_STEPS)
+                     for _ in range(REPEATS)) -
+                 min(run(walls, num_walls, SHORT_STEPS)
+                     for _ in range(REPEATS)))
+        print('{:>10} {:>10} {:>12.1f}'.format(
+            num_walls, walls, 1e6 * extra / (LONG_STEPS - SHORT_STEPS)))
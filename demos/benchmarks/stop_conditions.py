@@ -0,0 +1,42 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the compute saved by ending failed evaluations early. Each
+# simulation drops a sphere from a random height next to idle bodies,
+# and counts as failed once the sphere has fallen below z = 0.5. The
+# population is evaluated once for the full number of steps and once
+# with a stop condition on the sphere's z position.
+
+EVAL_STEPS = 2000
+NUM_BODIES = 100
+POPULATION = 16
+
+def build(height, stop_early):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    for i in range(NUM_BODIES):
+        sim.send_box(position=(i % 20, 2 + i // 20, 0.05),
+                     sides=(0.1, 0.1, 0.1))
+    sphere = sim.send_sphere(position=(0, 0, height), radius=0.1)
+    z = sim.send_position_z_sensor(sphere)
+    if stop_early:
+        sim.add_stop_condition(z, '<', 0.5)
+    return sim
+
+heights = np.random.RandomState(0).uniform(1, 40, POPULATION)
+
+print('{:>10} {:>10} {:>10}'.format('stop', 'steps', 'total s'))
+for stop_early in [False, True]:
+    steps = 0
+    start_time = time.time()
+    for height in heights:
+        sim = build(height, stop_early)
+        sim.start()
+        sim.wait_to_finish()
+        steps += sim.steps_run
+    total = time.time() - start_time
+
+    print('{:>10} {:>10} {:>10.3f}'.format(str(stop_early), steps, total))
@@ -0,0 +1,73 @@
+import sys
+sys.path.insert(0, '../../')
+import time
+import numpy as np
+import pyrosim
+
+# Measures the cost of building a swarm of identical robots, each sent
+# body by body or as an instance of a template sent once. Python build
+# time and the size of the scene sent to the simulator grow with every
+# copy sent directly, instances only send their position and the
+# weights which differ from the template.
+
+EVAL_STEPS = 10
+LEGS = 4
+
+def send_robot(sim, x=0.0, y=0.0, weights=None):
+    """Sends a robot with legs around a box at (x, y)"""
+    if weights is None:
+        weights = np.zeros(LEGS)
+    torso = sim.send_box(position=(x, y, 0.5), sides=(0.4, 0.4, 0.1))
+    synapses = []
+    sensor = sim.send_position_z_sensor(torso)
+    bias = sim.send_bias_neuron()
+    for i in range(LEGS):
+        angle = 2 * np.pi * i / LEGS
+        dx, dy = np.cos(angle), np.sin(angle)
+        leg = sim.send_cylinder(position=(x + 0.4 * dx, y + 0.4 * dy, 0.5),
+                                orientation=(dx, dy, 0),
+                                length=0.4, radius=0.05)
+        joint = sim.send_hinge_joint(torso, leg,
+                                     anchor=(x + 0.2 * dx, y + 0.2 * dy, 0.5),
+                                     axis=(-dy, dx, 0))
+        motor = sim.send_motor_neuron(sim.send_rotary_actuator(joint))
+        touch = sim.send_sensor_neuron(sim.send_touch_sensor(leg))
+        synapses.append(sim.send_synapse(bias, motor, weights[i]))
+        sim.send_synapse(touch, motor, 1.0)
+    return sensor, synapses
+
+def build(num_robots, use_template):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    random = np.random.RandomState(0)
+    if use_template:
+        with sim.define_template() as robot:
+            sensor, synapses = send_robot(sim)
+    for i in range(num_robots):
+        x, y = 2.0 * (i % 20), 2.0 * (i // 20)
+        weights = random.uniform(-1, 1, LEGS)
+        if use_template:
+            sim.instantiate(robot, position=(x, y, 0),
+                            weight_overrides=dict(zip(synapses, weights)))
+        else:
+            send_robot(sim, x, y, weights)
+    return sim
+
+print('{:>8} {:>10} {:>10} {:>12} {:>10}'.format(
+    'robots', 'sent as', 'build ms', 'scene bytes', 'total ms'))
+for num_robots in [10, 100, 1000]:
+    for use_template in [False, True]:
+        start_time = time.time()
+        sim = build(num_robots, use_template)
+        build_time = time.time() - start_time
+        scene_bytes = len(sim._get_scene_bytes())
+
+        sim = build(num_robots, use_template)
+        start_time = time.time()
+        sim.start()
+        sim.wait_to_finish()
+        total = time.time() - start_time + build_time
+
+        print('{:>8} {:>10} {:>10.1f} {:>12} {:>10.1f}'.format(
+            num_robots, 'template' if use_template else 'bodies',
+            1e3 * build_time, scene_bytes, 1e3 * total))
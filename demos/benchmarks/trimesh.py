@@ -0,0 +1,77 @@
+import sys
+sys.path.insert(0, '../../')
+import os
+import tempfile
+import time
+import numpy as np
+import pyrosim
+
+# Measures the time to evaluate scenes with a large triangle mesh terrain
+# and many copies of an obstacle mesh in a session. The first scene
+# builds the meshes, once for all copies of the obstacle, later scenes
+# find the built meshes by their content hash. Meshes are sent either as
+# arrays, written once to a temporary mesh file, or as the path of a
+# saved mesh file. Neither file is opened once the mesh is built.
+
+EVALUATIONS = 5
+EVAL_STEPS = 10
+OBSTACLES = 50
+
+def grid_mesh(samples, size):
+    heights = np.random.RandomState(0).uniform(0.0, 0.5, (samples, samples))
+    x, y = np.meshgrid(np.linspace(-size / 2, size / 2, samples),
+                       np.linspace(-size / 2, size / 2, samples))
+    vertices = np.stack([x.ravel(), y.ravel(), heights.ravel()], axis=1)
+    corner = (np.arange(samples - 1)[:, None] * samples +
+              np.arange(samples - 1)[None, :]).ravel()
+    indices = np.concatenate([
+        np.stack([corner, corner + 1, corner + samples + 1], axis=1),
+        np.stack([corner, corner + samples + 1, corner + samples], axis=1)])
+    return vertices, indices
+
+def send(sim, mesh, transfer, **kwargs):
+    if transfer == 'arrays':
+        return sim.send_trimesh(*mesh, **kwargs)
+    return sim.send_trimesh_file(mesh, **kwargs)
+
+def build(terrain, obstacle, transfer):
+    sim = pyrosim.Simulator(eval_steps=EVAL_STEPS, play_blind=True,
+                            sensor_format='float32', log_level='quiet')
+    send(sim, terrain, transfer)
+    for i in range(OBSTACLES):
+        send(sim, obstacle, transfer,
+             position=(i % 10 - 4.5, i // 10 - 2.0, 1.0))
+    ball = sim.send_sphere(position=(0, 0, 2), radius=0.2)
+    sim.send_position_z_sensor(ball)
+    sim.assign_collision('None', 'None')
+    return sim
+
+print('{:>10} {:>10} {:>10} {:>10}'.format(
+    'triangles', 'transfer', 'first ms', 'later ms'))
+obstacle = grid_mesh(20, 0.5)
+for samples in [64, 256, 512]:
+    terrain = grid_mesh(samples, 10.0)
+    files = []
+    for mesh in [terrain, obstacle]:
+        handle, file_name = tempfile.mkstemp(suffix='.mesh')
+        os.close(handle)
+        pyrosim.save_mesh(file_name, *mesh)
+        files.append(file_name)
+
+    for transfer in ['arrays', 'file']:
+        times = []
+        with pyrosim.SimulatorSession(log_level='quiet') as session:
+            for _ in range(EVALUATIONS):
+                start_time = time.time()
+                if transfer == 'arrays':
+                    sim = build(terrain, obstacle, transfer)
+                else:
+                    sim = build(files[0], files[1], transfer)
+                session.run(sim)
+                times.append(time.time() - start_time)
+        print('{:>10} {:>10} {:>10.1f} {:>10.1f}'.format(
+            len(terrain[1]), transfer, 1e3 * times[0],
+            1e3 * min(times[1:])))
+
+    for file_name in files:
+        os.remove(file_name)
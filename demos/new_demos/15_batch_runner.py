@@ -0,0 +1,25 @@
+import sys
+sys.path.insert(0, '../../')
+import pyrosim
+
+# The batch runner evaluates many simulations in parallel,
+# using at most one simulator process per core. Jobs can be
+# built simulators or functions that build them when a
+# worker becomes free.
+
+def drop_box(height):
+    sim = pyrosim.Simulator(eval_steps=200, play_blind=True)
+    box = sim.send_box(position=(0, 0, height))
+    sim.send_position_z_sensor(box)
+    return sim
+
+heights = [0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
+jobs = [lambda h=h: drop_box(h) for h in heights]
+
+# kill any simulation running longer than 10 seconds
+runner = pyrosim.BatchRunner(timeout=10)
+
+# results come back in the order the jobs were given
+for height, sim in zip(heights, runner.run(jobs)):
+    z = sim.get_sensor_data(1)
+    print(height, z[-1])
@@ -1 +1,6 @@
-from .pyrosim import Simulator
\ No newline at end of file
+from .pyrosim import Simulator
+from .sensor_data import SensorData
+from .session import SimulatorSession
+from .batch import BatchRunner
+from .mesh_file import save_mesh
+from .compiled_scene import CompiledScene
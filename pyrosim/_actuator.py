@@ -105,6 +105,7 @@ class Mixin(object):
         assert len(force_range) == 2, ('force_range must be a tuple')
         assert len(direction) == 3, ('direction must be a triple')
         self._assert_body(body_id, 'body_id')
+        self._assert_not_static(body_id, 'body_id')
         return self._send_actuator('ThrusterActuator',
                                     body_id,
                                     force_range,
@@ -7,6 +7,14 @@ class Mixin(object):
         """Sends an entity categorized as Body"""
         return self._send_entity('Body', *args)
 
+    def _send_static_or_body(self, body_type, static, *args):
+        """Sends a body, prefixing its type with Static if static"""
+        if not static:
+            return self._send_body(body_type, *args)
+        body_id = self._send_body('Static' + body_type, *args)
+        self._static_bodies_of(body_id).add(body_id)
+        return body_id
+
     def add_impulse_to_body(self,
                             body_id,
                             force,
@@ -23,6 +31,7 @@ class Mixin(object):
             The tme step to apply the specified force
         """
         self._assert_body(body_id, 'body_id')
+        self._assert_not_static(body_id, 'body_id')
         assert len(force) == 3, ('Force must be size 3')
         assert time_step >= 0, ('time_step must be >= 0')
 
@@ -172,6 +181,7 @@ class Mixin(object):
             The total length the ray can sense
         """
         self._assert_body(body_id, 'composite_id')
+        self._assert_not_static(body_id, 'body_id')
         return self._send_body('Ray', body_id, position, direction, max_length)
 
     def send_box(self,
@@ -181,7 +191,8 @@ class Mixin(object):
                  density = 1.0,
                  color = (1.0, 1.0, 1.0),
                  space = None,
-                 collision_group = None):
+                 collision_group = None,
+                 static = False):
         """Send a box geometry to the simulator
 
         Parameters
@@ -203,6 +214,12 @@ class Mixin(object):
             The string name of the collision group in which to place the body.
             Collision groups specify how bodies collide. (default is to use
             the string set by :func:`set_current_collision_group()` function)
+        static          : bool (optional)
+            If True, the body never moves. It is only geometry, takes no
+            part in the dynamics and is not tested against the ground or
+            other static bodies, which makes it much cheaper than a body
+            pinned to the world. For walls, ramps and stairs. The space
+            is ignored. (default False)
         Returns
         -------
         int
@@ -215,14 +232,14 @@ class Mixin(object):
         if space is None:
             space = self._current_space
 
-        return self._send_body('Box',
-                               position,
-                               orientation,
-                               sides,
-                               density,
-                               color,
-                               space,
-                               collision_group)
+        return self._send_static_or_body('Box', static,
+                                         position,
+                                         orientation,
+                                         sides,
+                                         density,
+                                         color,
+                                         space,
+                                         collision_group)
 
     def send_cylinder(self,
                       position = (0.0, 0.0, 0.0),
@@ -233,7 +250,8 @@ class Mixin(object):
                       density = 1.0,
                       color = (1.0, 1.0, 1.0),
                       space = None,
-                      collision_group = None):
+                      collision_group = None,
+                      static = False):
         """Send a cylinder geometry to the simulator
 
         Parameters
@@ -260,6 +278,9 @@ class Mixin(object):
             The string name of the collision group in which to place the body.
             Collision groups specify how bodies collide. (default is to use
             the string set by :func:`set_current_collision_group()` function)
+        static          : bool (optional)
+            If True, the body never moves, see :func:`send_box()`.
+            (default False)
         Returns
         -------
         int
@@ -273,18 +294,19 @@ class Mixin(object):
 
         capped = int(capped)
 
-        return self._send_body('Cylinder',
-                               position,
-                               orientation,
-                               length,
-                               radius,
-                               capped,
-                               density,
-                               color,
-                               space,
-                               collision_group)
-
-    def send_composite_body(self, space=None, collision_group=None):
+        return self._send_static_or_body('Cylinder', static,
+                                         position,
+                                         orientation,
+                                         length,
+                                         radius,
+                                         capped,
+                                         density,
+                                         color,
+                                         space,
+                                         collision_group)
+
+    def send_composite_body(self, space=None, collision_group=None,
+                            static=False):
         """Send a composite body base
 
         Parameters
@@ -296,6 +318,9 @@ class Mixin(object):
             The string name of the collision group in which to place the body.
             Collision groups specify how bodies collide. (default is to use
             the string set by :func:`set_current_collision_group()` function)
+        static          : bool (optional)
+            If True, the body never moves, see :func:`send_box()`.
+            (default False)
         Returns
         -------
         int
@@ -307,21 +332,25 @@ class Mixin(object):
         if space is None:
             space = self._current_space
 
-        return self._send_body('Composite',
-                               space,
-                               collision_group)
+        return self._send_static_or_body('Composite', static,
+                                         space,
+                                         collision_group)
 
     def send_height_map(self, height_matrix,
                         position=(0, 0, 0),
                         size=10.0,
-                        height_scale=1.0):
+                        height_scale=1.0,
+                        shape=None):
         """Send a height map to the simulator
 
         Parameters
         ----------
-        height_matrix : 2D numpy matrix
+        height_matrix : 2D numpy matrix or str
             A matrix filled in with the height (z) values. Each dimension
-            must be at least size 2
+            must be at least size 2. Instead of a matrix the path of a
+            .npy file, or of a raw file of little endian float64 values
+            in row order, may be given. Files holding float64 values in
+            row order are memory mapped by the simulator rather than sent.
         position      : triple float (optional)
             The center position of the height map. (default is [0, 0, 0])
         size          : float, tuple float (optional)
@@ -329,8 +358,31 @@ class Mixin(object):
             a square. (default is (10, 10))
         height_scale  : float (optional)
             Height multiplier. (default is 1.0)
+        shape         : tuple int (optional)
+            The shape of the matrix in a raw file. Not needed for a
+            matrix or a .npy file.
         """
+        import os
         import numpy as np
+
+        height_source = None
+        if isinstance(height_matrix, str):
+            file_name = os.path.abspath(height_matrix)
+            if shape is None:
+                height_matrix = np.load(file_name, mmap_mode='r')
+            else:
+                height_matrix = np.memmap(file_name, dtype='<f8',
+                                          mode='r', shape=tuple(shape))
+
+            if (height_matrix.dtype == np.dtype('<f8') and
+                    height_matrix.flags['C_CONTIGUOUS']):
+                # simulator maps the file itself
+                height_source = ('File', file_name, height_matrix.offset)
+
+        if height_source is None:
+            height_source = ('Binary', np.ascontiguousarray(
+                height_matrix, dtype='<f8').tobytes())
+
         M, N= np.shape(height_matrix)
 
         try:
@@ -340,13 +392,11 @@ class Mixin(object):
 
         assert (len(size) == 2)
 
-        height_vec = height_matrix.ravel('C')
-
         return self._send_entity('Entity',
                                  'HeightMap',
                                   position,
                                   M, N,
-                                  height_vec,
+                                  *height_source,
                                   size,
                                   height_scale,
                                   0.0, # offset (unecessary with position)
@@ -354,6 +404,252 @@ class Mixin(object):
                                   0, # infinite wrap, not implemented
                                   )
 
+    def send_procedural_height_map(self, kind='perlin',
+                                   seed=0,
+                                   octaves=4,
+                                   frequency=4.0,
+                                   persistence=0.5,
+                                   samples=64,
+                                   position=(0, 0, 0),
+                                   size=10.0,
+                                   height_scale=1.0):
+        """Send a height map which is generated by the simulator
+
+        Only the parameters are sent. Generated terrains are cached by
+        the simulator, so a :class:`SimulatorSession` reuses them for
+        later simulations with the same parameters.
+
+        Parameters
+        ----------
+        kind          : str (optional)
+            'perlin' for smooth hills with heights in about [-1, 1],
+            'steps' for flat blocks with heights in [-1, 1] or
+            'ridges' for sharp ridges with heights in [0, 1].
+            (default is 'perlin')
+        seed          : int (optional)
+            Seed of the random terrain. (default is 0)
+        octaves       : int (optional)
+            Number of layers of detail, each twice as fine as the one
+            before. (default is 4)
+        frequency     : float (optional)
+            Number of features across the map in the first octave.
+            (default is 4.0)
+        persistence   : float (optional)
+            Weight of each octave relative to the one before.
+            (default is 0.5)
+        samples       : int, tuple int (optional)
+            Number of samples along each side, at least 2. When a
+            singular value, the samples are square. (default is 64)
+        position      : triple float (optional)
+            The center position of the height map. (default is [0, 0, 0])
+        size          : float, tuple float (optional)
+            The length of each side. When a singular value, height map is
+            a square. (default is (10, 10))
+        height_scale  : float (optional)
+            Height multiplier. (default is 1.0)
+        """
+        valid_kinds = ['perlin', 'steps', 'ridges']
+        assert kind in valid_kinds, ('kind must be one of ' + str(valid_kinds))
+        assert octaves > 0, ('octaves must be positive')
+
+        try:
+            len(samples)
+        except:
+            samples = (samples, samples)
+
+        try:
+            len(size)
+        except:
+            size = (size, size)
+
+        assert (len(samples) == 2 and min(samples) >= 2)
+        assert (len(size) == 2)
+
+        M, N = samples
+
+        return self._send_entity('Entity',
+                                 'ProceduralHeightMap',
+                                  position,
+                                  M, N,
+                                  kind,
+                                  int(seed),
+                                  int(octaves),
+                                  frequency,
+                                  persistence,
+                                  size,
+                                  height_scale,
+                                  0.0, # offset (unecessary with position)
+                                  1.0, # min aabb thickness
+                                  0, # infinite wrap, not implemented
+                                  )
+
+    def send_trimesh(self, vertices, indices,
+                     position=(0.0, 0.0, 0.0),
+                     orientation=(0.0, 0.0, 1.0),
+                     density=1.0,
+                     color=(1.0, 1.0, 1.0),
+                     space=None,
+                     collision_group=None,
+                     static=True):
+        """Send a triangle mesh geometry to the simulator
+
+        The simulator builds each mesh once, together with the tree of
+        bounding volumes used for collisions, and shares it between all
+        the bodies using the same mesh. Built meshes are found by the hash
+        of their content and kept by the simulator, so a
+        :class:`SimulatorSession` reuses them for later simulations.
+
+        The mesh is not sent through the pipe. It is written once to a
+        temporary mesh file, as with :func:`pyrosim.save_mesh()`, which
+        the simulator only opens when it has not built the mesh yet.
+
+        Parameters
+        ----------
+        vertices        : 2D numpy array
+            Vertex coordinates relative to the position of the body, one
+            row of x, y, z per vertex.
+        indices         : 2D numpy array
+            Vertex indices, one row of three per triangle. Triangles are
+            wound counter clockwise seen from outside.
+        position        : triple float (optional)
+            The global position of the body. (default [0, 0, 0])
+        orientation     : triple float (optional)
+            The global direction of the z axis of the mesh.
+            (default [0, 0, 1])
+        density         : float (optional)
+            The density of the body
+        color           : triple float (optional)
+            Color of the body. (default is [1, 1, 1])
+        space           : str (optional)
+            The string name of the space in which to place the body.
+            (default is to use the string set by :func:`set_current_space()` function)
+        collision_group : str (optional)
+            The string name of the collision group in which to place the body.
+            Collision groups specify how bodies collide. (default is to use
+            the string set by :func:`set_current_collision_group()` function)
+        static          : bool (optional)
+            If True, the mesh never moves, see :func:`send_box()`. Meshes
+            are mostly terrain and obstacles, so this is the default. A
+            mesh which moves must be closed and centered on its center of
+            mass, and rests much less stably on other meshes than on
+            other shapes. (default True)
+        Returns
+        -------
+        int
+            The id tag of the mesh
+        """
+        if __package__:
+            from .mesh_file import as_mesh_arrays, mesh_file_of
+        else:
+            from mesh_file import as_mesh_arrays, mesh_file_of
+
+        vertices, indices = as_mesh_arrays(vertices, indices)
+        file_name, content_hash = mesh_file_of(vertices, indices)
+
+        return self._send_trimesh(static,
+                                  position,
+                                  orientation,
+                                  file_name,
+                                  len(vertices),
+                                  len(indices),
+                                  content_hash,
+                                  density,
+                                  color,
+                                  space,
+                                  collision_group)
+
+    def send_trimesh_file(self, file_name,
+                          position=(0.0, 0.0, 0.0),
+                          orientation=(0.0, 0.0, 1.0),
+                          density=1.0,
+                          color=(1.0, 1.0, 1.0),
+                          space=None,
+                          collision_group=None,
+                          static=True):
+        """Send a triangle mesh geometry stored in a mesh file
+
+        The file is written by :func:`pyrosim.save_mesh()` and memory
+        mapped by the simulator rather than sent. It is not opened at all
+        when the simulator has already built the same mesh.
+
+        Parameters
+        ----------
+        file_name       : str
+            Path of the mesh file
+        position        : triple float (optional)
+            The global position of the body. (default [0, 0, 0])
+        orientation     : triple float (optional)
+            The global direction of the z axis of the mesh.
+            (default [0, 0, 1])
+        density         : float (optional)
+            The density of the body
+        color           : triple float (optional)
+            Color of the body. (default is [1, 1, 1])
+        space           : str (optional)
+            The string name of the space in which to place the body.
+            (default is to use the string set by :func:`set_current_space()` function)
+        collision_group : str (optional)
+            The string name of the collision group in which to place the body.
+            Collision groups specify how bodies collide. (default is to use
+            the string set by :func:`set_current_collision_group()` function)
+        static          : bool (optional)
+            If True, the mesh never moves, see :func:`send_trimesh()`.
+            (default True)
+        Returns
+        -------
+        int
+            The id tag of the mesh
+        """
+        import os
+        if __package__:
+            from .mesh_file import read_mesh_header
+        else:
+            from mesh_file import read_mesh_header
+
+        file_name = os.path.abspath(file_name)
+        num_vertices, num_triangles, content_hash = read_mesh_header(file_name)
+
+        return self._send_trimesh(static,
+                                  position,
+                                  orientation,
+                                  file_name,
+                                  num_vertices,
+                                  num_triangles,
+                                  content_hash,
+                                  density,
+                                  color,
+                                  space,
+                                  collision_group)
+
+    def _send_trimesh(self, static, position, orientation, file_name,
+                      num_vertices, num_triangles, content_hash,
+                      density, color, space, collision_group):
+        """Sends a triangle mesh body with the hash and file of its mesh"""
+        if __package__:
+            from .mesh_file import HEADER
+        else:
+            from mesh_file import HEADER
+
+        if collision_group is None:
+            collision_group = self._current_collision_group
+
+        if space is None:
+            space = self._current_space
+
+        return self._send_static_or_body('TriMesh', static,
+                                         position,
+                                         orientation,
+                                         content_hash,
+                                         num_vertices,
+                                         num_triangles,
+                                         file_name,
+                                         HEADER.size,
+                                         HEADER.size + 24 * num_vertices,
+                                         density,
+                                         color,
+                                         space,
+                                         collision_group)
+
     def send_sphere(self,
                     position = (0.0, 0.0, 0.0),
                     orientation = (0.0, 0.0, 1.0),
@@ -361,7 +657,8 @@ class Mixin(object):
                     density = 1.0,
                     color = (1.0, 1.0, 1.0),
                     space = None,
-                    collision_group = None):
+                    collision_group = None,
+                    static = False):
         """Send a sphere geometry to the simulator
 
         Parameters
@@ -383,6 +680,9 @@ class Mixin(object):
             The string name of the collision group in which to place the body.
             Collision groups specify how bodies collide. (default is to use
             the string set by :func:`set_current_collision_group()` function)
+        static          : bool (optional)
+            If True, the body never moves, see :func:`send_box()`.
+            (default False)
         Returns
         -------
         int
@@ -394,11 +694,11 @@ class Mixin(object):
         if space is None:
             space = self._current_space
 
-        return self._send_body('Sphere',
-                               position,
-                               orientation,
-                               radius,
-                               density,
-                               color,
-                               space,
-                               collision_group)
\ No newline at end of file
+        return self._send_static_or_body('Sphere', static,
+                                         position,
+                                         orientation,
+                                         radius,
+                                         density,
+                                         color,
+                                         space,
+                                         collision_group)
\ No newline at end of file
@@ -181,6 +181,8 @@ class Mixin(object):
 
         self._assert_body( body1 )
         self._assert_body( body2 )
+        self._assert_not_static( body1 )
+        self._assert_not_static( body2 )
 
         return self._send_joint( 'PointMassSpringJoint',
                                  body1, body2,
@@ -197,6 +199,8 @@ class Mixin(object):
 
         self._assert_body( body1 )
         self._assert_body( body2 )
+        self._assert_not_static( body1 )
+        self._assert_not_static( body2 )
 
         return self._send_joint( 'LinearSpringJoint',
                                  body1, body2,
@@ -215,6 +219,8 @@ class Mixin(object):
 
         self._assert_body( body1 )
         self._assert_body( body2 )
+        self._assert_not_static( body1 )
+        self._assert_not_static( body2 )
 
         return self._send_joint( 'HingeSpringJoint',
                                  body1, body2,
@@ -234,6 +240,8 @@ class Mixin(object):
         # assert stiffness > 0, ( 'stiffness must be > 0' )
         self._assert_body( body1 )
         self._assert_body( body2 )
+        self._assert_not_static( body1 )
+        self._assert_not_static( body2 )
 
         return self._send_joint( 'UniversalSpringJoint',
                                     body1, body2,
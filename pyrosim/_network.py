@@ -3,6 +3,12 @@ class Mixin(object):
     def _send_neuron(self, *args):
         return self._send_entity('Neuron', *args)
 
+    def _send_targetable_neuron(self, *args):
+        """Sends a neuron which has an alpha and tau"""
+        neuron_id = self._send_neuron(*args)
+        self._targetable_neurons_of(neuron_id).add(neuron_id)
+        return neuron_id
+
     def _send_synapse(self, *args):
         return self._send_entity('Synapse', *args)
 
@@ -76,7 +82,7 @@ class Mixin(object):
             The id tag of the neuron
         """
         self._assert_actuator(motor_id, 'motor_id')
-        return self._send_neuron('MotorNeuron', motor_id, alpha, tau, starting_value)
+        return self._send_targetable_neuron('MotorNeuron', motor_id, alpha, tau, starting_value)
 
     def send_user_neuron(self, input_values):
         """Send a user input neuron to the simulator.
@@ -101,5 +107,5 @@ class Mixin(object):
     def send_hidden_neuron(self, alpha=1.0, tau=1.0,
                            starting_value=0.0):
         """Send a hidden neuron to the simulator"""
-        return self._send_neuron('HiddenNeuron',
-                                 alpha, tau, starting_value)
\ No newline at end of file
+        return self._send_targetable_neuron('HiddenNeuron',
+                                            alpha, tau, starting_value)
\ No newline at end of file
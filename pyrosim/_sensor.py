@@ -3,7 +3,70 @@ class Mixin(object):
     def _send_sensor(self, *args):
         return self._send_entity('Sensor', *args)
 
-    def send_distance_to_sensor( self, body1_id, body2_id, write_back = True ):
+    def _get_record_every(self, record_every):
+        """Resolves the time steps between recorded values of a sensor"""
+        if record_every is None:
+            record_every = self._record_every
+        assert record_every >= 1, ('record_every must be at least 1')
+        return int(record_every)
+
+    def send_sensor_reducer(self, sensor_id, op = 'final'):
+        """Reduce the values of a sensor to a single number in the simulator
+
+        The reducer is updated every time step, independent of the
+        sensor's record_every. Read it back with
+        :func:`get_reduced_sensor_data()`. Sensors only needed for their
+        reduced value can be sent with write_back=False.
+
+        Parameters
+        ----------
+        sensor_id : int
+            The id tag of the sensor to reduce
+        op        : str (optional)
+            'final', 'mean', 'max', 'min' or 'integral' (the sum of the
+            values times dt). (default is 'final')
+        """
+        self._assert_sensor(sensor_id, 'sensor_id')
+        assert op in self._reducer_ops, (
+            'op must be one of ' + str(list(self._reducer_ops)))
+
+        self._send_add_command(sensor_id,
+                               'Reducer',
+                               self._reducer_ops[op])
+
+    def add_stop_condition(self, sensor_id, op, threshold, after_step = 0):
+        """End the simulation early when a sensor value crosses a threshold
+
+        Conditions are checked in the simulator every time step against
+        the values sensed at that step. By default the simulation ends
+        when any condition is met, see :func:`set_stop_mode()`. The
+        number of steps simulated is available as `steps_run` after
+        :func:`wait_to_finish()`.
+
+        Parameters
+        ----------
+        sensor_id  : int
+            The id tag of the sensor to check
+        op         : str
+            How the sensor value is compared to the threshold,
+            '<', '<=', '>' or '>='
+        threshold  : float
+            The value to compare against
+        after_step : int (optional)
+            The first time step the condition is checked at. (default 0)
+        """
+        self._assert_sensor(sensor_id, 'sensor_id')
+        assert op in self._stop_condition_ops, (
+            'op must be one of ' + str(list(self._stop_condition_ops)))
+        assert after_step >= 0, ('after_step must be >= 0')
+
+        self._send_add_command(sensor_id,
+                               'StopCondition',
+                               self._stop_condition_ops[op],
+                               threshold,
+                               int(after_step))
+
+    def send_distance_to_sensor( self, body1_id, body2_id, write_back = True, record_every = None ):
         """Send a distance sensor which measures the distance between body1 and body2
 
 
@@ -14,10 +77,10 @@ class Mixin(object):
         self._assert_body( body1_id, 'body1_id' )
         self._assert_body( body2_id, 'body2_id' )
 
-        return self._send_sensor( 'DistanceToSensor', body1_id, body2_id, int( write_back ))
+        return self._send_sensor( 'DistanceToSensor', body1_id, body2_id, int( write_back ), self._get_record_every(record_every))
 
     # ------- LIGHT SENSOR ---------------------
-    def send_light_sensor( self, body_id, write_back = True ):
+    def send_light_sensor( self, body_id, write_back = True, record_every = None ):
         """Send a light sensor embedded within a body
 
         Parameters
@@ -26,6 +89,9 @@ class Mixin(object):
             The id tag of the specified body
         write_back  : bool
             If True, write back to python after simulation. (Default True)
+        record_every : int (optional)
+            Record a value every *record_every* time steps, at steps
+            0, k, 2k, ... (default is the simulator's record_every)
 
         Returns
         -------
@@ -33,10 +99,10 @@ class Mixin(object):
             The id tag of the sensor
         """
         self._assert_body( body_id, 'body_id' )
-        return self._send_sensor( 'LightSensor', body_id, int( write_back ) )
+        return self._send_sensor( 'LightSensor', body_id, int( write_back ), self._get_record_every(record_every) )
 
     # ------------ POSITION SENSOR -----------------------------
-    def send_position_sensor(self, body_id, which_dimension='x', write_back = True):
+    def send_position_sensor(self, body_id, which_dimension='x', write_back = True, record_every = None):
         """Send position sensor which tracks the body specified in body_id
 
         Parameters
@@ -48,6 +114,9 @@ class Mixin(object):
             You can also use 0, 1, or 2. (default is 'x')
         write_back  : bool
             If True, write back to python after simulation. (Default True)
+        record_every : int (optional)
+            Record a value every *record_every* time steps, at steps
+            0, k, 2k, ... (default is the simulator's record_every)
         Returns
         -------
         int
@@ -65,22 +134,22 @@ class Mixin(object):
         assert which_dimension >=0 and which_dimension <=2, ('Which dimension must be x, y, or z')
         self._assert_body(body_id, 'body_id')
 
-        return  self._send_sensor('PositionSensor', body_id, which_dimension, int( write_back ) )
+        return  self._send_sensor('PositionSensor', body_id, which_dimension, int( write_back ), self._get_record_every(record_every) )
 
-    def send_position_x_sensor(self, body_id, write_back = True ):
+    def send_position_x_sensor(self, body_id, write_back = True, record_every = None ):
         """Send x position sensor which tracks the body specified in *body_id*"""
-        return self.send_position_sensor(body_id, which_dimension='x', write_back = write_back)
+        return self.send_position_sensor(body_id, which_dimension='x', write_back = write_back, record_every = record_every)
 
-    def send_position_y_sensor(self, body_id, write_back = True ):
+    def send_position_y_sensor(self, body_id, write_back = True, record_every = None ):
         """Send y position sensor which tracks the body specified in *body_id*"""
-        return self.send_position_sensor(body_id, which_dimension='y', write_back = write_back)
+        return self.send_position_sensor(body_id, which_dimension='y', write_back = write_back, record_every = record_every)
 
-    def send_position_z_sensor(self, body_id, write_back = True):
+    def send_position_z_sensor(self, body_id, write_back = True, record_every = None):
         """Send z position sensor which tracks the body specified in *body_id*"""
-        return self.send_position_sensor(body_id, which_dimension='z', write_back = write_back)
+        return self.send_position_sensor(body_id, which_dimension='z', write_back = write_back, record_every = record_every)
 
     # ----------- RAY SENSOR ------------------------------------
-    def send_ray_sensor(self, ray_id, which_sense='d', write_back=True):
+    def send_ray_sensor(self, ray_id, which_sense='d', write_back=True, record_every = None):
         """
         Sends a ray sensor to the simulator.
 
@@ -96,6 +165,9 @@ class Mixin(object):
             Use 'd' for distance, 'r' for red, 'g' for green, 'b' for blue.
         write_back  : bool
             If True, write back to python after simulation. (Default True)
+        record_every : int (optional)
+            Record a value every *record_every* time steps, at steps
+            0, k, 2k, ... (default is the simulator's record_every)
         Returns
         -------
         int
@@ -112,26 +184,26 @@ class Mixin(object):
 
         assert which_sense >=0 and which_sense <=3, ('Which sense must be d, r, g, b or 0, 1, 2, 3')
         self._assert_body(ray_id, 'ray_id')
-        return self._send_sensor('RaySensor', ray_id, which_sense, int( write_back) )
+        return self._send_sensor('RaySensor', ray_id, which_sense, int( write_back), self._get_record_every(record_every) )
 
-    def send_ray_distance_sensor(self, ray_id, write_back = True ):
+    def send_ray_distance_sensor(self, ray_id, write_back = True, record_every = None ):
         """Send a distance sensor attached to the ray at *ray_id*"""
-        return self.send_ray_sensor(ray_id, which_sense='d', write_back = write_back)
+        return self.send_ray_sensor(ray_id, which_sense='d', write_back = write_back, record_every = record_every)
 
-    def send_ray_red_sensor(self, ray_id, write_back = True ):
+    def send_ray_red_sensor(self, ray_id, write_back = True, record_every = None ):
         """Send a red color sensor attached to the ray at *ray_id*"""
-        return self.send_ray_sensor(ray_id, which_sense='r', write_back = write_back)
+        return self.send_ray_sensor(ray_id, which_sense='r', write_back = write_back, record_every = record_every)
 
-    def send_ray_green_sensor(self, ray_id, write_back = True ):
+    def send_ray_green_sensor(self, ray_id, write_back = True, record_every = None ):
         """Send a green color sensor attached to the ray at *ray_id*"""
-        return self.send_ray_sensor(ray_id, which_sense='g', write_back = write_back)
+        return self.send_ray_sensor(ray_id, which_sense='g', write_back = write_back, record_every = record_every)
 
-    def send_ray_blue_sensor(self, ray_id, write_back = True ):
+    def send_ray_blue_sensor(self, ray_id, write_back = True, record_every = None ):
         """Send a blue color sensor attached to the ray at *ray_id*"""
-        return self.send_ray_sensor(ray_id, which_sense='b', write_back = write_back )
+        return self.send_ray_sensor(ray_id, which_sense='b', write_back = write_back, record_every = record_every )
 
     # --------------- TOUCH SENSOR -----------------------------------
-    def send_touch_sensor(self, body_id, write_back = True):
+    def send_touch_sensor(self, body_id, write_back = True, record_every = None):
         """Attach a touch sensor to a body
 
         Parameters
@@ -145,15 +217,18 @@ class Mixin(object):
             The id tag of the sensor
         write_back  : bool
             If True, write back to python after simulation. (Default True)
+        record_every : int (optional)
+            Record a value every *record_every* time steps, at steps
+            0, k, 2k, ... (default is the simulator's record_every)
         """
 
         self._assert_body(body_id)
 
-        return self._send_sensor('TouchSensor', body_id, int( write_back ) )
+        return self._send_sensor('TouchSensor', body_id, int( write_back ), self._get_record_every(record_every) )
 
 
     # ------------- QUATERNION SENSOR --------------------------------
-    def send_quaternion_sensor(self, body_id, which_sense='a', write_back = True):
+    def send_quaternion_sensor(self, body_id, which_sense='a', write_back = True, record_every = None):
         """Attach a vestibular sensor returning the quaternion of the body.
 
         Quaternions is 4 element vector which can represent the rotation of 
@@ -173,21 +248,21 @@ class Mixin(object):
         assert (which_sense >= 0 and which_sense <= 3)
         self._assert_body(body_id)
 
-        return self._send_sensor('QuaternionSensor', body_id, which_sense, int( write_back ))
+        return self._send_sensor('QuaternionSensor', body_id, which_sense, int( write_back ), self._get_record_every(record_every))
 
-    def send_quaternion_a_sensor(self, body_id, write_back = True ):
-        return self.send_quaternion_sensor(body_id, 'a', write_back )
+    def send_quaternion_a_sensor(self, body_id, write_back = True, record_every = None ):
+        return self.send_quaternion_sensor(body_id, 'a', write_back, record_every )
 
-    def send_quaternion_b_sensor(self, body_id, write_back = True):
-        return self.send_quaternion_sensor(body_id, 'b', write_back )
+    def send_quaternion_b_sensor(self, body_id, write_back = True, record_every = None):
+        return self.send_quaternion_sensor(body_id, 'b', write_back, record_every )
 
-    def send_quaternion_c_sensor(self, body_id, write_back = True):
-        return self.send_quaternion_sensor(body_id, 'c', write_back )
+    def send_quaternion_c_sensor(self, body_id, write_back = True, record_every = None):
+        return self.send_quaternion_sensor(body_id, 'c', write_back, record_every )
 
-    def send_quaternion_d_sensor(self, body_id, write_back = True):
-        return self.send_quaternion_sensor(body_id, 'd', write_back)
+    def send_quaternion_d_sensor(self, body_id, write_back = True, record_every = None):
+        return self.send_quaternion_sensor(body_id, 'd', write_back, record_every)
 
-    def send_proprioceptive_sensor(self, joint_id, write_back = True ):
+    def send_proprioceptive_sensor(self, joint_id, write_back = True, record_every = None ):
         """Attach a proprioceptive sensor to the joint.
 
         Proprioceptive sensors return the value of
@@ -205,6 +280,9 @@ class Mixin(object):
             The id tag of the joint to attach the sensor to
         write_back  : bool
             If True, write back to python after simulation. (Default True)
+        record_every : int (optional)
+            Record a value every *record_every* time steps, at steps
+            0, k, 2k, ... (default is the simulator's record_every)
         Returns
         -------
         int
@@ -213,10 +291,10 @@ class Mixin(object):
 
         self._assert_joint(joint_id)
 
-        return self._send_sensor('ProprioceptiveSensor', joint_id, int( write_back ) )
+        return self._send_sensor('ProprioceptiveSensor', joint_id, int( write_back ), self._get_record_every(record_every) )
 
     # ----- IS SEEN SENSOR ----------------------------------
-    def send_is_seen_sensor( self, body_id, write_back = True ):
+    def send_is_seen_sensor( self, body_id, write_back = True, record_every = None ):
         """Attach a sensor to a body which reports a 1 when 'seen' by
         a ray sensor and a 0 when not 'seen' 
         
@@ -226,6 +304,9 @@ class Mixin(object):
             The id tag of the body to attach sensor to
         write_back : bool
             If True, write back to python after simulation. (Default True)
+        record_every : int (optional)
+            Record a value every *record_every* time steps, at steps
+            0, k, 2k, ... (default is the simulator's record_every)
 
         Returns
         -------
@@ -235,4 +316,4 @@ class Mixin(object):
 
         self._assert_body( body_id )
 
-        return self._send_sensor( 'IsSeenSensor', body_id, int( write_back ) )
+        return self._send_sensor( 'IsSeenSensor', body_id, int( write_back ), self._get_record_every(record_every) )
@@ -0,0 +1,164 @@
+# specialized class designed to be Mixin to pyrosim.py
+# Contains the functions to send a group of entities once
+# as a template and place copies of it in the scene
+import contextlib
+import re
+
+# id tags of entities are sent on lines of their own, as markers in templates
+_MARKER = re.compile(br'^@(\d+)$', re.M)
+
+
+class TemplateID(int):
+    """Id tag of an entity in a template
+
+    Sent as a marker '@id' which the simulator replaces with the
+    id tag of the entity in each instance of the template.
+    """
+    def __str__(self):
+        return '@' + int.__str__(self)
+
+
+class Template(object):
+    """A group of entities sent once and instantiated many times
+
+    Returned by define_template. Entities sent while the template
+    is defined get TemplateID id tags, local to the template.
+    """
+    def __init__(self, index):
+        self.index = index
+        self.entities = []
+        self.static_bodies = set()
+        self.targetable_neurons = set()
+        self.commands = []
+
+    @property
+    def num_entities(self):
+        return len(self.entities)
+
+
+class Mixin(object):
+
+    @contextlib.contextmanager
+    def define_template(self):
+        """Defines a template of entities sent once to the simulator
+
+        Bodies, joints, actuators, sensors and neurons sent inside the
+        with block make up the template instead of being added to the
+        scene. Their id tags are local to the template and can only be
+        used inside the block. Positions and directions are given as
+        if the template was placed at the origin, entities outside the
+        template can be referenced by their id tags.
+
+        Yields
+        ------
+        Template
+            The template, to pass to instantiate
+
+        Example
+        -------
+        >>> with sim.define_template() as robot:
+        ...     body = sim.send_box(position=(0, 0, 0.5))
+        ...     sensor = sim.send_position_z_sensor(body)
+        >>> sensor_ids = [sim.instantiate(robot, position=(x, 0, 0))[sensor]
+        ...               for x in range(10)]
+        """
+        assert self._template is None, ('Templates can not be nested')
+
+        template = Template(len(self._templates))
+        commands = self._commands_to_send
+        self._template = template
+        self._commands_to_send = template.commands
+        try:
+            yield template
+        finally:
+            self._commands_to_send = commands
+            self._template = None
+
+        # find the markers of the entities in the text of the commands,
+        # binary data is left alone
+        offsets, marker_ids, chunks = [], [], []
+        size = 0
+        for chunk in self._join_commands(template.commands):
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+                for match in _MARKER.finditer(chunk):
+                    offsets.append(size + match.start())
+                    marker_ids.append(int(match.group(1)))
+            chunks.append(chunk)
+            size += len(chunk)
+        assert all(marker_id < template.num_entities
+                   for marker_id in marker_ids), (
+            'Template uses id tags of another template')
+
+        self._templates.append(template)
+        self._send('Template',
+                   template.num_entities,
+                   len(offsets),
+                   offsets,
+                   marker_ids,
+                   size,
+                   b''.join(chunks))
+
+    def instantiate(self, template, position=(0, 0, 0), orientation=(0, 0, 1),
+                    heading=0.0, weight_overrides=None):
+        """Adds a copy of a template to the scene
+
+        Parameters
+        ----------
+        template         : Template
+            A template returned by define_template
+        position         : triple float (optional)
+            Position the origin of the template is moved to
+            (default is (0, 0, 0))
+        orientation      : triple float (optional)
+            Direction the z axis of the template points to
+            (default is (0, 0, 1))
+        heading          : float (optional)
+            Rotation in radians about the z axis of the template,
+            applied before the orientation (default is 0.0)
+        weight_overrides : dict (optional)
+            Weights of synapses of this copy, by their id tags in
+            the template. Other synapses keep the weight they were
+            sent with (default is None)
+
+        Returns
+        -------
+        dict
+            The id tag in the scene of each id tag in the template
+        """
+        assert self._template is None, ('Templates can not be instantiated '
+                                        'while a template is defined')
+        assert (template.index < len(self._templates) and
+                template is self._templates[template.index]), (
+            'Template was defined by another simulator')
+        assert len(position) == 3, ('Position must have 3 dimensions')
+        assert len(orientation) == 3, ('Orientation must have 3 dimensions')
+
+        if weight_overrides is None:
+            weight_overrides = {}
+        synapse_ids = list(weight_overrides.keys())
+        for synapse_id in synapse_ids:
+            assert template.entities[synapse_id] == 'Synapse', (
+                'Weight override id tag ' + str(synapse_id) +
+                ' does not correspond to synapse')
+        weights = [float(weight_overrides[synapse_id])
+                   for synapse_id in synapse_ids]
+
+        base = self._num_entities
+        self._send('Instance',
+                   template.index,
+                   position,
+                   orientation,
+                   heading,
+                   len(synapse_ids),
+                   [int(synapse_id) for synapse_id in synapse_ids],
+                   weights)
+
+        self._entities.extend(template.entities)
+        self._num_entities += template.num_entities
+        self._static_bodies.update(base + body_id
+                                   for body_id in template.static_bodies)
+        self._targetable_neurons.update(base + neuron_id for neuron_id
+                                        in template.targetable_neurons)
+        return dict((local_id, base + local_id)
+                    for local_id in range(template.num_entities))
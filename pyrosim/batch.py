@@ -0,0 +1,152 @@
+from __future__ import division, print_function
+import multiprocessing
+import os
+import threading
+
+try:
+    import queue
+except ImportError: # python 2.x
+    import Queue as queue
+
+
+class BatchRunner(object):
+    """Runs many simulations in parallel with a bounded number of processes
+
+    Each job is either a fully built :class:`Simulator` or a callable which
+    takes no arguments and returns one. Callables are only called when a
+    worker is free, so scenes do not all have to be held in memory at once.
+    Every simulation is started blind or not exactly as configured, its
+    output is drained by :func:`Simulator.wait_to_finish()` and it is
+    killed if it runs longer than `timeout` seconds.
+
+    Attributes
+    ----------
+    num_workers : int (optional)
+        The maximum number of simulator processes running at once.
+        (default is the number of cores this process may run on)
+    timeout     : float (optional)
+        Wall clock seconds after which a simulation is killed. Killed
+        simulations are returned with `timed_out` set to True and no
+        sensor data. (default is no timeout)
+    pin_cores   : bool (optional)
+        If True, pin each worker's simulator processes to a single core.
+        Only available on Linux. (default False)
+
+    Example
+    -------
+    ::
+
+        def build(weights):
+            sim = pyrosim.Simulator(eval_steps=500, play_blind=True)
+            ...
+            return sim
+
+        runner = pyrosim.BatchRunner(timeout=60)
+        sims = runner.run([lambda w=w: build(w) for w in population])
+    """
+
+    def __init__(self, num_workers=None, timeout=None, pin_cores=False):
+        if num_workers is None:
+            num_workers = self._count_cores()
+        assert num_workers > 0, ('num_workers must be positive')
+        assert not pin_cores or hasattr(os, 'sched_setaffinity'), (
+            'pin_cores is not supported on this platform')
+
+        self.num_workers = num_workers
+        self.timeout = timeout
+        self.pin_cores = pin_cores
+
+    def run(self, jobs):
+        """Run all jobs and return the simulators in submission order
+
+        Parameters
+        ----------
+        jobs : list
+            Simulators or callables returning simulators
+
+        Returns
+        -------
+        list of Simulator
+            The finished simulators, in the same order as *jobs*
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+        for index, simulator in self.as_completed(jobs):
+            results[index] = simulator
+        return results
+
+    def as_completed(self, jobs):
+        """Run all jobs and yield simulators as they finish
+
+        Parameters
+        ----------
+        jobs : list
+            Simulators or callables returning simulators
+
+        Yields
+        ------
+        (int, Simulator)
+            The index of the job in *jobs* and its finished simulator
+        """
+        jobs = list(jobs)
+        pending = queue.Queue()
+        finished = queue.Queue()
+        stop = threading.Event()
+
+        for index, job in enumerate(jobs):
+            pending.put((index, job))
+
+        cores = self._get_cores()
+        workers = []
+        for slot in range(min(self.num_workers, len(jobs))):
+            core = cores[slot % len(cores)] if cores else None
+            worker = threading.Thread(target=self._work,
+                                      args=(pending, finished, stop, core))
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        try:
+            for _ in range(len(jobs)):
+                index, simulator, error = finished.get()
+                if error is not None:
+                    raise error
+                yield index, simulator
+        finally:
+            # abandon jobs which have not started yet
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+    @staticmethod
+    def _count_cores():
+        # cores allowed by taskset or a cpuset, where they can be known
+        if hasattr(os, 'sched_getaffinity'):
+            return len(os.sched_getaffinity(0))
+        return multiprocessing.cpu_count()
+
+    def _get_cores(self):
+        if not self.pin_cores:
+            return None
+        return sorted(os.sched_getaffinity(0))
+
+    def _work(self, pending, finished, stop, core):
+        while not stop.is_set():
+            try:
+                index, job = pending.get_nowait()
+            except queue.Empty:
+                return
+
+            try:
+                simulator = job() if callable(job) else job
+                simulator.start()
+                if core is not None:
+                    try:
+                        os.sched_setaffinity(simulator.pipe.pid, [core])
+                    except OSError: # already exited
+                        pass
+                simulator.wait_to_finish(timeout=self.timeout)
+            except Exception as error:
+                finished.put((index, None, error))
+            else:
+                finished.put((index, simulator, None))
@@ -0,0 +1,111 @@
+from __future__ import division, print_function
+import copy
+import numpy as np
+
+
+class CompiledScene(object):
+    """A built scene evaluated again with other synapse weights
+
+    Returned by :func:`Simulator.compile()`. The scene is encoded once
+    and followed by blocks of packed float32 values which replace the
+    weights of all synapses and the alpha and tau of all neurons. Each
+    call to :func:`evaluate()` only writes new values into these blocks,
+    so evaluating a genome does not send or encode the scene again.
+
+    The weights are aligned with `synapse_ids` and the alphas and taus
+    with `neuron_ids`. A nan value keeps the value the entity was sent
+    with.
+
+    Attributes
+    ----------
+    synapse_ids : 1D numpy array of int
+        The id tags of the synapses, in the order they were sent
+    neuron_ids  : 1D numpy array of int
+        The id tags of the hidden and motor neurons, in the order they
+        were sent
+
+    Example
+    -------
+    ::
+
+        sim = pyrosim.Simulator(eval_steps=500, play_blind=True)
+        build_robot(sim)
+        scene = sim.compile()
+        with pyrosim.SimulatorSession() as session:
+            for genome in population:
+                evaluation = session.run(scene.evaluate(genome))
+                fitness = evaluation.get_sensor_data(position_sensor)[-1]
+    """
+
+    def __init__(self, simulator):
+        assert simulator._template is None, (
+            'Scenes can not be compiled while a template is defined')
+        assert simulator._scene_bytes is None, ('Scene is already compiled')
+
+        self._simulator = simulator
+        self.synapse_ids = np.array([entity_id for entity_id, entity_type
+                                     in enumerate(simulator._entities)
+                                     if entity_type == 'Synapse'], dtype=int)
+        self.neuron_ids = np.array(sorted(simulator._targetable_neurons),
+                                   dtype=int)
+
+        simulator._send_simulator_parameters()
+        scene = bytearray(simulator._encode_commands(
+            simulator._commands_to_send))
+
+        # the values of each block are views into the scene
+        self._values = []
+        for name, ids in [('Weight', self.synapse_ids),
+                          ('Alpha', self.neuron_ids),
+                          ('Tau', self.neuron_ids)]:
+            scene += ('Override\n' + name + '\n' + str(len(ids)) + '\n' +
+                      ''.join(str(entity_id) + '\n' for entity_id in ids)
+                      ).encode()
+            self._values.append((len(scene), len(ids)))
+            scene += np.full(len(ids), np.nan, dtype='<f4').tobytes() + b'\n'
+        scene += b'Done\n'
+
+        self._scene = scene
+        self._values = [np.frombuffer(scene, dtype='<f4', count=count,
+                                      offset=offset)
+                        for offset, count in self._values]
+
+        # the simulator itself runs with the values it was built with
+        simulator._scene_bytes = bytes(scene)
+
+    def evaluate(self, weights=None, alphas=None, taus=None):
+        """Returns a simulator running the scene with other values
+
+        The returned simulator is run like any other, by
+        :func:`Simulator.start()`, a :class:`SimulatorSession` or a
+        :class:`BatchRunner`. It must not be changed by sending entities.
+
+        Parameters
+        ----------
+        weights : 1D array of float (optional)
+            The weight of each synapse in `synapse_ids`
+            (default keeps the weights sent)
+        alphas  : 1D array of float (optional)
+            The alpha of each neuron in `neuron_ids`
+            (default keeps the alphas sent)
+        taus    : 1D array of float (optional)
+            The tau of each neuron in `neuron_ids`
+            (default keeps the taus sent)
+
+        Returns
+        -------
+        Simulator
+            A simulator which has not been started
+        """
+        for block, values in zip(self._values, [weights, alphas, taus]):
+            if values is None:
+                block[:] = np.nan
+            else:
+                assert np.shape(values) == block.shape, (
+                    'Expected ' + str(len(block)) + ' values, got ' +
+                    str(np.shape(values)))
+                block[:] = values
+
+        evaluation = copy.copy(self._simulator)
+        evaluation._scene_bytes = bytes(self._scene)
+        return evaluation
@@ -0,0 +1,127 @@
+from __future__ import division, print_function
+import atexit
+import hashlib
+import os
+import shutil
+import struct
+import tempfile
+
+import numpy as np
+
+# A mesh file starts with a header of the magic bytes, the number of
+# vertices and the number of triangles as little endian int64. The
+# vertices follow as little endian float64 x, y, z and then the
+# triangles as little endian uint32 indices of their three vertices.
+# Both are in row order, the simulator memory maps them as they are.
+MAGIC = b'PYROMESH'
+HEADER = struct.Struct('<8sqq')
+
+# content hashes of mesh files by path, size and modification time
+_file_hashes = {}
+
+# mesh files written for meshes sent as arrays, by content hash, in a
+# temporary directory of this process
+_mesh_files = {}
+_mesh_directory = None
+
+
+def as_mesh_arrays(vertices, indices):
+    """Returns the vertices and indices in the layout of the simulator
+
+    Parameters
+    ----------
+    vertices : 2D numpy array
+        Vertex coordinates, one row of x, y, z per vertex
+    indices  : 2D numpy array
+        Vertex indices, one row of three per triangle. Triangles are
+        wound counter clockwise seen from outside.
+
+    Returns
+    -------
+    tuple of numpy arrays
+        Contiguous little endian float64 vertices and uint32 indices
+    """
+    vertices = np.ascontiguousarray(vertices, dtype='<f8')
+    indices = np.asarray(indices)
+    assert vertices.ndim == 2 and vertices.shape[1] == 3, (
+        'vertices must have shape (num_vertices, 3)')
+    assert indices.ndim == 2 and indices.shape[1] == 3, (
+        'indices must have shape (num_triangles, 3)')
+    assert len(vertices) > 0 and len(indices) > 0, (
+        'mesh must have at least one triangle')
+    assert indices.min() >= 0 and indices.max() < len(vertices), (
+        'indices must be in range of the vertices')
+    return vertices, np.ascontiguousarray(indices, dtype='<u4')
+
+
+def mesh_hash(vertices, indices):
+    """Returns the content hash of a mesh as written to a mesh file"""
+    content = hashlib.sha1(HEADER.pack(MAGIC, len(vertices), len(indices)))
+    content.update(vertices.data)
+    content.update(indices.data)
+    return content.hexdigest()
+
+
+def save_mesh(file_name, vertices, indices):
+    """Writes a triangle mesh to a file for :func:`send_trimesh_file()`
+
+    Parameters
+    ----------
+    file_name : str
+        Path of the file
+    vertices  : 2D numpy array
+        Vertex coordinates, one row of x, y, z per vertex
+    indices   : 2D numpy array
+        Vertex indices, one row of three per triangle
+    """
+    vertices, indices = as_mesh_arrays(vertices, indices)
+    with open(file_name, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(vertices), len(indices)))
+        f.write(vertices.tobytes())
+        f.write(indices.tobytes())
+
+
+def read_mesh_header(file_name):
+    """Returns the number of vertices and triangles and the content hash
+    of a mesh file
+
+    The hash of a file is only computed again when its size or
+    modification time changes.
+    """
+    file_stat = os.stat(file_name)
+    with open(file_name, 'rb') as f:
+        magic, num_vertices, num_triangles = HEADER.unpack(
+            f.read(HEADER.size))
+        assert magic == MAGIC, (file_name + ' is not a mesh file')
+        assert file_stat.st_size == (HEADER.size + 24 * num_vertices +
+                                     12 * num_triangles), (
+            file_name + ' is truncated')
+
+        key = (file_name, file_stat.st_size, file_stat.st_mtime)
+        if key not in _file_hashes:
+            content = hashlib.sha1()
+            f.seek(0)
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                content.update(chunk)
+            _file_hashes[key] = content.hexdigest()
+
+    return num_vertices, num_triangles, _file_hashes[key]
+
+
+def mesh_file_of(vertices, indices):
+    """Returns the path of a mesh file holding the mesh and its hash
+
+    The file is written once per process, to a temporary directory
+    removed when the process exits, so the simulator memory maps the
+    mesh rather than reading it through the pipe with every scene.
+    """
+    global _mesh_directory
+    content_hash = mesh_hash(vertices, indices)
+    if content_hash not in _mesh_files:
+        if _mesh_directory is None:
+            _mesh_directory = tempfile.mkdtemp(prefix='pyrosim_meshes_')
+            atexit.register(shutil.rmtree, _mesh_directory, True)
+        file_name = os.path.join(_mesh_directory, content_hash + '.mesh')
+        save_mesh(file_name, vertices, indices)
+        _mesh_files[content_hash] = file_name
+    return _mesh_files[content_hash], content_hash
@@ -2,7 +2,7 @@ from __future__ import division, print_function
 import numpy as np
 import os
 import subprocess
-import copy
+import threading
 
 # C.C NOTE: Mixin convention -
 # mixin files should be named _name.py and
@@ -20,6 +20,9 @@ if __package__ is None or __package__ == '':
     import _actuator
     import _network
     import _sensor
+    import _template
+    from sensor_data import SensorData
+    from compiled_scene import CompiledScene
 else:
     # uses current package visibility
     from . import _body
@@ -27,13 +30,17 @@ else:
     from . import _actuator
     from . import _network
     from . import _sensor
+    from . import _template
+    from .sensor_data import SensorData
+    from .compiled_scene import CompiledScene
 
 
 class Simulator(_body.Mixin,
                 _joint.Mixin,
                 _actuator.Mixin,
                 _network.Mixin,
-                _sensor.Mixin):
+                _sensor.Mixin,
+                _template.Mixin):
     """Python Interface for ODE robotics simulator
 
     Attributes
@@ -49,8 +56,97 @@ class Simulator(_body.Mixin,
     draw_joints    : bool ( optional )
         Starts simulation with joints drawn on screen. This can be toggled
         while the simulation is running by pressing 'd'. (default False)
+    sensor_format  : str (optional)
+        How sensor data is written back from the simulator. 'text' sends
+        space delimited values, 'float32' sends packed little-endian
+        binary columns which are much faster to read for long
+        simulations. The simulator computes sensor values in single
+        precision, so there is no float64 format, it would only double
+        the data sent. (default 'text')
+    log_level      : str (optional)
+        Verbosity of the simulator's debug output. 'quiet' only reports
+        errors, 'info' reports entity creation and progress, 'debug' also
+        echoes every value read from python and per step sensor messages.
+        Lower levels make large scenes noticeably faster to send.
+        (default 'info')
+    record_every   : int (optional)
+        Default number of time steps between the values recorded by
+        sensors, which record at steps 0, k, 2k, ... Larger values cut
+        the memory and write back of long simulations. Can be set per
+        sensor with the record_every argument of the send_*_sensor
+        methods. (default 1)
+    physics_substeps : int (optional)
+        Number of collision and world steps of dt / physics_substeps
+        taken by the physics engine each time step. Sensors, the network
+        and recording still run once per time step, so contacts stay
+        stable with a smaller physics step without multiplying the
+        controller and write back cost. Actuators and springs apply their
+        forces on every substep, impulses only on the first. (default 1)
+    collision_space : str (optional)
+        Broadphase collision space finding the pairs of geoms which may
+        touch. 'hash' uses a multi resolution hash grid, 'sap' sweep and
+        prune along the x axis and 'quadtree' a quadtree over the x and y
+        bounds of the scene, often the fastest for large flat arenas with
+        many bodies. The spaces are fit to the bodies once they are
+        created, hash levels to the sizes of the bodies. Named spaces
+        use the same type unless set by :func:`set_current_space()`.
+        (default 'hash')
+    solver         : str (optional)
+        'exact' steps the world with ODE's big matrix solver, whose cost
+        grows with the cube of the number of constraints. 'quick' uses
+        ODE's iterative quickstep solver, which scales linearly and is
+        much faster for scenes with many bodies and contacts, at some
+        loss of accuracy. (default 'exact')
+    quick_iterations : int (optional)
+        Number of iterations of the quick solver. (default 20)
+    sor_w          : float (optional)
+        Over relaxation parameter of the quick solver, None keeps ODE's
+        default of 1.3. (default None)
+    erp            : float (optional)
+        Global error reduction parameter in [0, 1], the fraction of joint
+        and contact errors fixed each step. None keeps ODE's default of
+        0.2. (default None)
+    cfm            : float (optional)
+        Global constraint force mixing, larger values make joints and
+        contacts softer. None keeps ODE's default. (default None)
+    contact_surface_layer : float (optional)
+        Depth bodies may sink into each other before contacts push them
+        apart, a small value stops contacts jittering. None keeps ODE's
+        default of 0. (default None)
     """
 
+    # maps sensor_format to the value sent to the simulator
+    # and the numpy dtype of the returned binary columns
+    _sensor_formats = {'text'    : (0, None),
+                       'float32' : (1, '<f4')}
+
+    # maps collision_space to the simulator's space types
+    _collision_spaces = {'hash'     : 0,
+                         'sap'      : 1,
+                         'quadtree' : 2}
+
+    # maps solver to the simulator's solver codes
+    _solvers = {'exact' : 0,
+                'quick' : 1}
+
+    # maps the ops of send_sensor_reducer to the simulator's op codes
+    _reducer_ops = {'final'    : 0,
+                    'mean'     : 1,
+                    'max'      : 2,
+                    'min'      : 3,
+                    'integral' : 4}
+
+    # maps the comparisons of add_stop_condition to the simulator's op codes
+    _stop_condition_ops = {'<'  : 0,
+                           '<=' : 1,
+                           '>'  : 2,
+                           '>=' : 3}
+
+    # maps log_level to the simulator's -loglevel argument
+    _log_levels = {'quiet' : 0,
+                   'info'  : 1,
+                   'debug' : 2}
+
     def __init__(self,
                  eval_steps = 100,
                  dt = 0.01,
@@ -60,6 +156,17 @@ class Simulator(_body.Mixin,
                  draw_joints = False,
                  use_textures = True,
                  draw_shadows = True,
+                 sensor_format = 'text',
+                 log_level = 'info',
+                 record_every = 1,
+                 physics_substeps = 1,
+                 collision_space = 'hash',
+                 solver = 'exact',
+                 quick_iterations = 20,
+                 sor_w = None,
+                 erp = None,
+                 cfm = None,
+                 contact_surface_layer = None,
                  ):
 
         # location of this file
@@ -72,9 +179,20 @@ class Simulator(_body.Mixin,
         self._num_actuators = 0
 
         self._entities = []
-
-        # commands to be sent
-        self._strings_to_send = ''
+        # ids of bodies sent with static=True
+        self._static_bodies = set()
+        # ids of hidden and motor neurons, which have an alpha and tau
+        self._targetable_neurons = set()
+        # templates sent so far and the template being defined
+        self._templates = []
+        self._template = None
+        # encoded scene once compiled, see compile()
+        self._scene_bytes = None
+
+        # commands to be sent, joined once when the scene is sent
+        # since repeatedly appending to one string is quadratic.
+        # Entries are strings or bytes of raw binary data
+        self._commands_to_send = []
 
         # playback parameters
         self._play_blind = play_blind
@@ -87,14 +205,56 @@ class Simulator(_body.Mixin,
         # sim parameters
         self._eval_steps = eval_steps
         self._dt = dt
+        assert physics_substeps >= 1, ('physics_substeps must be at least 1')
+        self._physics_substeps = int(physics_substeps)
+
+        assert collision_space in self._collision_spaces, (
+            'collision_space must be one of ' +
+            str(list(self._collision_spaces)))
+        self._collision_space = collision_space
+
+        # solver parameters, None keeps the default of ODE
+        assert solver in self._solvers, (
+            'solver must be one of ' + str(list(self._solvers)))
+        self._solver = solver
+        assert quick_iterations >= 1, ('quick_iterations must be at least 1')
+        self._quick_iterations = int(quick_iterations)
+        assert erp is None or 0.0 <= erp <= 1.0, ('erp must be in [0, 1]')
+        assert cfm is None or cfm >= 0.0, ('cfm must be non-negative')
+        assert contact_surface_layer is None or contact_surface_layer >= 0.0, (
+            'contact_surface_layer must be non-negative')
+        self._solver_parameters = [('SORW', sor_w),
+                                   ('ERP', erp),
+                                   ('CFM', cfm),
+                                   ('ContactSurfaceLayer',
+                                    contact_surface_layer)]
 
         # draw parameters
         self._draw_joints = draw_joints
         self._use_textures = use_textures
         self._draw_shadows = draw_shadows
 
+        # write back parameters
+        assert sensor_format in self._sensor_formats, (
+            'sensor_format must be one of ' + str(list(self._sensor_formats)))
+        self._sensor_format = sensor_format
+
+        assert log_level in self._log_levels, (
+            'log_level must be one of ' + str(list(self._log_levels)))
+        self._log_level = log_level
+
+        assert record_every >= 1, ('record_every must be at least 1')
+        self._record_every = int(record_every)
+
         self._raw_cerr = ''
-        self._sensor_data = {}
+        self._sensor_data = SensorData(np.zeros((0, 0)), [])
+        self._reduced_sensor_data = {}
+
+        # set when wait_to_finish kills the simulation
+        self.timed_out = False
+        # number of steps simulated, fewer than eval_steps
+        # when the simulation was ended by a stop condition
+        self.steps_run = None
 
     def assign_collision(self, group1, group2):
         """Specifies that members of *group1* and *group2* should collide in simulation
@@ -115,51 +275,110 @@ class Simulator(_body.Mixin,
         self._send('AssignCollision', group1, group2)
         return True
 
+    def compile(self):
+        """Freezes the scene to evaluate it with other synapse weights
+
+        The scene is encoded once. Nothing can be sent to the simulator
+        afterwards, it runs with the values its entities were sent with.
+
+        Returns
+        -------
+        CompiledScene
+            The scene, which creates a simulator for each set of weights
+        """
+        return CompiledScene(self)
+
     def get_all_sensor_data( self ):
         """Outputs all sensor data created by the simulation
 
         Returns
         -------
-        dict
-            The sensor dictionary. The keys are is the id of the
-            sensor and the value a list containing the sensory 
-            information at each time step.
+        SensorData
+            The sensor data. Behaves like a dictionary whose keys are
+            the ids of the sensors and whose values are read-only numpy
+            arrays containing the sensory information at each time step.
+            All values are stored in the contiguous
+            (num_sensors, time_steps) array `SensorData.array`.
         """
-        return copy.copy( self._sensor_data )
+        return self._sensor_data
 
     def get_debug_output(self):
-        """Returns the debug output from the simulation"""
+        """Returns the debug output from the simulation
+
+        The simulator only echoes the values it reads when the simulator
+        was created with log_level='debug'."""
         return self._strings_to_send + '\n' + self._raw_cerr
 
     def get_sensor_data(self, sensor_id = None):
         """Returns the sensor data of the specified sensor at each
-        time step"""
+        time step
+
+        The returned array is a read-only view into the simulation
+        results. Use `numpy.array` on it to obtain a writable copy.
+        If *sensor_id* is None all of the sensor data is returned as
+        a :class:`SensorData` object."""
         
         if sensor_id is None:
-            return copy.copy( self._sensor_data )
+            return self._sensor_data
         else:
             self._assert_sensor(sensor_id, 'sensor_id')
-            data_to_return = None
-            try:
-                data_to_return = copy.copy( self._sensor_data[sensor_id][:] )
-            except:
+            if sensor_id not in self._sensor_data:
+                # sensor was not written back
                 return None
-                # print( 'Invalid sensor_id' )
-                # print( 'All Data' )
-                # print( self._sensor_data )
-                # print( 'raw output' )
-                # print( self._raw_cerr )
 
-            assert( data_to_return is not None )
+            return self._sensor_data[sensor_id]
+
+    def get_reduced_sensor_data(self, sensor_id = None, op = 'final'):
+        """Returns the value a sensor was reduced to by a reducer sent
+        with :func:`send_sensor_reducer()`
+
+        Parameters
+        ----------
+        sensor_id : int (optional)
+            The id tag of the reduced sensor. If None a dictionary from
+            (sensor_id, op) to the value of every reducer is returned.
+        op        : str (optional)
+            The op of the reducer. (default is 'final')
 
-            return data_to_return
+        Returns
+        -------
+        float
+            The reduced value or None if the sensor has no such reducer
+        """
+        if sensor_id is None:
+            return dict(self._reduced_sensor_data)
+
+        self._assert_sensor(sensor_id, 'sensor_id')
+        return self._reduced_sensor_data.get((sensor_id, op))
     
     def set_current_collision_group(self, group_name):
         """Set the current group name for future bodies to use as default"""
         self._current_collision_group = group_name
 
-    def set_current_space(self, space_name):
-        """Set the current space name for future bodies to use as default"""
+    def set_current_space(self, space_name, collision_space=None):
+        """Set the current space name for future bodies to use as default
+
+        Bodies in a named space are only tested against each other once
+        the bounding box of the whole space overlaps something.
+
+        Parameters
+        ----------
+        space_name      : str
+            The name of the space
+        collision_space : str (optional)
+            The type of broadphase collision space of the named space,
+            one of 'hash', 'sap' or 'quadtree'. (default is the
+            collision_space of the simulator)
+        """
+        if collision_space is not None:
+            assert collision_space in self._collision_spaces, (
+                'collision_space must be one of ' +
+                str(list(self._collision_spaces)))
+            assert space_name not in ['None', 'default'], (
+                'The type of the top space is set by the collision_space '
+                'argument of Simulator')
+            self._send('SpaceType', space_name,
+                       self._collision_spaces[collision_space])
 
         self._current_space = space_name
 
@@ -257,6 +476,31 @@ class Simulator(_body.Mixin,
 
         self._send_parameter('NetworkUpdate', steps_between_evals )
 
+    def set_stop_mode(self, mode = 'any'):
+        """Sets whether any or all stop conditions have to be met at
+        the same time step to end the simulation early
+
+        Parameters
+        ----------
+        mode : str (optional)
+            'any' or 'all'. (default is 'any')
+        """
+        assert mode in ['any', 'all'], ("mode must be 'any' or 'all'")
+        self._send_parameter('StopWhenAll', int(mode == 'all'))
+
+    @staticmethod
+    def _get_executable(simulator_path, play_blind):
+        """Returns the simulator executable to run
+
+        Blind simulations run the headless simulator, which does not
+        load OpenGL and GLUT, if it has been built.
+        """
+        if play_blind:
+            headless = os.path.join(simulator_path, 'simulator_headless')
+            if os.path.exists(headless):
+                return headless
+        return os.path.join(simulator_path, 'simulator')
+
     def start(self):
         """Start the simulation"""
 
@@ -270,7 +514,8 @@ class Simulator(_body.Mixin,
             'or play_paused'
         )
 
-        commands = [self._simulator_path + '/simulator']
+        commands = [self._get_executable(self._simulator_path,
+                                         self._play_blind)]
         if self._play_blind:
             commands.append('-blind')
         if self._play_paused:
@@ -279,6 +524,7 @@ class Simulator(_body.Mixin,
             commands.append('-notex')
         if not self._draw_shadows:
             commands.append('-noshadow')
+        commands += ['-loglevel', str(self._log_levels[self._log_level])]
             
         # create pipe to simulator
         self.pipe = subprocess.Popen(
@@ -287,21 +533,41 @@ class Simulator(_body.Mixin,
             stdout=subprocess.PIPE,  # connects stdout
             stderr=subprocess.PIPE,  # connects stderr
             stdin=subprocess.PIPE,  # connects stdin
-            universal_newlines=True,  # necessary for 3.x
             cwd=self._simulator_path,  # helps with textures
         )
-        # write parameters
-        self._send_simulator_parameters()
-        self.pipe.stdin.write(self._strings_to_send)
-        # finish by writing done
-        self.pipe.stdin.write('Done\n')
-        # self.pipe.stdin.close()
-
-    def wait_to_finish(self):
+        # pipes are opened in binary mode so sensor data
+        # can be written back as packed values.
+        # The simulator echoes what it reads to stderr, so stdin is fed
+        # while stdout and stderr are drained. Otherwise both processes
+        # block once a pipe buffer fills up for large scenes.
+        self._cout_chunks = []
+        self._cerr_chunks = []
+        self._pipe_threads = [
+            self._start_pipe_thread(self._feed_pipe, self.pipe.stdin,
+                                    self._get_scene_bytes()),
+            self._start_pipe_thread(self._drain_pipe, self.pipe.stdout,
+                                    self._cout_chunks),
+            self._start_pipe_thread(self._drain_pipe, self.pipe.stderr,
+                                    self._cerr_chunks),
+        ]
+
+    def wait_to_finish(self, timeout=None):
         """Communicate with pipe once simulation is complete
 
         .. note:: for **python 3.x** it is necessary to use this command after `sim.start()`
             in order for the simulation to run properly.
+
+        Parameters
+        ----------
+        timeout : float (optional)
+            Wall clock seconds to wait before the simulator process is
+            killed. A killed simulation has no sensor data and sets
+            `timed_out` to True. (default is to wait indefinitely)
+
+        Returns
+        -------
+        bool
+            True if the simulation completed
         """
 
         # for line in iter(self.pipe.stdout.readline, b''):
@@ -309,9 +575,102 @@ class Simulator(_body.Mixin,
         #     pass
         # self.pipe.terminate()
         # code = self.pipe.poll()
-        data = self.pipe.communicate()
-        self._raw_cout = data[0]
-        self._raw_cerr = data[1]
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, self._kill)
+            timer.start()
+
+        for thread in self._pipe_threads:
+            thread.join()
+        self.pipe.wait()
+
+        if timer is not None:
+            timer.cancel()
+
+        raw_cout = b''.join(self._cout_chunks)
+        raw_cerr = b''.join(self._cerr_chunks)
+
+        if self.timed_out:
+            self._raw_cout = raw_cout
+            self._raw_cerr = raw_cerr.decode(errors='replace')
+            return False
+
+        self._read_output(raw_cout, raw_cerr)
+        return True
+
+    @staticmethod
+    def _start_pipe_thread(target, *args):
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _feed_pipe(pipe, data):
+        """Writes all of data to the pipe then closes it"""
+        try:
+            pipe.write(data)
+            pipe.close()
+        except (IOError, OSError): # simulator exited early
+            pass
+
+    @staticmethod
+    def _drain_pipe(pipe, chunks):
+        """Reads the pipe into chunks until it is closed"""
+        for chunk in iter(lambda: os.read(pipe.fileno(), 65536), b''):
+            chunks.append(chunk)
+        pipe.close()
+
+    def _kill(self):
+        """Kills the simulator process if it is still running"""
+        if self.pipe.poll() is None:
+            self.timed_out = True
+            try:
+                self.pipe.kill()
+            except OSError: # exited in the meantime
+                pass
+
+    @property
+    def _strings_to_send(self):
+        # binary data is only summarized since it is not text
+        return ''.join(command if isinstance(command, str)
+                       else '<' + str(len(command)) + ' bytes>\n'
+                       for command in self._commands_to_send)
+
+    def _get_scene_bytes(self):
+        """Returns the complete encoded scene to send to the simulator"""
+        if self._scene_bytes is not None:
+            return self._scene_bytes
+
+        # write parameters
+        self._send_simulator_parameters()
+        return self._encode_commands(self._commands_to_send + ['Done\n'])
+
+    @classmethod
+    def _encode_commands(cls, commands):
+        # encode runs of text at once, binary data is sent as is
+        return b''.join(chunk.encode() if isinstance(chunk, str) else chunk
+                        for chunk in cls._join_commands(commands))
+
+    @staticmethod
+    def _join_commands(commands):
+        """Joins runs of text commands, binary data is kept separate"""
+        chunks = []
+        text = []
+        for command in commands:
+            if isinstance(command, str):
+                text.append(command)
+            else:
+                chunks.append(''.join(text))
+                chunks.append(command)
+                text = []
+        chunks.append(''.join(text))
+        return chunks
+
+    def _read_output(self, raw_cout, raw_cerr):
+        """Reads the sensor data and debug output written by the simulator"""
+        self._raw_cout = raw_cout
+        self._raw_cerr = raw_cerr.decode(errors='replace')
 
         # cut out annoying drawstuff commands
         start_str = 'Simulation test environment v0.02'
@@ -324,41 +683,116 @@ class Simulator(_body.Mixin,
             self._raw_cerr = self._raw_cerr[:start_index] + \
                 self._raw_cerr[end_index + len(end_str):]
 
-        self._read_sensor_data()
+        if self._sensor_format == 'text':
+            self._raw_cout = self._raw_cout.decode()
+            self._read_sensor_data()
+        else:
+            self._read_binary_sensor_data()
 
-    def _read_sensor_data(self):
-        # sensor data comes back as a long string of single values delimited by a space 
-        # character. This function reads the value and splits the data accordingly
-        # into the proper sensor data entry
+    def _read_binary_sensor_data(self):
+        # sensor data comes back as an int32 header holding the number
+        # of time steps, the number of sensors, the id of each sensor and
+        # the number of values of each sensor, padded to 8 bytes, followed
+        # by the packed values of each sensor
 
-        sensor_vector = self._raw_cout.split(' ')
+        dtype = self._sensor_formats[self._sensor_format][1]
+        raw = self._raw_cout
 
-        if len(sensor_vector) > 1: # at least one sensor present so contitue
-            time_steps = int(sensor_vector.pop(0))
+        if len(raw) < 8:
+            self._sensor_data = SensorData(np.zeros((0, 0)), [])
+            return
 
-            while(len(sensor_vector) > 0):
-                # first pop off id tag of the sensor
-                entity_index = int(sensor_vector.pop(0))
+        time_steps, num_sensors = np.frombuffer(raw, dtype='<i4', count=2)
+        time_steps, num_sensors = int(time_steps), int(num_sensors)
+        self.steps_run = time_steps
+        ids = np.frombuffer(raw, dtype='<i4', count=num_sensors, offset=8)
+        records = np.frombuffer(raw, dtype='<i4', count=num_sensors,
+                                offset=8 + 4 * num_sensors)
+
+        offset = 8 + 8 * num_sensors
+        num_values = int(np.sum(records))
+        values = np.frombuffer(raw, dtype=dtype,
+                               count=num_values,
+                               offset=offset)
+
+        self._sensor_data = SensorData.from_values(values, ids, records)
+
+        # reducers start on the next 8 byte boundary with an int32 header
+        # of their number, padding, sensor ids and ops, then float64 values
+        offset += values.nbytes + values.nbytes % 8
+        num_reducers = int(np.frombuffer(raw, dtype='<i4', count=1,
+                                         offset=offset)[0])
+        reducer_header = np.frombuffer(raw, dtype='<i4',
+                                       count=2 * num_reducers,
+                                       offset=offset + 8)
+        reduced = np.frombuffer(raw, dtype='<f8', count=num_reducers,
+                                offset=offset + 8 + 8 * num_reducers)
+        self._set_reduced_sensor_data(reducer_header[:num_reducers],
+                                      reducer_header[num_reducers:],
+                                      reduced)
+
+    def _set_reduced_sensor_data(self, sensor_ids, op_codes, values):
+        op_names = dict((code, op) for op, code in self._reducer_ops.items())
+        self._reduced_sensor_data = dict(
+            ((int(sensor_id), op_names[int(op_code)]), float(value))
+            for sensor_id, op_code, value in zip(sensor_ids, op_codes, values))
 
-                # create list entry in data dict to populate with sensor values
-                # for each time step
-                self._sensor_data[entity_index] = [0] * time_steps
+    def _read_sensor_data(self):
+        # sensor data comes back as a long string of single values delimited by a space 
+        # character. The first values are the number of time steps and of sensors,
+        # followed by the id tag, number of values and values of each sensor.
+        # Then the number of reducers is followed by the sensor id, op code and
+        # value of each reducer. This function converts the values in one pass
+        # and splits them per sensor
 
-                for t in range(time_steps):
-                    self._sensor_data[entity_index][t] = float(sensor_vector.pop(0))
+        sensor_vector = self._raw_cout.split()
+
+        if len(sensor_vector) > 1: # at least one sensor present so contitue
+            time_steps = int(sensor_vector[0])
+            self.steps_run = time_steps
+            num_sensors = int(sensor_vector[1])
+            values = np.array(sensor_vector[2:], dtype=np.float64)
+
+            # walk the (id, number of values) pairs in front of each row
+            ids, records, starts = [], [], []
+            index = 0
+            for _ in range(num_sensors):
+                ids.append(int(values[index]))
+                records.append(int(values[index + 1]))
+                starts.append(index + 2)
+                index += 2 + records[-1]
+
+            reducers = values[index + 1:].reshape(-1, 3)
+            self._set_reduced_sensor_data(reducers[:, 0], reducers[:, 1],
+                                          reducers[:, 2])
+
+            if num_sensors > 0:
+                values = np.concatenate([values[start:start + num_records]
+                                         for start, num_records
+                                         in zip(starts, records)])
+                self._sensor_data = SensorData.from_values(values, ids, records)
+                return
+
+        self._sensor_data = SensorData(np.zeros((0, 0)), [])
 
     def _send(self, command, *args):
         """Append to string containing commands for C++ program to read in.
         
         `command` string should have a corresponding catch on the c++ side in environment.cpp
         Remaining args should be read in by `readFromPython()` method in corresponding objects
-        C++ code.
+        C++ code. Bytes args are sent unchanged and have to be read by size.
         """
         assert isinstance(command, str), ('Command must be string')
+        assert self._scene_bytes is None, ('Scene is compiled, nothing can be sent to it')
 
         # each entry is delimited by \n
         string_to_send = command + '\n'
         for arg in args:
+            if isinstance(arg, bytes):
+                self._commands_to_send.append(string_to_send)
+                self._commands_to_send.append(arg)
+                string_to_send = '\n'
+                continue
             try: # arg is a list or string
                 i = iter(arg)
             except: # arg is a single value
@@ -368,7 +802,7 @@ class Simulator(_body.Mixin,
                     string_to_send += arg + '\n'
                 else:
                     string_to_send += '\n'.join(str(entry) for entry in arg) + '\n'
-        self._strings_to_send += string_to_send
+        self._commands_to_send.append(string_to_send)
 
     def _send_add_command(self, *args):
         self._send('Add', *args)
@@ -381,6 +815,13 @@ class Simulator(_body.Mixin,
         assert entity_type in valid_entity_types, ('Entity type inputed: ' + str(entity_type) +
                                                    ' must be one of ' + str(valid_entity_types))
 
+        if self._template is not None:
+            # id tags of entities in a template are local to it
+            entity_id = _template.TemplateID(self._template.num_entities)
+            self._template.entities.append(entity_type)
+            self._send('Entity', *args)
+            return entity_id
+
         self._entities.append(entity_type)
         entity_id = self._num_entities
         self._send('Entity', *args)
@@ -395,30 +836,70 @@ class Simulator(_body.Mixin,
         self._send_parameter('EvalSteps', int(self._eval_steps))
         # send DT
         self._send_parameter('DT', self._dt)
+        self._send_parameter('PhysicsSubsteps', self._physics_substeps)
+
+        self._send_parameter('CollisionSpace',
+                             self._collision_spaces[self._collision_space])
+
+        # send solver
+        self._send_parameter('Solver', self._solvers[self._solver])
+        self._send_parameter('QuickIterations', self._quick_iterations)
+        for name, value in self._solver_parameters:
+            if value is not None:
+                self._send_parameter(name, value)
 
         # send initial draw state
         self._send_parameter('DrawJoints', int( self._draw_joints ) )
 
+        # send format of sensor write back
+        self._send_parameter('SensorFormat',
+                             self._sensor_formats[self._sensor_format][0])
+
+    def _entity_type(self, id_tag):
+        """Returns the type of an entity, id tags of entities in a
+        template are only valid while it is defined"""
+        if isinstance(id_tag, _template.TemplateID):
+            assert self._template is not None, ('Input id tag ' + str(id_tag) +
+                                                ' is local to a template')
+            return self._template.entities[id_tag]
+        return self._entities[id_tag]
+
+    def _static_bodies_of(self, id_tag):
+        """Returns the ids of static bodies among which id_tag is"""
+        if isinstance(id_tag, _template.TemplateID):
+            return self._template.static_bodies
+        return self._static_bodies
+
+    def _targetable_neurons_of(self, id_tag):
+        """Returns the ids of hidden and motor neurons among which id_tag is"""
+        if isinstance(id_tag, _template.TemplateID):
+            return self._template.targetable_neurons
+        return self._targetable_neurons
+
     def _assert_body(self, id_tag, tag_name=''):
         if (id_tag == -1):
             return
-        assert self._entities[id_tag] == 'Body', ('Input id tag ' + str(tag_name) + ': ' +
+        assert self._entity_type(id_tag) == 'Body', ('Input id tag ' + str(tag_name) + ': ' +
                                                   str(id_tag) +' does not correspond to body')
 
+    def _assert_not_static(self, id_tag, tag_name=''):
+        assert id_tag not in self._static_bodies_of(id_tag), ('Input id tag ' + str(tag_name) + ': ' +
+                                                   str(id_tag) + ' is a static body')
+
     def _assert_actuator(self, id_tag, tag_name=''):
-        assert self._entities[id_tag] == 'Actuator', ('Input id tag ' + str(tag_name) + ': ' +
+        assert self._entity_type(id_tag) == 'Actuator', ('Input id tag ' + str(tag_name) + ': ' +
                                                       str(id_tag) +' does not correspond to actuator')
 
     def _assert_joint(self, id_tag, tag_name=''):
-        assert self._entities[id_tag] == 'Joint', ('Input id tag ' + str(tag_name) + ': ' +
+        assert self._entity_type(id_tag) == 'Joint', ('Input id tag ' + str(tag_name) + ': ' +
                                                    str(id_tag) +' does not correspond to joint')
 
     def _assert_sensor(self, id_tag, tag_name=''):
-        assert self._entities[id_tag] == 'Sensor', ('Input id tag ' + str(tag_name) + ': ' +
+        assert self._entity_type(id_tag) == 'Sensor', ('Input id tag ' + str(tag_name) + ': ' +
                                                     str(id_tag) +' does not correspond to sensor')
 
     def _assert_neuron(self, id_tag, tag_name=''):
-        assert self._entities[id_tag] == 'Neuron', ('Input id tag ' + str(tag_name) + ': ' +
+        assert self._entity_type(id_tag) == 'Neuron', ('Input id tag ' + str(tag_name) + ': ' +
                                                     str(id_tag) +' does not correspond to neuron')
 
 if __name__ == '__main__':
@@ -0,0 +1,161 @@
+from __future__ import division, print_function
+import numpy as np
+
+try:
+    from collections.abc import Mapping
+except ImportError: # python 2.x
+    from collections import Mapping
+
+
+class SensorData(Mapping):
+    """Sensor values written back from a simulation
+
+    All values live in one contiguous (num_sensors, time_steps) array.
+    Indexing by a sensor id returns a read-only view of that sensor's
+    row so no values are copied. The object otherwise behaves like the
+    dictionary previously returned by :func:`get_all_sensor_data()`.
+
+    Sensors recording less often than others have fewer values. Their
+    rows of `array` are padded with nan, which indexing by sensor id
+    leaves out.
+
+    Attributes
+    ----------
+    array      : 2D numpy array
+        The read-only (num_sensors, time_steps) array of sensor values
+    sensor_ids : tuple of int
+        The id tag of the sensor stored in each row of `array`
+    records    : tuple of int
+        The number of values of the sensor in each row of `array`
+    """
+
+    def __init__(self, array, sensor_ids, records=None):
+        array = np.asarray(array)
+        assert array.ndim == 2 and array.shape[0] == len(sensor_ids), (
+            'array must be 2D with one row per sensor id')
+
+        # views handed out should never modify the simulation results
+        array = array.view()
+        array.flags.writeable = False
+
+        if records is None:
+            records = [array.shape[1]] * len(sensor_ids)
+        assert len(records) == len(sensor_ids), (
+            'records must have one entry per sensor id')
+
+        self.array = array
+        self.sensor_ids = tuple(int(sensor_id) for sensor_id in sensor_ids)
+        self.records = tuple(int(num_records) for num_records in records)
+        self._rows = dict((sensor_id, row) for row, sensor_id
+                          in enumerate(self.sensor_ids))
+
+    @classmethod
+    def from_values(cls, values, sensor_ids, records):
+        """Builds sensor data from the values of each sensor one after another
+
+        When every sensor has the same number of values the array is a
+        view of *values*, otherwise shorter rows are padded with nan.
+
+        Parameters
+        ----------
+        values     : 1D numpy array
+            The values of the first sensor followed by those of the next
+        sensor_ids : list of int
+            The id tag of each sensor
+        records    : list of int
+            The number of values of each sensor
+        """
+        records = [int(num_records) for num_records in records]
+        if len(set(records)) <= 1:
+            num_records = records[0] if records else 0
+            array = values.reshape(len(records), num_records)
+        else:
+            dtype = np.result_type(values.dtype, np.float32)
+            array = np.full((len(records), max(records)), np.nan, dtype=dtype)
+            start = 0
+            for row, num_records in enumerate(records):
+                array[row, :num_records] = values[start:start + num_records]
+                start += num_records
+        return cls(array, sensor_ids, records)
+
+    def __getitem__(self, sensor_id):
+        row = self._rows[sensor_id]
+        return self.array[row, :self.records[row]]
+
+    def __iter__(self):
+        return iter(self.sensor_ids)
+
+    def __len__(self):
+        return len(self.sensor_ids)
+
+    def __repr__(self):
+        return 'SensorData(sensors={}, time_steps={}, dtype={})'.format(
+            len(self), self.time_steps, self.array.dtype)
+
+    @property
+    def time_steps(self):
+        """The number of values of the sensors recording most often"""
+        return self.array.shape[1]
+
+    def row(self, sensor_id):
+        """Returns the row of `array` holding the values of *sensor_id*"""
+        return self._rows[sensor_id]
+
+    def window(self, start=None, stop=None, step=None):
+        """Returns the sensor data between time steps *start* and *stop*
+
+        The returned SensorData shares memory with this one. Steps
+        index the values of each sensor, which are time steps only for
+        sensors recording every step.
+
+        Parameters
+        ----------
+        start : int (optional)
+            The first time step to include. (default is the first step)
+        stop  : int (optional)
+            The time step to stop before. (default is the last step)
+        step  : int (optional)
+            Take every *step* time steps. (default 1)
+
+        Returns
+        -------
+        SensorData
+            The windowed sensor data
+        """
+        window = slice(start, stop, step)
+        records = [len(range(num_records)[window]) for num_records in self.records]
+        return SensorData(self.array[:, window], self.sensor_ids, records)
+
+    def group(self, sensor_ids):
+        """Returns the values of several sensors stacked as a 2D array
+
+        When the rows of the sensors are evenly spaced, for example sensors
+        sent one after another, the result is a view into `array`.
+        Otherwise numpy has to gather the rows into a new array. Rows of
+        sensors with fewer values keep their nan padding.
+
+        Parameters
+        ----------
+        sensor_ids : list of int
+            The id tags of the sensors to stack
+
+        Returns
+        -------
+        2D numpy array
+            A (len(sensor_ids), time_steps) array
+        """
+        rows = [self._rows[sensor_id] for sensor_id in sensor_ids]
+
+        if len(rows) == 0:
+            return self.array[0:0]
+        if len(rows) == 1:
+            return self.array[rows[0]:rows[0] + 1]
+
+        stride = rows[1] - rows[0]
+        evenly_spaced = stride > 0 and all(
+            rows[i + 1] - rows[i] == stride for i in range(len(rows) - 1))
+
+        if evenly_spaced:
+            return self.array[rows[0]:rows[-1] + 1:stride]
+        else:
+            return self.array[rows]
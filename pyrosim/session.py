@@ -0,0 +1,165 @@
+from __future__ import division, print_function
+import os
+import subprocess
+import threading
+
+from .pyrosim import Simulator
+
+
+class SimulatorSession(object):
+    """Evaluates many simulations with one persistent simulator process
+
+    Starting the simulator executable, initializing ODE and creating the
+    world takes a noticeable share of the time of short evaluations. A
+    session starts the simulator once in server mode and sends it one
+    scene per call to :func:`run()`. The simulator tears down the scene
+    after each evaluation and waits for the next one.
+
+    Simulations run through a session are always played blind. The
+    verbosity of the debug output is set once for the whole session with
+    *log_level*, the log_level of the individual simulators is ignored.
+
+    Example
+    -------
+    ::
+
+        with pyrosim.SimulatorSession() as session:
+            for genome in population:
+                sim = pyrosim.Simulator(eval_steps=500, play_blind=True)
+                build_robot(sim, genome)
+                session.run(sim)
+                fitness = sim.get_sensor_data(position_sensor)[-1]
+    """
+
+    def __init__(self, log_level='info'):
+        # location of simulator executable
+        self._simulator_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'simulator/build')
+
+        assert log_level in Simulator._log_levels, (
+            'log_level must be one of ' + str(list(Simulator._log_levels)))
+        self._log_level = Simulator._log_levels[log_level]
+
+        self.pipe = None
+        self._cerr_chunks = []
+        self._cerr_lock = threading.Lock()
+        self._cerr_thread = None
+        self._num_evaluations = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def num_evaluations(self):
+        """The number of simulations evaluated by this session"""
+        return self._num_evaluations
+
+    def start(self):
+        """Start the simulator process
+
+        Called automatically by :func:`run()` if the session is not started.
+        """
+        if self.pipe is not None:
+            return
+
+        self.pipe = subprocess.Popen(
+            [Simulator._get_executable(self._simulator_path, True), '-server',
+             '-loglevel', str(self._log_level)],
+            stdout=subprocess.PIPE,  # connects stdout
+            stderr=subprocess.PIPE,  # connects stderr
+            stdin=subprocess.PIPE,  # connects stdin
+            cwd=self._simulator_path,
+        )
+
+        # stderr has to be drained continuously or the
+        # simulator blocks once the pipe buffer is full
+        self._cerr_thread = threading.Thread(target=self._drain_cerr,
+                                             args=(self.pipe.stderr,))
+        self._cerr_thread.daemon = True
+        self._cerr_thread.start()
+
+    def run(self, simulator):
+        """Evaluate a simulation in the persistent simulator process
+
+        The sensor data and debug output are stored in *simulator* exactly
+        as if :func:`Simulator.start()` and :func:`Simulator.wait_to_finish()`
+        had been called.
+
+        Parameters
+        ----------
+        simulator : Simulator
+            A fully built simulator which has not been started
+
+        Returns
+        -------
+        Simulator
+            The evaluated simulator
+        """
+        assert simulator._eval_steps > 0, (
+            'Sessions play blind and eval_steps must be a positive number')
+        self.start()
+
+        with self._cerr_lock:
+            self._cerr_chunks = []
+
+        try:
+            self.pipe.stdin.write(simulator._get_scene_bytes())
+            self.pipe.stdin.flush()
+
+            # result is framed as a 'Result <size>' line followed by
+            # the sensor data exactly as written by a single simulation
+            header = self.pipe.stdout.readline().split()
+            if len(header) != 2 or header[0] != b'Result':
+                raise RuntimeError('Simulator exited unexpectedly')
+            raw_cout = self.pipe.stdout.read(int(header[1]))
+
+            # let the simulator tear down while python builds the next scene
+            self.pipe.stdin.write(b'Reset\n')
+            self.pipe.stdin.flush()
+        except (IOError, OSError, RuntimeError, ValueError):
+            self._kill()
+            raise RuntimeError('Simulator exited unexpectedly:\n' +
+                               self.get_debug_output())
+
+        simulator._read_output(raw_cout, self._get_cerr())
+        self._num_evaluations += 1
+        return simulator
+
+    def close(self):
+        """Stop the simulator process"""
+        if self.pipe is None:
+            return
+
+        try:
+            self.pipe.stdin.write(b'Exit\n')
+            self.pipe.stdin.close()
+        except (IOError, OSError):
+            pass
+        self.pipe.wait()
+        self._cerr_thread.join()
+        self.pipe.stdout.close()
+        self.pipe = None
+
+    def get_debug_output(self):
+        """Returns the debug output of the most recent simulation"""
+        return self._get_cerr().decode(errors='replace')
+
+    def _drain_cerr(self, stream):
+        for chunk in iter(lambda: os.read(stream.fileno(), 65536), b''):
+            with self._cerr_lock:
+                self._cerr_chunks.append(chunk)
+        stream.close()
+
+    def _get_cerr(self):
+        with self._cerr_lock:
+            return b''.join(self._cerr_chunks)
+
+    def _kill(self):
+        if self.pipe is not None:
+            self.pipe.kill()
+            self.pipe.wait()
+            self.pipe = None
@@ -0,0 +1,468 @@
+const unsigned int convexBunnyPlaneCount = 176;
+dReal convexBunnyPlanes[] =
+{
+	0.986167, -0.0612533, -0.154021, 0.399481,
+	0.982735, -0.0691036, -0.171628, 0.409884,
+	-0.984387, -0.0582774, -0.166089, 0.403079,
+	0.985044, -0.172279, 0.00302105, 0.437531,
+	0.976915, -0.184361, 0.107929, 0.465334,
+	0.951478, -0.281619, 0.124019, 0.475223,
+	0.798136, -0.502214, 0.332805, 0.535555,
+	0.949728, -0.211128, -0.231176, 0.528156,
+	-0.000894561, -0.995066, -0.0992088, 0.80299,
+	-0.000896015, -0.995066, -0.0992131, 0.802991,
+	-0.0035709, -0.935822, 0.352454, 0.618504,
+	-0.291551, -0.828515, 0.478081, 0.681579,
+	-0.978715, -0.181408, 0.0959605, 0.468907,
+	-0.985523, -0.169302, -0.00904739, 0.441129,
+	-0.953768, -0.278749, 0.11236, 0.478704,
+	0.372745, -0.827499, 0.419888, 0.630174,
+	0.976911, -0.18316, 0.109991, 0.466086,
+	0.817827, -0.387738, 0.425227, 0.569153,
+	-0.978732, -0.180211, 0.0980152, 0.469656,
+	0.662794, -0.0277654, 0.748287, 0.803459,
+	0.00359857, -0.660581, -0.750746, 0.877267,
+	0.00359952, -0.660579, -0.750748, 0.877266,
+	-0.947456, -0.208272, -0.242797, 0.531628,
+	-0.980764, -0.0661375, -0.18365, 0.413468,
+	-0.940835, -0.0698657, -0.331585, 0.494827,
+	0.983751, 0.0529367, -0.171556, 0.403533,
+	0.981839, 0.0996302, -0.16145, 0.410144,
+	0.977938, 0.0857834, -0.190468, 0.411823,
+	0.959636, 0.106068, -0.260476, 0.44898,
+	0.85334, -0.0495414, -0.518996, 0.60489,
+	-0.803667, -0.499793, 0.322995, 0.538478,
+	-0.689742, -0.615484, 0.381361, 0.574754,
+	-0.380353, -0.826364, 0.415277, 0.63155,
+	-0.39985, -0.817283, 0.414933, 0.630682,
+	-0.380309, -0.826285, 0.415473, 0.631677,
+	-0.981411, 0.0559147, -0.183592, 0.407121,
+	-0.979526, 0.101914, -0.173615, 0.413635,
+	-0.975381, 0.0881975, -0.202119, 0.415257,
+	0.988445, 0.140182, 0.0576755, 0.485174,
+	0.876515, 0.0408992, 0.479634, 0.620093,
+	0.848907, -0.0996824, 0.519057, 0.631268,
+	0.895754, -0.195088, 0.399457, 0.563346,
+	0.861448, -0.256989, 0.438023, 0.574909,
+	0.775672, -0.447481, 0.445076, 0.586422,
+	0.683157, -0.617557, 0.389768, 0.572247,
+	0.391755, -0.818722, 0.419789, 0.629264,
+	0.28317, -0.829384, 0.481599, 0.680529,
+	0.3727, -0.827422, 0.420079, 0.630298,
+	-0.824143, -0.385255, 0.415171, 0.57215,
+	-0.782413, -0.445128, 0.435536, 0.589267,
+	0.00152876, 0.999994, -0.00308275, 0.665646,
+	0.00242466, 0.999989, -0.0038994, 0.665879,
+	-0.979892, 0.121321, -0.158406, 0.420287,
+	0.767537, -0.190214, -0.612132, 0.695479,
+	0.372649, -0.42747, -0.823652, 0.869878,
+	0.537245, -0.335515, -0.77382, 0.82472,
+	0.0263648, -0.598975, -0.800334, 0.873623,
+	0.00393345, -0.60959, -0.792707, 0.869865,
+	-0.0183706, -0.598907, -0.800608, 0.873704,
+	0.00875728, 0.676014, -0.736836, 0.825597,
+	0.852333, -0.0355955, -0.521786, 0.607886,
+	0.392036, 0.534934, -0.748434, 0.818042,
+	0.847696, -0.122973, -0.516033, 0.615814,
+	0.884763, -0.0760716, -0.45979, 0.565893,
+	0.9446, -0.0727144, -0.320069, 0.491401,
+	0.904971, -0.0675211, -0.420081, 0.541673,
+	-0.899959, -0.0647928, -0.431134, 0.544968,
+	-0.955972, 0.108494, -0.272667, 0.452769,
+	-0.363823, -0.426358, -0.828161, 0.871222,
+	-0.528689, -0.333936, -0.780368, 0.826685,
+	0.982068, 0.118277, -0.146811, 0.416542,
+	0.98951, 0.144455, 0.00164104, 0.468616,
+	0.50797, -0.0708041, 0.85846, 0.883126,
+	0.748614, -0.431275, 0.503565, 0.634026,
+	0.214863, -0.405791, 0.888351, 0.94048,
+	-0.901162, -0.192379, 0.388455, 0.566627,
+	-0.867521, -0.254376, 0.427435, 0.578065,
+	-0.226957, -0.405135, 0.885639, 0.941284,
+	-0.756029, -0.429007, 0.494341, 0.636765,
+	-0.00629553, -0.188362, 0.982079, 0.968197,
+	0.0165684, 0.999846, -0.00581961, 0.670373,
+	0.00313267, 0.999987, -0.00405124, 0.666103,
+	0.545069, 0.472158, -0.692796, 0.780052,
+	0.932011, 0.148856, -0.330451, 0.498417,
+	0.844043, 0.227673, -0.485547, 0.599903,
+	-0.019033, 0.999801, -0.00590978, 0.672252,
+	-0.959662, 0.239262, -0.147656, 0.488538,
+	0.00151234, 0.999999, -0.000399466, 0.665855,
+	-0.988649, 0.143168, 0.0455675, 0.488784,
+	-0.989015, 0.147444, -0.01048, 0.472227,
+	-0.972439, 0.232727, -0.01415, 0.518344,
+	0.587681, -0.160147, -0.793085, 0.823999,
+	0.640479, -0.269179, -0.719256, 0.778142,
+	0.541109, -0.332896, -0.772257, 0.823226,
+	0.546185, -0.14771, -0.824538, 0.84854,
+	0.528519, -0.026044, -0.848522, 0.873136,
+	0.447231, -0.0756684, -0.891212, 0.903953,
+	0.490619, -0.0795123, -0.867739, 0.884255,
+	0.279393, 0.264257, -0.923097, 0.950045,
+	0.374653, 0.39486, -0.83888, 0.886593,
+	0.00050174, 0.999994, -0.00331563, 0.665976,
+	-0.0103777, 0.999934, -0.00487936, 0.669494,
+	-0.927571, 0.150741, -0.341889, 0.501807,
+	-0.267268, 0.265084, -0.926444, 0.951043,
+	-0.845984, -0.0330207, -0.532184, 0.610986,
+	-0.518165, -0.0244575, -0.854931, 0.875047,
+	-0.83753, 0.228953, -0.496108, 0.603116,
+	-0.535666, 0.472122, -0.700116, 0.78259,
+	-0.381083, 0.534649, -0.754272, 0.820328,
+	-0.363157, 0.395975, -0.843398, 0.88794,
+	-0.326829, -0.256634, -0.909572, 0.922946,
+	0.394875, -0.128601, -0.90969, 0.920236,
+	0.337169, -0.257642, -0.905504, 0.921733,
+	0.398433, -0.193767, -0.896496, 0.910015,
+	-0.536477, -0.146072, -0.831177, 0.850523,
+	-0.436512, -0.0743406, -0.896622, 0.905564,
+	-0.480187, -0.0780522, -0.873687, 0.886029,
+	-0.384093, -0.127432, -0.914458, 0.921656,
+	-0.388009, -0.192572, -0.901313, 0.911451,
+	0.977045, 0.15796, 0.14294, 0.521934,
+	0.930035, 0.231515, 0.28537, 0.600301,
+	-0.855499, -0.0971121, 0.508616, 0.634376,
+	-0.875419, 0.136849, 0.463589, 0.62897,
+	-0.882196, 0.0435387, 0.468864, 0.623303,
+	0.0204398, -0.0238739, 0.999506, 0.958419,
+	-0.0062197, -0.0777937, 0.99695, 0.962769,
+	0.907123, 0.250746, 0.338015, 0.623205,
+	0.902358, 0.173321, 0.394601, 0.607696,
+	0.870085, 0.134211, 0.474278, 0.625782,
+	0.0015108, 0.999999, 6.34978e-06, 0.665945,
+	0.00150567, 0.999999, 0.000568537, 0.666143,
+	0.00150738, 0.999999, 0.000565012, 0.666141,
+	-0.963954, 0.266039, -0.00405118, 0.539571,
+	0.0015136, 0.999999, -0.000393102, 0.665856,
+	0.00151117, 0.999999, 4.32104e-06, 0.665944,
+	0.0272711, 0.999604, -0.00696439, 0.673709,
+	0.962047, 0.236383, -0.136341, 0.484917,
+	0.973236, 0.229796, -0.00223071, 0.514797,
+	0.964728, 0.263133, 0.00776342, 0.536054,
+	-0.906596, 0.176056, 0.383521, 0.610999,
+	-0.978237, 0.160918, 0.130987, 0.525513,
+	-0.910434, 0.253486, 0.326887, 0.626522,
+	-0.932759, 0.234321, 0.27396, 0.603697,
+	0.800621, -0.0921333, -0.592045, 0.665278,
+	0.679569, -0.15358, -0.717356, 0.765121,
+	0.684928, -0.199829, -0.700672, 0.756959,
+	-0.532604, -0.33128, -0.778837, 0.82519,
+	-0.578395, -0.158384, -0.800234, 0.826134,
+	-0.671209, -0.151537, -0.725613, 0.767576,
+	-0.00530287, 0.323551, 0.946196, 0.94547,
+	-0.719766, 0.229227, 0.655281, 0.774388,
+	-0.604194, 0.29171, 0.741522, 0.841564,
+	-0.544989, 0.302925, 0.781808, 0.866398,
+	-0.518662, -0.0692529, 0.85217, 0.884999,
+	-0.671987, -0.0257512, 0.740115, 0.805898,
+	-0.00613626, -0.00823685, 0.999947, 0.957141,
+	-0.032747, -0.0237908, 0.99918, 0.958516,
+	-0.00530611, 0.323546, 0.946198, 0.945471,
+	-0.545061, 0.302657, 0.781861, 0.866377,
+	-0.639902, 0.23832, 0.730568, 0.823722,
+	0.00149706, 0.999997, 0.00193434, 0.667038,
+	0.00149731, 0.999997, 0.00193252, 0.667037,
+	-0.0048341, 0.44008, 0.897946, 0.936327,
+	-0.00483143, 0.440078, 0.897947, 0.936327,
+	-0.632454, -0.267241, -0.727039, 0.780455,
+	-0.67691, -0.197765, -0.709, 0.759436,
+	-0.841667, -0.120432, -0.526396, 0.618913,
+	-0.760706, -0.187792, -0.621337, 0.698143,
+	-0.87929, -0.0734062, -0.470597, 0.569116,
+	-0.847068, -0.0469762, -0.529405, 0.607991,
+	-0.793572, -0.0897399, -0.601823, 0.668201,
+	0.536355, 0.301024, 0.788485, 0.864403,
+	0.536284, 0.301291, 0.788431, 0.864424,
+	0.595945, 0.289897, 0.748872, 0.839373,
+	0.631626, 0.236397, 0.738353, 0.8214,
+	0.712378, 0.227061, 0.664049, 0.771772,
+};
+const unsigned int convexBunnyPointCount = 105;
+dReal convexBunnyPoints[] =
+{
+	-0.459488, -0.093017, -0.311341,
+	0.466635, -0.094416, -0.305669,
+	-0.309239, 0.776868, 0.304726,
+	-0.004458, -0.042526, 1.01567,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	0.007957, 0.282241, -0.93168,
+	0.204445, -0.66438, 0.513353,
+	-0.303961, 0.054199, 0.625921,
+	0.265619, 0.756464, 0.504187,
+	-0.402162, 0.133528, -0.443247,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.266772, 0.64233, 0.602061,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	0.411612, 0.132299, -0.438264,
+	0.31148, 0.775931, 0.308527,
+	0.300086, 0.053287, 0.62962,
+	-0.414624, 0.164083, -0.278254,
+	-0.248382, 0.255825, -0.627493,
+	-0.216201, -0.126776, -0.886936,
+	0.267564, -0.666174, -0.654834,
+	-0.135892, -0.03552, 0.945455,
+	-0.265837, 0.757267, 0.500933,
+	-0.003873, 0.161605, 0.970499,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.282599, -0.663393, 0.412411,
+	0.007237, 0.361687, -0.794439,
+	0.093627, 0.258494, -0.920589,
+	0.422146, 0.162819, -0.27313,
+	0.279163, -0.664604, 0.417328,
+	0.263086, 0.512567, 0.637832,
+	-0.099875, 0.310931, -0.799381,
+	-0.446838, -0.118517, -0.466159,
+	-0.168842, 0.102387, -0.920381,
+	0.455805, -0.119881, -0.460632,
+	0.337743, -0.666396, -0.074503,
+	-0.134547, -0.119852, -0.959004,
+	-0.183807, 0.19697, 0.84448,
+	0.264969, 0.641527, 0.605317,
+	-0.209063, -0.663393, 0.509344,
+	-0.364126, -0.200299, 0.202388,
+	-0.253475, -0.081797, 0.756541,
+	0.260471, 0.255056, -0.624378,
+	0.114248, 0.310608, -0.79807,
+	0.364663, -0.201399, 0.20685,
+	0.127847, -0.035919, 0.94707,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.381071, -0.629723, -0.350777,
+	-0.339884, -0.04115, -0.668211,
+	-0.077913, 0.258753, -0.92164,
+	0.184061, 0.101854, -0.91822,
+	-0.335166, -0.66538, -0.078623,
+	0.386561, -0.625221, -0.21687,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.241585, 0.527592, 0.669296,
+	-0.086969, 0.133224, 0.947633,
+	-0.003127, 0.28407, 0.87887,
+	-0.004433, -0.146642, 0.985872,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.138444, -0.10425, 0.945975,
+	-0.265676, 0.513366, 0.634594,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	0.247593, -0.082554, 0.75961,
+	0.07941, 0.132973, 0.948652,
+	0.238615, 0.526867, 0.672237,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.382112, -0.62406, -0.221577,
+	-0.104072, 0.177278, -0.95253,
+	0.351567, -0.042194, -0.663976,
+	0.138234, -0.293905, -0.897958,
+	0.119916, 0.17694, -0.951159,
+	-0.371322, -0.665382, -0.35362,
+	-0.263384, -0.663396, 0.466604,
+	0.376722, -0.666513, -0.219833,
+	0.387086, -0.630883, -0.346073,
+	-0.125544, 0.140012, 0.917678,
+	-0.070612, 0.036849, 0.975733,
+	-0.083497, -0.084934, 0.979607,
+	0.259286, -0.664547, 0.471281,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	0.074888, -0.085173, 0.980577,
+	0.152305, 0.125256, 0.890786,
+	0.130184, -0.104656, 0.94762,
+	-0.004249, 0.046042, 1.00324,
+	0.062419, 0.036648, 0.976547,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.392666, -0.488581, -0.427494,
+	0.230315, -0.12745, -0.884202,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	0.193434, -0.665946, -0.715325,
+	0.007865, 0.122104, -0.956137,
+	8.40779e-45, 3.00321e-39, 2.8026e-44,
+	-0.257884, -0.665381, -0.658052,
+	0.377265, -0.666513, -0.349036,
+	-0.372362, -0.665381, -0.22442,
+	0.400045, -0.489778, -0.42264,
+	-0.159174, 0.125726, 0.888878,
+	0.118369, 0.139643, 0.919173,
+	-0.124463, -0.293508, -0.899566,
+	0.21172, -0.302754, -0.843303,
+	0.149571, -0.120281, -0.957264,
+	-0.183019, -0.665378, -0.71763,
+	0.177696, 0.196424, 0.846693,
+	-0.198638, -0.302135, -0.845816,
+};
+unsigned int convexBunnyPolygons[] =
+{
+	3, 7, 2, 0,
+	3, 2, 7, 11,
+	3, 1, 15, 16,
+	3, 0, 2, 17,
+	3, 17, 9, 0,
+	3, 2, 9, 17,
+	3, 18, 9, 2,
+	3, 2, 11, 22,
+	3, 22, 15, 2,
+	3, 8, 15, 22,
+	3, 2, 15, 26,
+	3, 5, 26, 27,
+	3, 1, 14, 28,
+	3, 28, 15, 1,
+	3, 14, 15, 28,
+	3, 2, 26, 31,
+	3, 0, 9, 32,
+	3, 9, 18, 33,
+	3, 34, 14, 1,
+	3, 19, 33, 36,
+	3, 8, 22, 38,
+	3, 38, 22, 11,
+	3, 38, 15, 8,
+	3, 38, 16, 15,
+	3, 38, 30, 16,
+	3, 40, 7, 0,
+	3, 0, 25, 40,
+	3, 40, 25, 7,
+	3, 7, 25, 41,
+	3, 21, 37, 41,
+	3, 42, 15, 14,
+	3, 42, 27, 15,
+	3, 43, 26, 15,
+	3, 15, 27, 43,
+	3, 43, 27, 26,
+	3, 1, 16, 44,
+	3, 44, 29, 1,
+	3, 16, 29, 44,
+	3, 0, 32, 47,
+	3, 19, 32, 48,
+	3, 48, 33, 19,
+	3, 48, 32, 9,
+	3, 9, 33, 48,
+	3, 49, 33, 18,
+	3, 49, 18, 2,
+	3, 2, 31, 49,
+	3, 49, 26, 5,
+	3, 49, 31, 26,
+	3, 50, 42, 14,
+	3, 27, 42, 50,
+	3, 51, 35, 6,
+	3, 6, 39, 51,
+	3, 1, 29, 52,
+	3, 11, 37, 54,
+	3, 55, 23, 11,
+	3, 11, 54, 55,
+	3, 11, 23, 56,
+	3, 56, 38, 11,
+	3, 23, 38, 56,
+	3, 57, 39, 6,
+	3, 21, 41, 59,
+	3, 39, 57, 59,
+	3, 60, 37, 11,
+	3, 60, 41, 37,
+	3, 60, 11, 7,
+	3, 7, 41, 60,
+	3, 16, 30, 62,
+	3, 62, 29, 16,
+	3, 63, 38, 23,
+	3, 38, 63, 64,
+	3, 67, 25, 0,
+	3, 0, 47, 67,
+	3, 68, 36, 33,
+	3, 33, 49, 68,
+	3, 68, 49, 5,
+	3, 14, 34, 69,
+	3, 69, 50, 14,
+	3, 5, 27, 71,
+	3, 27, 50, 71,
+	3, 71, 68, 5,
+	3, 25, 51, 73,
+	3, 73, 51, 39,
+	3, 39, 59, 73,
+	3, 73, 41, 25,
+	3, 73, 59, 41,
+	3, 29, 35, 74,
+	3, 74, 52, 29,
+	3, 35, 51, 74,
+	3, 75, 34, 1,
+	3, 1, 52, 75,
+	3, 52, 74, 75,
+	3, 21, 55, 76,
+	3, 76, 54, 37,
+	3, 76, 55, 54,
+	3, 77, 55, 21,
+	3, 21, 59, 78,
+	3, 3, 77, 78,
+	3, 78, 77, 21,
+	3, 78, 57, 3,
+	3, 78, 59, 57,
+	3, 6, 35, 79,
+	3, 79, 35, 29,
+	3, 29, 62, 79,
+	3, 3, 57, 81,
+	3, 83, 62, 45,
+	3, 45, 81, 83,
+	3, 83, 79, 62,
+	3, 6, 79, 83,
+	3, 83, 57, 6,
+	3, 83, 81, 57,
+	3, 84, 63, 23,
+	3, 84, 77, 3,
+	3, 23, 55, 84,
+	3, 55, 77, 84,
+	3, 45, 63, 85,
+	3, 3, 81, 85,
+	3, 85, 81, 45,
+	3, 85, 84, 3,
+	3, 63, 84, 85,
+	3, 87, 47, 32,
+	3, 87, 72, 47,
+	3, 50, 69, 88,
+	3, 88, 34, 20,
+	3, 88, 69, 34,
+	3, 36, 68, 91,
+	3, 68, 71, 91,
+	3, 72, 87, 93,
+	3, 93, 87, 32,
+	3, 93, 32, 19,
+	3, 94, 74, 72,
+	3, 94, 93, 20,
+	3, 72, 93, 94,
+	3, 94, 75, 74,
+	3, 95, 74, 51,
+	3, 72, 74, 95,
+	3, 95, 51, 25,
+	3, 25, 67, 95,
+	3, 95, 67, 47,
+	3, 47, 72, 95,
+	3, 20, 34, 96,
+	3, 34, 75, 96,
+	3, 96, 94, 20,
+	3, 75, 94, 96,
+	3, 97, 37, 21,
+	3, 21, 76, 97,
+	3, 97, 76, 37,
+	3, 98, 64, 63,
+	3, 98, 63, 45,
+	3, 45, 82, 98,
+	3, 36, 70, 99,
+	3, 100, 88, 20,
+	3, 20, 90, 100,
+	3, 100, 90, 70,
+	3, 101, 71, 50,
+	3, 50, 88, 101,
+	3, 36, 91, 101,
+	3, 101, 91, 71,
+	3, 101, 70, 36,
+	3, 101, 100, 70,
+	3, 88, 100, 101,
+	3, 102, 90, 20,
+	3, 20, 93, 102,
+	3, 70, 90, 102,
+	3, 102, 99, 70,
+	3, 64, 98, 103,
+	3, 103, 98, 82,
+	3, 30, 38, 103,
+	3, 38, 64, 103,
+	3, 103, 62, 30,
+	3, 45, 62, 103,
+	3, 103, 82, 45,
+	3, 36, 99, 104,
+	3, 99, 102, 104,
+	3, 104, 102, 93,
+	3, 19, 36, 104,
+	3, 104, 93, 19,
+};
@@ -0,0 +1,172 @@
+# Microsoft Developer Studio Project File - Name="ou" - Package Owner=<4>
+# Microsoft Developer Studio Generated Build File, Format Version 6.00
+# ** DO NOT EDIT **
+
+# TARGTYPE "Win32 (x86) Static Library" 0x0104
+
+CFG=ou - Win32 Debug
+!MESSAGE This is not a valid makefile. To build this project using NMAKE,
+!MESSAGE use the Export Makefile command and run
+!MESSAGE 
+!MESSAGE NMAKE /f "ou.mak".
+!MESSAGE 
+!MESSAGE You can specify a configuration when running NMAKE
+!MESSAGE by defining the macro CFG on the command line. For example:
+!MESSAGE 
+!MESSAGE NMAKE /f "ou.mak" CFG="ou - Win32 Debug"
+!MESSAGE 
+!MESSAGE Possible choices for configuration are:
+!MESSAGE 
+!MESSAGE "ou - Win32 Release" (based on "Win32 (x86) Static Library")
+!MESSAGE "ou - Win32 Debug" (based on "Win32 (x86) Static Library")
+!MESSAGE 
+
+# Begin Project
+# PROP AllowPerConfigDependencies 0
+# PROP Scc_ProjName ""
+# PROP Scc_LocalPath ""
+CPP=cl.exe
+RSC=rc.exe
+
+!IF  "$(CFG)" == "ou - Win32 Release"
+
+# PROP BASE Use_MFC 0
+# PROP BASE Use_Debug_Libraries 0
+# PROP BASE Output_Dir "Release"
+# PROP BASE Intermediate_Dir "Release"
+# PROP BASE Target_Dir ""
+# PROP Use_MFC 0
+# PROP Use_Debug_Libraries 0
+# PROP Output_Dir "..\..\intermediate\vs6\Release"
+# PROP Intermediate_Dir "..\..\intermediate\vs6\Release"
+# PROP Target_Dir ""
+# ADD BASE CPP /nologo /W3 /GX /O2 /D "WIN32" /D "NDEBUG" /D "_MBCS" /D "_LIB" /YX /FD /c
+# ADD CPP /nologo /Gr /MD /W3 /Zi /O2 /Ob2 /I "..\..\include" /D "WIN32" /D "NDEBUG" /D "_MBCS" /D "_LIB" /YX /FD /c
+# ADD BASE RSC /l 0x422 /d "NDEBUG"
+# ADD RSC /l 0x422 /d "NDEBUG"
+BSC32=bscmake.exe
+# ADD BASE BSC32 /nologo
+# ADD BSC32 /nologo
+LIB32=link.exe -lib
+# ADD BASE LIB32 /nologo
+# ADD LIB32 /nologo /out:"..\..\lib\ou.lib"
+
+!ELSEIF  "$(CFG)" == "ou - Win32 Debug"
+
+# PROP BASE Use_MFC 0
+# PROP BASE Use_Debug_Libraries 1
+# PROP BASE Output_Dir "Debug"
+# PROP BASE Intermediate_Dir "Debug"
+# PROP BASE Target_Dir ""
+# PROP Use_MFC 0
+# PROP Use_Debug_Libraries 1
+# PROP Output_Dir "..\..\intermediate\vs6\Debug"
+# PROP Intermediate_Dir "..\..\intermediate\vs6\Debug"
+# PROP Target_Dir ""
+# ADD BASE CPP /nologo /W3 /Gm /GX /ZI /Od /D "WIN32" /D "_DEBUG" /D "_MBCS" /D "_LIB" /YX /FD /GZ /c
+# ADD CPP /nologo /Gz /MDd /W3 /Gm /ZI /Od /I "..\..\include" /D "WIN32" /D "_DEBUG" /D "_MBCS" /D "_LIB" /YX /FD /GZ /c
+# ADD BASE RSC /l 0x422 /d "_DEBUG"
+# ADD RSC /l 0x422 /d "_DEBUG"
+BSC32=bscmake.exe
+# ADD BASE BSC32 /nologo
+# ADD BSC32 /nologo
+LIB32=link.exe -lib
+# ADD BASE LIB32 /nologo
+# ADD LIB32 /nologo /out:"..\..\lib\ou_debug.lib"
+
+!ENDIF 
+
+# Begin Target
+
+# Name "ou - Win32 Release"
+# Name "ou - Win32 Debug"
+# Begin Group "Source Files"
+
+# PROP Default_Filter "cpp;c;cxx;rc;def;r;odl;idl;hpj;bat"
+# Begin Source File
+
+SOURCE=..\..\src\ou\atomic.cpp
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\src\ou\customization.cpp
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\src\ou\malloc.cpp
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\src\ou\threadlocalstorage.cpp
+# End Source File
+# End Group
+# Begin Group "Header Files"
+
+# PROP Default_Filter "h;hpp;hxx;hm;inl"
+# Begin Source File
+
+SOURCE=..\..\include\ou\assert.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\atomic.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\atomicflags.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\customization.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\enumarrays.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\flags.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\flagsdefines.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\inttypes.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\macros.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\malloc.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\namespace.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\platform.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\simpleflags.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\templates.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\threadlocalstorage.h
+# End Source File
+# Begin Source File
+
+SOURCE=..\..\include\ou\typewrapper.h
+# End Source File
+# End Group
+# End Target
+# End Project
@@ -13,6 +13,11 @@ protected:
     dReal lastInput; // stores the last input signal to the actuator
     dReal nextInput; // stores the current input signal to send to the actuator in the next time step
 public:
+    Actuator(){
+        this->lastInput = 0.0;
+        this->nextInput = 0.0;
+    }
+
     virtual void actuate(dReal input, dReal timeStep) =0;
 
     void actuate(dReal timeStep){
@@ -36,6 +36,10 @@ public:
         readValueFromPython<float>(this->direction, 3, "Thruster Direction");
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformDirection(this->direction, R);
+    }
+
     void actuate(dReal input, dReal dt){
         const dReal *R = dBodyGetRotation(this->body);
 
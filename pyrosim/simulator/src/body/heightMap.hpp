@@ -3,21 +3,32 @@
 
 #pragma once
 
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <vector>
+
 #include <ode/ode.h>
 
 #include "entity.hpp"
 #include "pythonReader.hpp"
 #include "geomData.hpp"
-
-// hard code here for both simulator efficiency
-// and convenience
-#define MAX_SAMPLES 50 
+#include "body/terrain.hpp"
 
 class HeightMap : public Entity{
 protected:
     dHeightfieldDataID heightMapID;
     dGeomID geom;
-    double heightData[MAX_SAMPLES * MAX_SAMPLES]; // N x M matrix
+    // N x M matrix of little endian doubles in row order. Either read
+    // into heightData or memory mapped from a file, heights points to
+    // whichever holds it. ODE references the heights without copying.
+    std::vector<double> heightData;
+    void *mappedFile;
+    size_t mappedSize;
+    const double *heights;
     int N, M;
     dReal realDim[2];
     dReal scale, thickness, offset;
@@ -26,7 +37,22 @@ protected:
     std::string spaceName;
     std::string componentName = "Body";
 public:
-    HeightMap(){};
+    HeightMap(){
+        this->heightMapID = 0;
+        this->mappedFile = NULL;
+        this->mappedSize = 0;
+        this->heights = NULL;
+    };
+
+    ~HeightMap(){
+        // geom is destroyed with its space, data has to be freed here
+        if (this->heightMapID){
+            dGeomHeightfieldDataDestroy(this->heightMapID);
+        }
+        if (this->mappedFile){
+            munmap(this->mappedFile, this->mappedSize);
+        }
+    }
 
     void readFromPython(void){
         readValueFromPython<dReal>(this->position, 3, "Position");
@@ -34,11 +60,8 @@ public:
         // read in size
         readValueFromPython<int>(&this->M, "M");
         readValueFromPython<int>(&this->N, "N");
-        
-        // read in each row and column into one array
-        readValueFromPython<double>(this->heightData,
-                                    this->N * this->M,
-                                    "Height Data");
+
+        this->readHeightsFromPython();
 
         readValueFromPython<dReal>(this->realDim, 2, "Real Dimension");
 
@@ -51,6 +74,62 @@ public:
         /// this->printMat();
     }
 
+    virtual void readHeightsFromPython(void){
+        // heights are sent as one binary blob or as the
+        // location of the data in a file to be memory mapped
+        std::string source;
+        readStringFromPython(source, "Height Source");
+        if (source == "Binary"){
+            this->heightData.resize(size_t(this->N) * this->M);
+            readBytesFromPython((char *) this->heightData.data(),
+                                this->heightData.size() * sizeof(double),
+                                "Height Data");
+            this->heights = this->heightData.data();
+        }
+        else if (source == "File"){
+            std::string fileName;
+            long fileOffset;
+            readStringFromPython(fileName, "Height File");
+            readValueFromPython<long>(&fileOffset, "Height File Offset");
+            this->mapHeightFile(fileName, fileOffset);
+        }
+        else{
+            std::cerr << "ERROR: Unknown height map source " << source
+                      << std::endl;
+            exit(0);
+        }
+    }
+
+    /**
+        Memory maps the heights from a file, only the pages touched
+        by collisions and drawing are ever read from disk
+
+        @param fileName   - path of the file
+        @param fileOffset - bytes before the heights, e.g. a .npy header
+    */
+    void mapHeightFile(std::string fileName, long fileOffset){
+        size_t dataSize = size_t(this->N) * this->M * sizeof(double);
+
+        int fd = open(fileName.c_str(), O_RDONLY);
+        struct stat fileStat;
+        if (fd < 0 || fstat(fd, &fileStat) < 0 ||
+            size_t(fileStat.st_size) < fileOffset + dataSize){
+            std::cerr << "ERROR: Cannot read " << dataSize
+                      << " bytes of heights from " << fileName << std::endl;
+            exit(0);
+        }
+
+        this->mappedSize = fileStat.st_size;
+        this->mappedFile = mmap(NULL, this->mappedSize, PROT_READ,
+                                MAP_PRIVATE, fd, 0);
+        close(fd);
+        if (this->mappedFile == MAP_FAILED){
+            std::cerr << "ERROR: Cannot memory map " << fileName << std::endl;
+            exit(0);
+        }
+        this->heights = (const double *) ((char *) this->mappedFile + fileOffset);
+    }
+
     void printMat(void){
         std::cerr << "Height Matrix" << std::endl;
         
@@ -64,14 +143,13 @@ public:
     }
 
     void create(Environment *environment){
-        std::cerr << "Creating HeightMap " << std::endl;
+        LOG_INFO("Creating HeightMap " << std::endl);
         dSpaceID space = environment->getSpace(this->spaceName);
 
         this->heightMapID = dGeomHeightfieldDataCreate (); 
-        const double *constData = this->heightData;
 
         dGeomHeightfieldDataBuildDouble(this->heightMapID,
-                                        constData,
+                                        this->heights,
                                         0,
                                         this->realDim[0],
                                         this->realDim[1],
@@ -82,10 +160,11 @@ public:
                                         this->thickness,
                                         this->wrap);
 
-        // necessary to set bounds
-        // TEMPORARY HARD CODE FOR TESTING
-        // In reality should find min/max
-        dGeomHeightfieldDataSetBounds(this->heightMapID, (dReal) -4.0, (dReal) 4.0);
+        // bounds of the aabb, scale and offset are applied by ODE
+        const double *end = this->heights + size_t(this->N) * this->M;
+        dGeomHeightfieldDataSetBounds(this->heightMapID,
+                                      (dReal) *std::min_element(this->heights, end),
+                                      (dReal) *std::max_element(this->heights, end));
 
         // create geom
         this->geom = dCreateHeightfield(space, this->heightMapID, 1);
@@ -104,15 +183,24 @@ public:
                          this->position[2]);
 
         // set user geom data
-        GeomData* geomData = new GeomData();
+        GeomData* geomData = createGeomData();
         geomData->entityID = -1;
+        geomData->collisionGroup = COLLIDE_ALWAYS;
         geomData->color[0] = 0.0;
         geomData->color[1] = 0.0;
         geomData->color[2] = 0.0;
         dGeomSetData(this->geom, static_cast<void*>(geomData));
     }
+
+    // terrain stays level, an instance only moves it
+    void transform(const dReal *offset, const dMatrix3 R){
+        for (int i=0; i<3; i++){
+            this->position[i] += offset[i];
+        }
+    }
+
     double getHeightValue(int i, int j){
-         return this->heightData[j * this->N + i];
+         return this->heights[size_t(j) * this->N + i];
        // return this->heightData[i * this->N + j];
     }
     void draw(void){
@@ -180,4 +268,34 @@ public:
     };
 };
 
+
+// height map generated in the simulator from a few parameters,
+// see terrain.hpp. Terrains are cached for later scenes of a session
+class ProceduralHeightMap : public HeightMap{
+protected:
+    TerrainHeights terrain;
+public:
+    ProceduralHeightMap(){};
+
+    virtual void readHeightsFromPython(void){
+        std::string kind;
+        int seed, octaves;
+        double frequency, persistence;
+        readStringFromPython(kind, "Kind");
+        readValueFromPython<int>(&seed, "Seed");
+        readValueFromPython<int>(&octaves, "Octaves");
+        readValueFromPython<double>(&frequency, "Frequency");
+        readValueFromPython<double>(&persistence, "Persistence");
+
+        this->terrain = getTerrain(TerrainKey(kind, seed, octaves,
+                                              this->M, this->N,
+                                              frequency, persistence));
+        if (!this->terrain){
+            std::cerr << "ERROR: Unknown terrain kind " << kind << std::endl;
+            exit(0);
+        }
+        this->heights = this->terrain->data();
+    }
+};
+
 #endif
\ No newline at end of file
@@ -30,6 +30,11 @@ public:
         readValueFromPython(&this->maxLength, "Length");
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformPoint(this->position, offset, R);
+        transformDirection(this->orientation, R);
+    }
+
     void create(Environment *environment){
         // create ray and attach to body
         this->body = (RigidBody *) environment->getEntity(this->bodyID);
@@ -37,8 +42,9 @@ public:
 
 
         // dGeomSetData(this->ray, static_cast<void*>(&this->entityID));
-        GeomData* geomData = new GeomData();
+        GeomData* geomData = createGeomData();
         geomData->entityID = this->entityID;
+        geomData->collisionGroup = COLLIDE_ALWAYS;
         geomData->color[0] = 0.0;
         geomData->color[1] = 0.0;
         geomData->color[2] = 0.0;
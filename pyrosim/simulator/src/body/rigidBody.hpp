@@ -10,23 +10,37 @@
 
 #include "entity.hpp"
 #include "rigidGeom.hpp"
+#include "triMesh.hpp"
 #include "geomData.hpp"
+#include "logger.hpp"
 
 class RigidBody : public Entity {
 public:
-    dBodyID body; // literal body object
+    dBodyID body; // literal body object, 0 if static
+    bool isStatic; // only geoms in the static space, never moved
+    dQuaternion staticQuaternion;
     int isSeen;
     std::vector<RigidGeom*> geoms; // our class of geoms
     dReal lightIntensity;
 
     std::string spaceName;
     std::string collisionGroupName;
+    int collisionGroupID;
     std::map<int, std::vector<float>> impulses;
     std::string componentName = "Body";
     RigidBody(){
         lightIntensity = 0.0f;
+        collisionGroupID = 0;
+        isStatic = false;
+        body = 0;
     };
 
+    virtual ~RigidBody(){
+        for (auto geom : this->geoms){
+            delete geom;
+        }
+    }
+
     virtual void draw(void){
         // draw center of mass as black sphere
         // const dReal *pos = dBodyGetPosition(this->body);
@@ -80,17 +94,23 @@ public:
     }
 
     const dReal* getPosition(void){
+        if (this->isStatic){
+            return dGeomGetPosition(this->geoms[0]->getGeom());
+        }
         return dBodyGetPosition(this->body);
     }
 
     const dReal* getQuaternion(void){
+        if (this->isStatic){
+            return this->staticQuaternion;
+        }
         return dBodyGetQuaternion(this->body);
     }
 
     void writeToPython(void){
-        std::cerr << "Rigid Body:" << std::endl
+        LOG_DEBUG("Rigid Body:" << std::endl
                   << "  Space     : " << this->spaceName << std::endl
-                  << "  Collision : " << this->collisionGroupName << std::endl;
+                  << "  Collision : " << this->collisionGroupName << std::endl);
 
         for (auto geom : this->geoms){
             geom->writeToPython();
@@ -98,9 +118,17 @@ public:
     }
 
     virtual void create(Environment *environment){
-        std::cerr << "Creating Rigid Body" << std::endl;
-        this->body = dBodyCreate(environment->getWorld());
+        LOG_INFO("Creating Rigid Body" << std::endl);
         this->isSeen = false;
+        this->collisionGroupID = environment->getCollisionGroupID(this->collisionGroupName);
+        if (this->lightIntensity > 0.0){
+            environment->addLightSource(this);
+        }
+        if (this->isStatic){
+            this->createStatic(environment);
+            return;
+        }
+        this->body = dBodyCreate(environment->getWorld());
         
         // if only one geom attached, create using non-offset
         // otherwise offset is necessary
@@ -113,7 +141,7 @@ public:
             // dGeomSetData(this->geoms[0]->getGeom(), static_cast<void*>(&this->collisionGroupName));
             // dGeomSetData(this->geoms[0]->getGeom(), static_cast<void*>(&this->entityID));
             // create geom data structure
-            this->geoms[0]->setData(this->entityID);
+            this->geoms[0]->setData(this->entityID, this->collisionGroupID);
 
             this->geoms[0]->setBody(this->body);
             this->geoms[0]->resetGeom();
@@ -122,6 +150,7 @@ public:
         }
         else if (this->geoms.size() > 1){
             dMass globalMass;
+            dMassSetZero(&globalMass);
             for (auto geom : this->geoms){
                 // dMass localMass;
                 geom->setSpaceName(this->spaceName);
@@ -130,7 +159,7 @@ public:
                 // set parameters after create
                 // dGeomSetData(geom->getGeom(), static_cast<void*>(&this->collisionGroupName));
                 // dGeomSetData(this->geoms[0]->getGeom(), static_cast<void*>(&this->entityID));
-                geom->setData(this->entityID);
+                geom->setData(this->entityID, this->collisionGroupID);
 
                 geom->setBody(this->body);
                 geom->resetGeomUsingOffset();
@@ -159,10 +188,35 @@ public:
         }
     };
 
+    void createStatic(Environment *environment){
+        // geoms without a body keep their global positions
+        LOG_INFO("  Static" << std::endl);
+        for (auto geom : this->geoms){
+            geom->setSpaceName("Static");
+            geom->create(environment);
+            geom->setData(this->entityID, this->collisionGroupID);
+            geom->resetGeom();
+            dGeomSetCategoryBits(geom->getGeom(), STATIC_CATEGORY);
+            dGeomSetCollideBits(geom->getGeom(), ~STATIC_CATEGORY);
+        }
+        if (this->geoms.size() > 0){
+            dGeomGetQuaternion(this->geoms[0]->getGeom(), this->staticQuaternion);
+        }
+    }
+
     virtual void readFromPython(void){
         readCollisionInfoFromPython();
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        for (auto geom : this->geoms){
+            geom->transform(offset, R);
+        }
+        for (auto &impulse : this->impulses){
+            transformDirection(impulse.second.data(), R);
+        }
+    }
+
     void readAdditionFromPython(void){
         std::string addition;
         readStringFromPython(addition, "Adding");
@@ -213,6 +267,9 @@ public:
         else if (geomName == "Sphere"){
             geom = new SphereGeom();
         }
+        else if (geomName == "TriMesh"){
+            geom = new TriMeshGeom();
+        }
         else{
             std::cerr << "Geom Name " << geomName << " not implemented" << std::endl;
             exit(0);
@@ -229,6 +286,10 @@ public:
         return this->collisionGroupName;
     }
 
+    int getCollisionGroupID(void){
+        return this->collisionGroupID;
+    }
+
     void readLightFromPython( void ){
         readValueFromPython<dReal>( &this->lightIntensity, "Light Intensity" );
     }
@@ -238,14 +299,19 @@ public:
     // }
     void takeStep(int timeStep, dReal dt){
         // apply impulse
-        if (impulses.count(timeStep) > 0){
+        std::map<int, std::vector<float>>::iterator impulse = impulses.find(timeStep);
+        if (impulse != impulses.end()){
             dBodyAddForce(this->body,
-                          impulses[timeStep][0] / dt,
-                          impulses[timeStep][1] / dt,
-                          impulses[timeStep][2] / dt);
+                          impulse->second[0] / dt,
+                          impulse->second[1] / dt,
+                          impulse->second[2] / dt);
         }
     }
 
+    virtual bool needsStep(void){
+        return this->impulses.size() > 0 && !this->isStatic;
+    }
+
     virtual EntityType getEntityType(void){
         return BODY;
     }
@@ -287,4 +353,41 @@ public:
         this->readCollisionInfoFromPython();
     }
 };
+
+class TriMeshBody: public RigidBody{
+public:
+    TriMeshBody(){}
+
+    void readFromPython(){
+        this->readNamedGeomFromPython("TriMesh");
+        this->readCollisionInfoFromPython();
+    }
+};
+
+// bodies made only of geoms in the static space, which take no
+// part in the dynamics and are never collided with each other
+class StaticBody: public RigidBody{
+public:
+    StaticBody(){ this->isStatic = true; }
+};
+
+class StaticBoxBody: public BoxBody{
+public:
+    StaticBoxBody(){ this->isStatic = true; }
+};
+
+class StaticCylinderBody: public CylinderBody{
+public:
+    StaticCylinderBody(){ this->isStatic = true; }
+};
+
+class StaticSphereBody: public SphereBody{
+public:
+    StaticSphereBody(){ this->isStatic = true; }
+};
+
+class StaticTriMeshBody: public TriMeshBody{
+public:
+    StaticTriMeshBody(){ this->isStatic = true; }
+};
 #endif
\ No newline at end of file
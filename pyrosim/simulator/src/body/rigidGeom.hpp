@@ -5,6 +5,7 @@
 
 #include "entity.hpp"
 #include "geomData.hpp"
+#include "logger.hpp"
 
 class RigidGeom : public Entity{
 public:
@@ -15,8 +16,14 @@ public:
     dReal color[3];
     std::string spaceName;
     std::string geomType;
+    // rotation of a geom of an instance of a template, which the
+    // orientation alone cannot describe
+    bool hasRotation;
+    dMatrix3 rotation;
 
 public:
+    RigidGeom(){ this->hasRotation = false; }
+
     virtual void create(Environment *environment) =0;
     virtual dMass calculateMass(void) =0;
     virtual void draw(void) =0;
@@ -32,42 +39,73 @@ public:
     void readPositionFromPython(void){readValueFromPython<dReal>(this->position, 3, "Position");}
     
     virtual void readFromPython(void){
-        std::cerr << "Reading In " << geomType << " From Python " << std::endl;
+        LOG_DEBUG("Reading In " << geomType << " From Python " << std::endl);
         this->readPositionFromPython();
         this->readOrientationFromPython();
         this->readDimensionsFromPython();
         this->readDensityFromPython();
         this->readColorFromPython();
-        std::cerr << "Completed Reading In " << geomType << std::endl;
+        LOG_DEBUG("Completed Reading In " << geomType << std::endl);
     }
 
     void setBody(dBodyID body){ dGeomSetBody(this->geom, body); }
     void setSpaceName(std::string name){this->spaceName = name;};
 
-    void setData(int entityID){
-        GeomData* geomData = new GeomData();
+    void setData(int entityID, int collisionGroup){
+        GeomData* geomData = createGeomData();
         geomData->entityID = entityID;
+        geomData->collisionGroup = collisionGroup;
         geomData->color[0] = this->color[0];
         geomData->color[1] = this->color[1];
         geomData->color[2] = this->color[2];
         dGeomSetData(this->geom, static_cast<void*>(geomData));
     }
 
+    bool pointsUp(void){
+        return ( this->orientation[0] == 0.0 and
+                 this->orientation[1] == 0.0 and
+                 this->orientation[2] == 1.0 );
+    }
+
+    void getOrientationRotation(dMatrix3 R){
+        if (this->pointsUp()){
+            dRSetIdentity(R);
+        } else{
+            dRFromZAxis(R, this->orientation[0], this->orientation[1], this->orientation[2]);
+        }
+    }
+
+    void resetRotation(void){
+        if (this->hasRotation){
+            dGeomSetRotation(this->geom, this->rotation);
+        }
+        else if (!this->pointsUp()){
+            dMatrix3 R;
+            this->getOrientationRotation(R);
+            dGeomSetRotation(this->geom, R);
+        }
+    }
+
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformPoint(this->position, offset, R);
+        if (isIdentityRotation(R)){
+            // moved only, rotated as if sent at its position
+            return;
+        }
+        dMatrix3 orientationR;
+        this->getOrientationRotation(orientationR);
+        dMultiply0_333(this->rotation, R, orientationR);
+        this->hasRotation = true;
+        transformDirection(this->orientation, R);
+    }
+
     void resetGeom(void){
         dGeomSetPosition(this->geom,
                          this->position[0],
                          this->position[1],
                          this->position[2]);
         
-        if ( this->orientation[0] == 0.0 and
-             this->orientation[1] == 0.0 and
-             this->orientation[2] == 1.0 ){
-            // pass
-        } else{
-            dMatrix3 R;
-            dRFromZAxis(R, this->orientation[0], this->orientation[1], this->orientation[2]);
-            dGeomSetRotation(this->geom, R);
-        }
+        this->resetRotation();
     }
 
     void resetGeomUsingOffset(void){
@@ -75,15 +113,7 @@ public:
                                     this->position[0],
                                     this->position[1],
                                     this->position[2]);
-        if ( this->orientation[0] == 0.0 and
-             this->orientation[1] == 0.0 and
-             this->orientation[2] == 1.0 ){
-            // pass
-        } else{
-            dMatrix3 R;
-            dRFromZAxis(R, this->orientation[0], this->orientation[1], this->orientation[2]);
-            dGeomSetRotation(this->geom, R);
-        }
+        this->resetRotation();
     }
 };
 
@@ -95,7 +125,7 @@ public:
     BoxGeom(){this->geomType = "Box";};
 
     void create(Environment *environment){
-        std::cerr << "  Creating Box Geom" << std::endl;
+        LOG_INFO("  Creating Box Geom" << std::endl);
         dSpaceID space = environment->getSpace(this->spaceName);
         this->geom = dCreateBox(space, this->sides[0], this->sides[1], this->sides[2]);
     }
@@ -117,11 +147,11 @@ public:
     void readDimensionsFromPython(void){ readValueFromPython<dReal>(this->sides, 3);}
 
     void writeToPython(void){
-        std::cerr << "  Geom Box   :" << std::endl
+        LOG_DEBUG("  Geom Box   :" << std::endl
                   << "      Position  : " << this->position[0] << ", " << this->position[1] << ", " << this->position[2] << std::endl
                   << "      Sides     : " << this->sides[0] << ", " << this->sides[1] << ", " << this->sides[2] << std::endl
                   << "      Density   : " << this->density << std::endl
-                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl;
+                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl);
     }
 };
 
@@ -133,7 +163,7 @@ public:
     CylinderGeom(){this->geomType = "Cylinder";}
 
     void create(Environment *environment){
-        std::cerr << "  Creating Cylinder Geom" << std::endl;
+        LOG_INFO("  Creating Cylinder Geom" << std::endl);
         dSpaceID space = environment->getSpace(this->spaceName);
         if (this->capped)
             this->geom = dCreateCapsule(space, this->radius, this->length);
@@ -169,13 +199,13 @@ public:
 
 
     void writeToPython(void){
-        std::cerr << "  Geom Cylinder:" << std::endl
+        LOG_DEBUG("  Geom Cylinder:" << std::endl
                   << "      Position  : " << this->position[0] << ", " << this->position[1] << ", " << this->position[2] << std::endl
                   << "      Length    : " << this->length << std::endl
                   << "      Radius    : " << this->radius << std::endl
                   << "      Capped    : " << this->capped << std::endl
                   << "      Density   : " << this->density << std::endl
-                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl;
+                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl);
     }
 };
 
@@ -185,7 +215,7 @@ public:
     SphereGeom(){this->geomType="Sphere";}
 
     void create(Environment *environment){
-        std::cerr << "Creating Sphere Geom" << std::endl;
+        LOG_INFO("Creating Sphere Geom" << std::endl);
 
         dSpaceID space = environment->getSpace(this->spaceName);
         this->geom = dCreateSphere(space, this->radius);
@@ -210,11 +240,11 @@ public:
     }
 
     void writeToPython(void){
-        std::cerr << "  Geom Sphere:" << std::endl
+        LOG_DEBUG("  Geom Sphere:" << std::endl
                   << "      Position  : " << this->position[0] << ", " << this->position[1] << ", " << this->position[2] << std::endl
                   << "      Radius    : " << this->radius << std::endl
                   << "      Density   : " << this->density << std::endl
-                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl;
+                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl);
     }
 };
 #endif
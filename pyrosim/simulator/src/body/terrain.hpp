@@ -0,0 +1,184 @@
+#ifndef _TERRAIN_HPP
+#define _TERRAIN_HPP
+
+#pragma once
+
+#include <math.h>
+#include <algorithm>
+#include <memory>
+#include <random>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+#include "recentCache.hpp"
+
+// number of generated terrains kept for later scenes of the same process
+#define TERRAIN_CACHE_SIZE 8
+
+// generator parameters: kind, seed, octaves, M, N, frequency, persistence
+typedef std::tuple<std::string, int, int, int, int, double, double> TerrainKey;
+typedef std::shared_ptr<const std::vector<double> > TerrainHeights;
+
+enum TerrainKind {PERLIN_TERRAIN, STEPS_TERRAIN, RIDGES_TERRAIN};
+
+// Seeded 2D gradient (Perlin) and cell noise
+class TerrainNoise{
+protected:
+    int perm[512];
+public:
+    TerrainNoise(int seed){
+        // permutation drawn with mt19937 directly, whose output
+        // is the same on every platform unlike std::shuffle
+        std::mt19937 rng(seed);
+        for (int i=0; i<256; i++){
+            this->perm[i] = i;
+        }
+        for (int i=255; i>0; i--){
+            std::swap(this->perm[i], this->perm[rng() % (i + 1)]);
+        }
+        for (int i=0; i<256; i++){
+            this->perm[i + 256] = this->perm[i];
+        }
+    }
+
+    int hash(int ix, int iy){
+        return this->perm[this->perm[ix & 255] + (iy & 255)];
+    }
+
+    // gradient noise, roughly in [-1, 1]
+    double gradient(double x, double y){
+        double fx = floor(x), fy = floor(y);
+        int ix = int(fx), iy = int(fy);
+        x -= fx;
+        y -= fy;
+        double u = fade(x), v = fade(y);
+
+        double n00 = grad(this->hash(ix,     iy),     x,       y);
+        double n10 = grad(this->hash(ix + 1, iy),     x - 1.0, y);
+        double n01 = grad(this->hash(ix,     iy + 1), x,       y - 1.0);
+        double n11 = grad(this->hash(ix + 1, iy + 1), x - 1.0, y - 1.0);
+
+        double nx0 = n00 + u * (n10 - n00);
+        double nx1 = n01 + u * (n11 - n01);
+        return nx0 + v * (nx1 - nx0);
+    }
+
+    // constant value in [-1, 1] per unit cell
+    double cell(double x, double y){
+        return 2.0 * this->hash(int(floor(x)), int(floor(y))) / 255.0 - 1.0;
+    }
+
+    static double fade(double t){
+        return t * t * t * (t * (t * 6.0 - 15.0) + 10.0);
+    }
+
+    static double grad(int hash, double x, double y){
+        // one of eight directions
+        switch (hash & 7){
+            case 0:  return  x + y;
+            case 1:  return -x + y;
+            case 2:  return  x - y;
+            case 3:  return -x - y;
+            case 4:  return  x;
+            case 5:  return -x;
+            case 6:  return  y;
+            default: return -y;
+        }
+    }
+};
+
+/**
+    Generates a height field of N x M samples in row order. Octaves
+    double in frequency and are weighted by persistence, the sum is
+    normalized by the total weight.
+
+    perlin : smooth hills in about [-1, 1]
+    steps  : flat blocks of random height in [-1, 1]
+    ridges : sharp ridged mountains in [0, 1]
+
+    @return False if kind is unknown
+*/
+inline bool generateTerrain(std::vector<double> &heights,
+                            const std::string &kind, int seed, int octaves,
+                            int M, int N, double frequency, double persistence){
+    TerrainKind terrainKind;
+    if      (kind == "perlin") terrainKind = PERLIN_TERRAIN;
+    else if (kind == "steps")  terrainKind = STEPS_TERRAIN;
+    else if (kind == "ridges") terrainKind = RIDGES_TERRAIN;
+    else return false;
+
+    TerrainNoise noise(seed);
+    heights.assign(size_t(N) * M, 0.0);
+
+    double totalAmplitude = 0.0;
+    double amplitude = 1.0;
+    double scale = frequency;
+    for (int octave=0; octave<octaves; octave++){
+        double xStep = scale / std::max(N - 1, 1);
+        double yStep = scale / std::max(M - 1, 1);
+
+        for (int j=0; j<M; j++){
+            double *row = &heights[size_t(j) * N];
+            for (int i=0; i<N; i++){
+                double x = i * xStep, y = j * yStep;
+                double h;
+                switch (terrainKind){
+                    case PERLIN_TERRAIN:
+                        h = noise.gradient(x, y);
+                        break;
+                    case STEPS_TERRAIN:
+                        h = noise.cell(x, y);
+                        break;
+                    case RIDGES_TERRAIN:
+                        h = 1.0 - fabs(noise.gradient(x, y));
+                        h *= h;
+                        break;
+                }
+                row[i] += amplitude * h;
+            }
+        }
+
+        totalAmplitude += amplitude;
+        amplitude *= persistence;
+        scale *= 2.0;
+    }
+
+    if (totalAmplitude > 0.0){
+        for (double &h : heights){
+            h /= totalAmplitude;
+        }
+    }
+    return true;
+}
+
+/**
+    Returns the terrain generated for the key, generating it if it is
+    not among the most recently used ones. Heights stay valid for as
+    long as they are held, even when they leave the cache.
+
+    @return NULL if the kind of terrain is unknown
+*/
+inline TerrainHeights getTerrain(const TerrainKey &key){
+    static RecentCache<TerrainKey, TerrainHeights> cache(TERRAIN_CACHE_SIZE);
+
+    TerrainHeights terrain = cache.find(key);
+    if (terrain){
+        return terrain;
+    }
+
+    std::shared_ptr<std::vector<double> > heights(new std::vector<double>);
+    if (!generateTerrain(*heights,
+                         std::get<0>(key), std::get<1>(key), std::get<2>(key),
+                         std::get<3>(key), std::get<4>(key),
+                         std::get<5>(key), std::get<6>(key))){
+        return TerrainHeights();
+    }
+
+    terrain = TerrainHeights(heights);
+    cache.add(key, terrain);
+    return terrain;
+}
+
+#endif
@@ -0,0 +1,311 @@
+#ifndef _TRIMESH_HPP
+#define _TRIMESH_HPP
+
+#pragma once
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <math.h>
+#include <algorithm>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <ode/ode.h>
+
+#include "pythonReader.hpp"
+#include "recentCache.hpp"
+#include "logger.hpp"
+#include "body/rigidGeom.hpp"
+
+// number of built meshes kept for later scenes of the same process
+#define TRIMESH_CACHE_SIZE 8
+
+// Vertices and triangles of a mesh built once into ODE's mesh data,
+// along with its bounding volume tree. Shared by every geom of the mesh
+class TriMeshData{
+protected:
+    // vertices are numVertices x 3 doubles and indices numTriangles x 3
+    // dTriIndex, memory mapped from a mesh file. ODE references them
+    // without copying.
+    void *mappedFile;
+    size_t mappedSize;
+public:
+    dTriMeshDataID meshID;
+    const double *vertices;
+    const dTriIndex *indices;
+    int numVertices, numTriangles;
+
+    TriMeshData(int numVertices, int numTriangles){
+        this->meshID = 0;
+        this->mappedFile = NULL;
+        this->mappedSize = 0;
+        this->vertices = NULL;
+        this->indices = NULL;
+        this->numVertices = numVertices;
+        this->numTriangles = numTriangles;
+    }
+
+    ~TriMeshData(){
+        // geoms are destroyed with their space before the data
+        if (this->meshID){
+            dGeomTriMeshDataDestroy(this->meshID);
+        }
+        if (this->mappedFile){
+            munmap(this->mappedFile, this->mappedSize);
+        }
+    }
+
+    /**
+        Memory maps the vertices and indices from a mesh file
+
+        @param fileName     - path of the file
+        @param vertexOffset - bytes before the vertices
+        @param indexOffset  - bytes before the indices
+    */
+    void mapFile(std::string fileName, long vertexOffset, long indexOffset){
+        size_t vertexSize = size_t(this->numVertices) * 3 * sizeof(double);
+        size_t indexSize = size_t(this->numTriangles) * 3 * sizeof(dTriIndex);
+
+        int fd = open(fileName.c_str(), O_RDONLY);
+        struct stat fileStat;
+        if (fd < 0 || fstat(fd, &fileStat) < 0 ||
+            size_t(fileStat.st_size) < vertexOffset + vertexSize ||
+            size_t(fileStat.st_size) < indexOffset + indexSize){
+            std::cerr << "ERROR: Cannot read a mesh of " << this->numVertices
+                      << " vertices and " << this->numTriangles
+                      << " triangles from " << fileName << std::endl;
+            exit(0);
+        }
+
+        this->mappedSize = fileStat.st_size;
+        this->mappedFile = mmap(NULL, this->mappedSize, PROT_READ,
+                                MAP_PRIVATE, fd, 0);
+        close(fd);
+        if (this->mappedFile == MAP_FAILED){
+            std::cerr << "ERROR: Cannot memory map " << fileName << std::endl;
+            exit(0);
+        }
+        this->vertices = (const double *) ((char *) this->mappedFile + vertexOffset);
+        this->indices = (const dTriIndex *) ((char *) this->mappedFile + indexOffset);
+    }
+
+    void build(void){
+        for (size_t i=0; i < size_t(this->numTriangles) * 3; i++){
+            if (this->indices[i] >= dTriIndex(this->numVertices)){
+                std::cerr << "ERROR: Mesh index " << this->indices[i]
+                          << " out of range of " << this->numVertices
+                          << " vertices" << std::endl;
+                exit(0);
+            }
+        }
+
+        LOG_INFO("  Building mesh of " << this->numTriangles
+                 << " triangles" << std::endl);
+        this->meshID = dGeomTriMeshDataCreate();
+        dGeomTriMeshDataBuildDouble(this->meshID,
+                                    this->vertices, 3 * sizeof(double),
+                                    this->numVertices,
+                                    this->indices, this->numTriangles * 3,
+                                    3 * sizeof(dTriIndex));
+        // edge information for smoother contacts, also done once
+        this->preprocess();
+    }
+
+    /**
+        Flags the edges and vertices of each triangle which capsules may
+        collide with, as dGeomTriMeshDataPreprocess does. Vertices of
+        concave edges are found with a table instead of scanning all
+        edges for each concave edge, which takes minutes for terrains
+        of a hundred thousand triangles
+    */
+    void preprocess(void){
+        // edge flags 0x1, 0x2, 0x4 and vertex flags 0x8, 0x10, 0x20
+        // of dxTriMeshData, by position of the vertex in the triangle
+        const unsigned char edgeFlags[3] = {0x1, 0x2, 0x4};
+        const unsigned char vertexFlags[3] = {0x8, 0x10, 0x20};
+
+        struct Edge{
+            dTriIndex vertex1, vertex2; // vertex1 < vertex2
+            int triangle;
+            int corner1, corner2; // positions of the vertices in the triangle
+            int edge;
+        };
+
+        size_t numEdges = size_t(this->numTriangles) * 3;
+        std::vector<Edge> edges(numEdges);
+        for (int t=0; t < this->numTriangles; t++){
+            for (int e=0; e < 3; e++){
+                Edge &edge = edges[size_t(t) * 3 + e];
+                edge.corner1 = e;
+                edge.corner2 = (e + 1) % 3;
+                if (this->indices[3 * t + edge.corner1] >
+                    this->indices[3 * t + edge.corner2]){
+                    std::swap(edge.corner1, edge.corner2);
+                }
+                edge.vertex1 = this->indices[3 * t + edge.corner1];
+                edge.vertex2 = this->indices[3 * t + edge.corner2];
+                edge.triangle = t;
+                edge.edge = e;
+            }
+        }
+        // edges shared by two triangles end up next to each other
+        std::sort(edges.begin(), edges.end(), [](const Edge &a, const Edge &b){
+            if (a.vertex1 != b.vertex1) return a.vertex1 < b.vertex1;
+            if (a.vertex2 != b.vertex2) return a.vertex2 < b.vertex2;
+            return a.triangle < b.triangle;
+        });
+
+        // owned and freed by ODE with the mesh data
+        unsigned char *useFlags = new unsigned char[this->numTriangles]();
+        std::vector<bool> concaveVertex(this->numVertices, false);
+
+        for (size_t i=0; i < numEdges; i++){
+            const Edge &edge = edges[i];
+            unsigned char flags = edgeFlags[edge.edge] |
+                                  vertexFlags[edge.corner1] |
+                                  vertexFlags[edge.corner2];
+            if (i + 1 < numEdges &&
+                edges[i + 1].vertex1 == edge.vertex1 &&
+                edges[i + 1].vertex2 == edge.vertex2){
+                // in single precision, as ODE does
+                float v[3][3], opposite[3];
+                for (int c=0; c < 3; c++){
+                    for (int k=0; k < 3; k++){
+                        v[c][k] = float(this->vertices[3 * this->indices[3 * edge.triangle + c] + k]);
+                    }
+                }
+                const Edge &other = edges[i + 1];
+                int oppositeCorner = 3 - other.corner1 - other.corner2;
+                for (int k=0; k < 3; k++){
+                    opposite[k] = float(this->vertices[3 * this->indices[3 * other.triangle + oppositeCorner] + k]) -
+                                  v[3 - edge.corner1 - edge.corner2][k];
+                }
+
+                float a[3] = {v[2][0] - v[1][0], v[2][1] - v[1][1], v[2][2] - v[1][2]};
+                float b[3] = {v[0][0] - v[1][0], v[0][1] - v[1][1], v[0][2] - v[1][2]};
+                float normal[3] = {a[1] * b[2] - a[2] * b[1],
+                                   a[2] * b[0] - a[0] * b[2],
+                                   a[0] * b[1] - a[1] * b[0]};
+                float normalLength = sqrtf(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]);
+                float oppositeLength = sqrtf(opposite[0] * opposite[0] + opposite[1] * opposite[1] + opposite[2] * opposite[2]);
+                float dot = normal[0] * opposite[0] + normal[1] * opposite[1] + normal[2] * opposite[2];
+                if (normalLength > 0.0f) dot /= normalLength;
+                if (oppositeLength > 0.0f) dot /= oppositeLength;
+
+                // slightly negative threshold allows for rounding errors
+                if (dot >= -0.000001f){
+                    concaveVertex[edge.vertex1] = true;
+                    concaveVertex[edge.vertex2] = true;
+                }
+                else{
+                    useFlags[edge.triangle] |= flags;
+                }
+                // the second triangle of the edge is skipped
+                i++;
+            }
+            else{
+                // boundary edge
+                useFlags[edge.triangle] |= flags;
+            }
+        }
+
+        // vertices of concave edges are not used by any triangle
+        for (int t=0; t < this->numTriangles; t++){
+            for (int c=0; c < 3; c++){
+                if (concaveVertex[this->indices[3 * t + c]]){
+                    useFlags[t] &= ~vertexFlags[c];
+                }
+            }
+        }
+        dGeomTriMeshDataSetBuffer(this->meshID, useFlags);
+    }
+};
+
+typedef std::shared_ptr<TriMeshData> TriMeshDataPtr;
+
+// the most recently built meshes by content hash
+inline RecentCache<std::string, TriMeshDataPtr> &getTriMeshCache(void){
+    static RecentCache<std::string, TriMeshDataPtr> cache(TRIMESH_CACHE_SIZE);
+    return cache;
+}
+
+class TriMeshGeom : public RigidGeom{
+protected:
+    TriMeshDataPtr mesh;
+public:
+    TriMeshGeom(){this->geomType = "TriMesh";}
+
+    void create(Environment *environment){
+        LOG_INFO("  Creating TriMesh Geom" << std::endl);
+        dSpaceID space = environment->getSpace(this->spaceName);
+        this->geom = dCreateTriMesh(space, this->mesh->meshID, 0, 0, 0);
+    }
+
+    dMass calculateMass(void){
+        // only a closed mesh has a volume
+        dMass mass;
+        dMassSetTrimesh(&mass, this->density, this->geom);
+        if (!(mass.mass > 0.0)){
+            std::cerr << "ERROR: Cannot compute the mass of an open mesh,"
+                      << " it can only be static" << std::endl;
+            exit(0);
+        }
+        // bodies are centered on their geoms, as for the other shapes
+        dMassTranslate(&mass, -mass.c[0], -mass.c[1], -mass.c[2]);
+        return mass;
+    }
+
+    void draw(void){
+        dsSetColor(this->color[0], this->color[1], this->color[2]);
+        const dReal *pos = dGeomGetPosition(this->geom);
+        const dReal *rot = dGeomGetRotation(this->geom);
+
+        const double *vertices = this->mesh->vertices;
+        const dTriIndex *indices = this->mesh->indices;
+        for (int i=0; i < this->mesh->numTriangles; i++){
+            dsDrawTriangle(pos, rot,
+                           vertices + 3 * indices[3 * i],
+                           vertices + 3 * indices[3 * i + 1],
+                           vertices + 3 * indices[3 * i + 2], 1);
+        }
+    }
+
+    void readDimensionsFromPython(void){
+        // meshes are sent with the hash of their content and the
+        // mesh file holding them, a mesh already built by this process
+        // is reused without opening its file or building it again
+        std::string hash, fileName;
+        int numVertices, numTriangles;
+        long vertexOffset, indexOffset;
+        readStringFromPython(hash, "Mesh Hash");
+        readValueFromPython<int>(&numVertices, "Vertices");
+        readValueFromPython<int>(&numTriangles, "Triangles");
+        readStringFromPython(fileName, "Mesh File");
+        readValueFromPython<long>(&vertexOffset, "Vertex Offset");
+        readValueFromPython<long>(&indexOffset, "Index Offset");
+
+        this->mesh = getTriMeshCache().find(hash);
+        if (!this->mesh){
+            this->mesh = TriMeshDataPtr(new TriMeshData(numVertices, numTriangles));
+            this->mesh->mapFile(fileName, vertexOffset, indexOffset);
+            this->mesh->build();
+            getTriMeshCache().add(hash, this->mesh);
+        }
+    }
+
+    void writeToPython(void){
+        LOG_DEBUG("  Geom TriMesh:" << std::endl
+                  << "      Position  : " << this->position[0] << ", " << this->position[1] << ", " << this->position[2] << std::endl
+                  << "      Vertices  : " << this->mesh->numVertices << std::endl
+                  << "      Triangles : " << this->mesh->numTriangles << std::endl
+                  << "      Density   : " << this->density << std::endl
+                  << "      Color     : " << this->color[0] << ", " << this->color[1] << ", " << this->color[2] << std::endl);
+    }
+};
+
+#endif
@@ -0,0 +1,33 @@
+#ifndef _DRAWING_HPP
+#define _DRAWING_HPP
+
+#pragma once
+
+#include <ode/ode.h>
+
+#ifdef HEADLESS
+// drawing compiled out, the headless simulator only plays blind
+// and does not link drawstuff, OpenGL or GLUT
+inline void dsSetColor(float, float, float){}
+inline void dsSetColorAlpha(float, float, float, float){}
+inline void dsDrawBox(const dReal *, const dReal *, const dReal *){}
+inline void dsDrawSphere(const dReal *, const dReal *, float){}
+inline void dsDrawTriangle(const dReal *, const dReal *,
+                           const dReal *, const dReal *, const dReal *, int){}
+inline void dsDrawCylinder(const dReal *, const dReal *, float, float){}
+inline void dsDrawCapsule(const dReal *, const dReal *, float, float){}
+inline void dsDrawLine(const dReal *, const dReal *){}
+#else
+#include <drawstuff/drawstuff.h>
+// drawing necessity
+#ifdef dDOUBLE
+#define dsDrawLine dsDrawLineD
+#define dsDrawBox dsDrawBoxD
+#define dsDrawSphere dsDrawSphereD
+#define dsDrawCylinder dsDrawCylinderD
+#define dsDrawCapsule dsDrawCapsuleD
+#define dsDrawTriangle dsDrawTriangleD
+#endif
+#endif
+
+#endif
@@ -3,26 +3,47 @@
 
 #pragma once
 
-#include <drawstuff/drawstuff.h>
 #include <ode/ode.h>
-// drawing necessity
-#ifdef dDOUBLE
-#define dsDrawLine dsDrawLineD
-#define dsDrawBox dsDrawBoxD
-#define dsDrawSphere dsDrawSphereD
-#define dsDrawCylinder dsDrawCylinderD
-#define dsDrawCapsule dsDrawCapsuleD
-#define dsDrawTriangle dsDrawTriangleD
-#endif
+
+#include "drawing.hpp"
 
 enum EntityType {ENTITY=0, ACTUATOR, JOINT, NEURON, SYNAPSE, BODY, SENSOR};
 
 class Environment;
 
+// global point and direction of an entity moved to an instance of a
+// template, R is the rotation of the instance and offset its position
+template<class T> inline void transformDirection(T *direction, const dMatrix3 R){
+    dReal d[3] = {direction[0], direction[1], direction[2]};
+    for (int i=0; i<3; i++){
+        direction[i] = R[4 * i] * d[0] + R[4 * i + 1] * d[1] + R[4 * i + 2] * d[2];
+    }
+}
+
+inline bool isIdentityRotation(const dMatrix3 R){
+    for (int i=0; i<3; i++){
+        for (int j=0; j<3; j++){
+            if (R[4 * i + j] != (i == j ? 1.0 : 0.0)){
+                return false;
+            }
+        }
+    }
+    return true;
+}
+
+template<class T> inline void transformPoint(T *point, const dReal *offset, const dMatrix3 R){
+    transformDirection(point, R);
+    for (int i=0; i<3; i++){
+        point[i] += offset[i];
+    }
+}
+
 class Entity{
 protected:
     int entityID;
 public:
+    virtual ~Entity(){};
+
     // addition function prototype 
     // allows extra python inputs to act on entity
     // specifically useful for adding bodies to composite body
@@ -34,10 +55,18 @@ public:
     // creates entity in environent
     virtual void create(Environment *environment) =0;
 
+    // moves the positions and directions read from python, which are
+    // global, with an instance of a template before it is created
+    virtual void transform(const dReal *offset, const dMatrix3 R){};
+
     // draws entity (may be unused)
     virtual void draw(void){};
     virtual void takeStep(int timeStep, dReal dt) {};
 
+    // false if takeStep does nothing for this entity
+    // so the environment can skip it every step
+    virtual bool needsStep(void){return true;};
+
     // writes output to cerr (may be unused)
     virtual void writeToPython(void){};
 
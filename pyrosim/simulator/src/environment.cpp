@@ -1,3 +1,5 @@
+#include <cmath>
+
 #include "environment.hpp"
 #include "pythonReader.hpp"
 
@@ -30,8 +32,15 @@ StringToEntity stringToEntityMap{
     {"Cylinder",             &createEntityInstance<CylinderBody>         }, // simple body with one cylinder
     {"Sphere",               &createEntityInstance<SphereBody>           }, // simple body with one shpere
     {"Composite",            &createEntityInstance<RigidBody>            }, // initially empty composite body
+    {"TriMesh",              &createEntityInstance<TriMeshBody>          }, // simple body with one triangle mesh
+    {"StaticBox",            &createEntityInstance<StaticBoxBody>        }, // box geom without a body
+    {"StaticCylinder",       &createEntityInstance<StaticCylinderBody>   }, // cylinder geom without a body
+    {"StaticSphere",         &createEntityInstance<StaticSphereBody>     }, // sphere geom without a body
+    {"StaticTriMesh",        &createEntityInstance<StaticTriMeshBody>    }, // triangle mesh geom without a body
+    {"StaticComposite",      &createEntityInstance<StaticBody>           }, // initially empty composite of static geoms
     {"Ray",                  &createEntityInstance<Ray>                  }, // ray geom object
     {"HeightMap",            &createEntityInstance<HeightMap>            }, // Landscape
+    {"ProceduralHeightMap",  &createEntityInstance<ProceduralHeightMap>  }, // Landscape generated from a seed
     {"HingeJoint",           &createEntityInstance<HingeJoint>           }, // Hinge joint
     {"SliderJoint",          &createEntityInstance<SliderJoint>          }, // slider joint
     {"BallAndSocketJoint",   &createEntityInstance<BallAndSocketJoint>   }, // Ball and socket Joint
@@ -73,15 +82,110 @@ Environment::Environment(dWorldID world, dSpaceID topspace, int numEntities){
         std::vector<int> vec;
         this->entityVectors.push_back(vec);
     }
+
+    this->network = NULL;
+    this->staticSpace = NULL;
+    this->recordCapacity = 0;
+
+    this->numCollisionGroups = 0;
+    this->getCollisionGroupID("Collide");
 };
 
+Environment::~Environment(){
+    // ODE objects are owned by the world and spaces,
+    // only the entity objects are freed here
+    for (auto entity : this->entities){
+        delete entity;
+    }
+    delete this->network;
+}
+
 void Environment::addCollisionPair(int firstID, int secondID){
-    std::pair<int, int> collisionPair (firstID, secondID);
-    this->collisions.push_back(collisionPair);
+    int ids[2] = {firstID, secondID};
+    for (int entityID : ids){
+        if (entityID < 0){
+            continue;
+        }
+        if (this->contactCounts[entityID] == 0){
+            this->touchedEntities.push_back(entityID);
+        }
+        this->contactCounts[entityID]++;
+    }
 }
 
 void Environment::emptyCollisionPairs(void){
-    this->collisions.clear();
+    for (int entityID : this->touchedEntities){
+        this->contactCounts[entityID] = 0;
+    }
+    this->touchedEntities.clear();
+}
+
+void Environment::addLightSource(RigidBody *body){
+    this->lightSources.push_back(body);
+    this->lightIntensities.push_back(body->lightIntensity);
+    this->lightPositions.resize(3 * this->lightSources.size());
+}
+
+void Environment::addLightSensor(LightSensor *sensor){
+    this->lightSensors.push_back(sensor);
+}
+
+void Environment::senseLight(void){
+    const int numSources = this->lightSources.size();
+    dReal *sourcePositions = this->lightPositions.data();
+    const dReal *intensities = this->lightIntensities.data();
+
+    for (int i=0; i<numSources; i++){
+        const dReal *position = this->lightSources[i]->getPosition();
+        sourcePositions[3*i + 0] = position[0];
+        sourcePositions[3*i + 1] = position[1];
+        sourcePositions[3*i + 2] = position[2];
+    }
+
+    // intensity falls off with the squared distance to each source
+    for (LightSensor *sensor : this->lightSensors){
+        const dReal *position = sensor->getBody()->getPosition();
+        dReal lightSense = 0.0;
+        for (int i=0; i<numSources; i++){
+            dReal dx = position[0] - sourcePositions[3*i + 0];
+            dReal dy = position[1] - sourcePositions[3*i + 1];
+            dReal dz = position[2] - sourcePositions[3*i + 2];
+            dReal distanceSquared = dx*dx + dy*dy + dz*dz;
+            lightSense += intensities[i] * ( 1.0 / distanceSquared );
+        }
+        sensor->setLightSense(lightSense);
+    }
+}
+
+int Environment::getCollisionGroupID(std::string name){
+    std::map<std::string, int>::iterator it = this->collisionGroupIDs.find(name);
+    if (it != this->collisionGroupIDs.end()){
+        return it->second;
+    }
+
+    // grow the collision matrix by one row and column
+    int n = this->numCollisionGroups;
+    std::vector<char> grown((n + 1) * (n + 1), false);
+    for (int i=0; i<n; i++){
+        for (int j=0; j<n; j++){
+            grown[i * (n + 1) + j] = this->collisionMatrix[i * n + j];
+        }
+    }
+    // the always colliding group collides with every group
+    grown[COLLIDE_ALWAYS * (n + 1) + n] = true;
+    grown[n * (n + 1) + COLLIDE_ALWAYS] = true;
+
+    this->collisionMatrix.swap(grown);
+    this->numCollisionGroups = n + 1;
+    this->collisionGroupIDs[name] = n;
+    return n;
+}
+
+void Environment::assignCollision(std::string firstName, std::string secondName){
+    int first = this->getCollisionGroupID(firstName);
+    int second = this->getCollisionGroupID(secondName);
+    this->collisionMatrix[first * this->numCollisionGroups + second] = true;
+    this->collisionMatrix[second * this->numCollisionGroups + first] = true;
 }
 void Environment::addToEntityFromPython(void){
     // read in ID to add to
@@ -91,9 +195,11 @@ void Environment::addToEntityFromPython(void){
     this->entities[entityID]->readAdditionFromPython();
 }
 
-void Environment::createInODE(void){
-    std::cerr << "Creating Entities In Environment" << std::endl
-              << "---------------------------" << std::endl;
+void Environment::createInODE(int evalSteps){
+    LOG_INFO("Creating Entities In Environment" << std::endl
+              << "---------------------------" << std::endl);
+    this->contactCounts.assign(this->entities.size(), 0);
+    this->touchedEntities.reserve(this->entities.size());
     for (auto entity : this->entities){
         // create entity with env data
         entity->create(this);
@@ -102,7 +208,59 @@ void Environment::createInODE(void){
     // for (auto actuator : this->actuators){
     //     actuator->create(this);
     // }
-    std::cerr << "---------------------------" << std::endl << std::endl;
+    LOG_INFO("---------------------------" << std::endl << std::endl);
+
+    // resolve entities stepped each time step once, in
+    // the order sense -> think -> act -> simulate
+    for (int sensorID : this->entityVectors[SENSOR]){
+        Sensor *sensor = (Sensor *) this->getEntity(sensorID);
+        this->stepSensors.push_back(sensor);
+        if (sensor->getWriteBack()){
+            this->recordedSensors.push_back(sensor);
+            this->recordEvery.push_back(sensor->getRecordEvery());
+        }
+        for (int op : sensor->getReducerOps()){
+            this->reducedSensors.push_back(sensor);
+            this->reducerOps.push_back(op);
+            if (op == REDUCE_MAX){
+                this->reducerValues.push_back(-dInfinity);
+            }
+            else if (op == REDUCE_MIN){
+                this->reducerValues.push_back(dInfinity);
+            }
+            else{
+                this->reducerValues.push_back(0.0);
+            }
+        }
+        for (const StopCondition &condition : sensor->getStopConditions()){
+            this->stopSensors.push_back(sensor);
+            this->stopConditions.push_back(condition);
+        }
+    }
+    // without a known number of steps the store grows as needed
+    this->reserveRecords(evalSteps > 0 ? evalSteps : 1024);
+    std::vector<Neuron*> neurons;
+    for (int neuronID : this->entityVectors[NEURON]){
+        neurons.push_back((Neuron *) this->getEntity(neuronID));
+    }
+    std::vector<Synapse*> synapses;
+    for (int synapseID : this->entityVectors[SYNAPSE]){
+        synapses.push_back((Synapse *) this->getEntity(synapseID));
+    }
+    this->network = new CTRNN();
+    this->network->compile(neurons, synapses);
+    std::vector<Entity*>* stepVectors[] = {&this->stepActuators,
+                                           &this->stepJoints,
+                                           &this->stepBodies};
+    EntityType stepTypes[] = {ACTUATOR, JOINT, BODY};
+    for (int i=0; i<3; i++){
+        for (int entityID : this->entityVectors[stepTypes[i]]){
+            Entity *entity = this->getEntity(entityID);
+            if (entity->needsStep()){
+                stepVectors[i]->push_back(entity);
+            }
+        }
+    }
 }
 
 void Environment::createSpace(std::string name){
@@ -112,10 +270,122 @@ void Environment::createSpace(std::string name){
         // add to top space
         dSpaceSetSublevel(this->subspaces[name], 1);
         dSpaceAdd(this->topspace, (dGeomID) this->subspaces[name]);
-        std::cerr << "**Created space: " << name << " **" << std::endl;
+        LOG_INFO("**Created space: " << name << " **" << std::endl);
     }
 }
 
+dSpaceID Environment::configureSpaces(int topspaceType){
+    // named spaces are geoms of the top space so
+    // are configured first, their bounds are then known
+    for (auto &nameAndSpace : this->subspaces){
+        int type = topspaceType;
+        if (this->spaceTypes.count(nameAndSpace.first) > 0){
+            type = this->spaceTypes[nameAndSpace.first];
+        }
+        nameAndSpace.second = this->configureSpace(nameAndSpace.second, type);
+    }
+    if (this->staticSpace){
+        // geoms of the static space never move and are only queried
+        // by other geoms, which a quadtree answers without a full scan
+        this->staticSpace = this->configureSpace(this->staticSpace, QUADTREE_SPACE);
+        dGeomSetCategoryBits((dGeomID) this->staticSpace, STATIC_CATEGORY);
+        dGeomSetCollideBits((dGeomID) this->staticSpace, ~STATIC_CATEGORY);
+    }
+    this->topspace = this->configureSpace(this->topspace, topspaceType);
+    return this->topspace;
+}
+
+dSpaceID Environment::configureSpace(dSpaceID space, int type){
+    // bounds of the geoms with finite bounding boxes, like all but
+    // planes, and the smallest, mean and largest of their longest sides
+    dReal bounds[6] = {dInfinity, -dInfinity, dInfinity, -dInfinity, dInfinity, -dInfinity};
+    dReal minSize = dInfinity, maxSize = 0.0, totalSize = 0.0;
+    int numFinite = 0;
+
+    int numGeoms = dSpaceGetNumGeoms(space);
+    for (int i=0; i<numGeoms; i++){
+        dReal aabb[6];
+        dGeomGetAABB(dSpaceGetGeom(space, i), aabb);
+        bool finite = true;
+        dReal size = 0.0;
+        for (int j=0; j<3; j++){
+            finite = finite && aabb[2*j] > -dInfinity && aabb[2*j+1] < dInfinity;
+            size = std::max(size, aabb[2*j+1] - aabb[2*j]);
+        }
+        if (!finite){
+            continue;
+        }
+        for (int j=0; j<3; j++){
+            bounds[2*j] = std::min(bounds[2*j], aabb[2*j]);
+            bounds[2*j+1] = std::max(bounds[2*j+1], aabb[2*j+1]);
+        }
+        if (size > 0.0){
+            minSize = std::min(minSize, size);
+            maxSize = std::max(maxSize, size);
+            totalSize += size;
+            numFinite++;
+        }
+    }
+    if (numFinite == 0){
+        // nothing to fit the space to
+        return space;
+    }
+
+    if (type == HASH_SPACE){
+        // cells of 2^level from the smallest to the largest geom,
+        // geoms larger than the largest cell are tested against all
+        int minLevel = (int) ceil(log2(minSize));
+        int maxLevel = (int) ceil(log2(maxSize));
+        dHashSpaceSetLevels(space, minLevel, maxLevel);
+        LOG_DEBUG("Hash space levels " << minLevel << " to " << maxLevel << std::endl);
+        return space;
+    }
+
+    dSpaceID converted;
+    if (type == SAP_SPACE){
+        converted = dSweepAndPruneSpaceCreate(0, dSAP_AXES_XYZ);
+    }
+    else{
+        // split in x and y down to blocks about the mean geom size,
+        // geoms found outside the bounds later stay in the root block
+        dReal meanSize = totalSize / numFinite;
+        dVector3 center, extents;
+        for (int j=0; j<3; j++){
+            center[j] = 0.5 * (bounds[2*j] + bounds[2*j+1]);
+            extents[j] = 0.5 * (bounds[2*j+1] - bounds[2*j]) + meanSize;
+        }
+        int depth = (int) ceil(log2(2.0 * std::max(extents[0], extents[1]) / meanSize));
+        depth = std::min(std::max(depth, 1), QUADTREE_MAX_DEPTH);
+        converted = dQuadTreeSpaceCreate(0, center, extents, depth);
+        LOG_DEBUG("Quadtree space depth " << depth << std::endl);
+    }
+
+    // move the geoms and take the place of the hash space
+    while (dSpaceGetNumGeoms(space) > 0){
+        dGeomID geom = dSpaceGetGeom(space, 0);
+        dSpaceRemove(space, geom);
+        dSpaceAdd(converted, geom);
+    }
+    dSpaceSetSublevel(converted, dSpaceGetSublevel(space));
+    dSpaceID parent = dGeomGetSpace((dGeomID) space);
+    if (parent){
+        dSpaceRemove(parent, (dGeomID) space);
+        dSpaceAdd(parent, (dGeomID) converted);
+    }
+    dSpaceDestroy(space);
+    return converted;
+}
+
+dSpaceID Environment::getStaticSpace(void){
+    if (this->staticSpace == NULL){
+        this->staticSpace = dHashSpaceCreate(0);
+        dSpaceSetSublevel(this->staticSpace, 1);
+        dSpaceAdd(this->topspace, (dGeomID) this->staticSpace);
+        LOG_INFO("**Created static space**" << std::endl);
+    }
+    return this->staticSpace;
+}
+
 void Environment::draw(int drawJoints, int drawSpaces){
     for (auto entity : this->entities){
         EntityType drawGroup = entity->getEntityType();
@@ -157,6 +427,9 @@ dSpaceID Environment::getSpace(std::string name){
     if (name == "None" or name == "default"){
         return this->topspace;
     }
+    if (name == "Static"){
+        return this->getStaticSpace();
+    }
     
     if (subspaces.count(name) == 0){
         this->createSpace(name);
@@ -165,6 +438,53 @@ dSpaceID Environment::getSpace(std::string name){
     return this->subspaces[name];
 }
 
+void Environment::readTemplateFromPython(void){
+    LOG_INFO("Reading Template " << this->templates.size()
+             << " From Python" << std::endl);
+    this->templates.push_back(SceneTemplate());
+    this->templates.back().readFromPython();
+}
+
+void Environment::readOverrideFromPython(void){
+    std::string name;
+    int n;
+    readStringFromPython(name, "Override");
+    readValueFromPython<int>(&n, "Number Of Values");
+    std::vector<int> ids(n);
+    std::vector<float> values(n);
+    readValueFromPython<int>(ids.data(), n, "Entity IDs");
+    readBytesFromPython((char *) values.data(), n * sizeof(float), "Values");
+
+    for (int i=0; i<n; i++){
+        if (std::isnan(values[i])){
+            continue;
+        }
+        Entity *entity = NULL;
+        if (ids[i] >= 0 && ids[i] < (int) this->entities.size()){
+            entity = this->entities[ids[i]];
+        }
+
+        if (name == "Weight" && entity && entity->getEntityType() == SYNAPSE){
+            ((Synapse *) entity)->setWeight(values[i]);
+        }
+        else if ((name == "Alpha" || name == "Tau") && entity &&
+                 entity->getEntityType() == NEURON &&
+                 (((Neuron *) entity)->getNeuronType() == HIDDEN_NEURON ||
+                  ((Neuron *) entity)->getNeuronType() == MOTOR_NEURON)){
+            TargetableNeuron *neuron = (TargetableNeuron *) entity;
+            if (name == "Alpha")
+                neuron->setAlpha(values[i]);
+            else
+                neuron->setTau(values[i]);
+        }
+        else{
+            std::cerr << "ERROR: Override " << name << " does not apply to entity "
+                      << ids[i] << std::endl;
+            exit(0);
+        }
+    }
+}
+
 void Environment::readEntityFromPython(void){
     // get name of entity
     std::string entityName;
@@ -178,11 +498,11 @@ void Environment::readEntityFromPython(void){
         exit(0);
     }
     // entity key name exists
-    std::cerr << "---------------------------" << std::endl
+    LOG_INFO("---------------------------" << std::endl
               << "Creating Entity " << entityName  
               << " From Python: " << std::endl
               << "Entity ID: " << this->entities.size()
-              << std::endl;
+              << std::endl);
 
     // create new instance of entity from map index
     // associated with entityName
@@ -198,48 +518,221 @@ void Environment::readEntityFromPython(void){
 
     // add entity to entity list
     this->entities.push_back(entity);
-    std::cerr << "---------------------------" << std::endl << std::endl;
+    LOG_INFO("---------------------------" << std::endl << std::endl);
+}
+
+void Environment::reserveRecords(int timeSteps){
+    std::vector<size_t> offsets;
+    size_t size = 0;
+    for (Sensor *sensor : this->recordedSensors){
+        offsets.push_back(size);
+        size += sensor->numRecords(timeSteps);
+    }
+
+    std::vector<float> store(size, 0.0f);
+    for (unsigned int i=0; i<this->recordOffsets.size(); i++){
+        size_t rowSize = this->recordedSensors[i]->numRecords(this->recordCapacity);
+        std::copy(this->sensorStore.begin() + this->recordOffsets[i],
+                  this->sensorStore.begin() + this->recordOffsets[i] + rowSize,
+                  store.begin() + offsets[i]);
+    }
+
+    this->sensorStore.swap(store);
+    this->recordOffsets.swap(offsets);
+    this->recordCapacity = timeSteps;
+}
+
+void Environment::recordSensors(int timeStep){
+    if (timeStep >= this->recordCapacity){
+        this->reserveRecords(2 * this->recordCapacity);
+    }
+
+    float *store = this->sensorStore.data();
+    for (unsigned int i=0; i<this->recordedSensors.size(); i++){
+        if (timeStep % this->recordEvery[i] == 0){
+            store[this->recordOffsets[i] + timeStep / this->recordEvery[i]] =
+                this->recordedSensors[i]->getSensorValue();
+        }
+    }
+}
+
+void Environment::reduceSensors(dReal dt){
+    double *values = this->reducerValues.data();
+    for (unsigned int i=0; i<this->reducedSensors.size(); i++){
+        double value = this->reducedSensors[i]->getSensorValue();
+        switch (this->reducerOps[i]){
+            case REDUCE_FINAL:
+                values[i] = value;
+                break;
+            case REDUCE_MEAN: // summed, divided when written
+                values[i] += value;
+                break;
+            case REDUCE_MAX:
+                values[i] = std::max(values[i], value);
+                break;
+            case REDUCE_MIN:
+                values[i] = std::min(values[i], value);
+                break;
+            case REDUCE_INTEGRAL:
+                values[i] += value * dt;
+                break;
+        }
+    }
+}
+
+bool Environment::stopConditionsMet(int timeStep, bool stopAll){
+    if (this->stopConditions.size() == 0){
+        return false;
+    }
+
+    for (unsigned int i=0; i<this->stopConditions.size(); i++){
+        const StopCondition &condition = this->stopConditions[i];
+        double value = this->stopSensors[i]->getSensorValue();
+
+        bool met = false;
+        if (timeStep >= condition.afterStep){
+            switch (condition.op){
+                case STOP_LESS:          met = value <  condition.threshold; break;
+                case STOP_LESS_EQUAL:    met = value <= condition.threshold; break;
+                case STOP_GREATER:       met = value >  condition.threshold; break;
+                case STOP_GREATER_EQUAL: met = value >= condition.threshold; break;
+            }
+        }
+
+        if (met && !stopAll){
+            return true;
+        }
+        if (!met && stopAll){
+            return false;
+        }
+    }
+    return stopAll;
 }
 
-void Environment::takeStepWithEntities(std::vector<int> entityIDs, int timeStep, dReal dt ){
-    // take a step with the specified entity ids
-    for (int entityID : entityIDs){
-        Entity *entity = this->getEntity(entityID);
+void Environment::takeStepWithEntities(const std::vector<Entity*> &entities, int timeStep, dReal dt ){
+    // take a step with the specified entities
+    for (Entity *entity : entities){
         entity->takeStep(timeStep, dt);
     }
 }
 
-void Environment::takeStep(int timeStep, dReal dt, int updateNetwork ){
-    // take step with relevant sensory motor entities
-    std::vector<int> sensorIDs = this->entityVectors[SENSOR];
-    std::vector<int> neuronIDs = this->entityVectors[NEURON];
-    std::vector<int> actuatorIDs = this->entityVectors[ACTUATOR];
-    std::vector<int> jointIDs = this->entityVectors[JOINT];
-    std::vector<int> bodyIDs = this->entityVectors[BODY];
+void Environment::takeStep(int timeStep, dReal dt, int updateNetwork, dReal physicsDt){
     // order is important
     // sense -> think -> act -> simulate
 
     // update sensors (sense)
-    this->takeStepWithEntities(sensorIDs, timeStep, dt);
+    if (this->lightSensors.size() > 0){
+        this->senseLight();
+    }
+    for (Sensor *sensor : this->stepSensors){
+        sensor->takeStep(timeStep, dt);
+    }
+    this->recordSensors(timeStep);
+    if (this->reducedSensors.size() > 0){
+        this->reduceSensors(dt);
+    }
 
     // only update network if updateNetwork is true
     if ( updateNetwork ){
         // update network (think)
-        // note, neurons currently need to take step twice,
-        // once to reset and once to update
-        this->takeStepWithEntities(neuronIDs, timeStep, dt);
-        this->takeStepWithEntities(neuronIDs, timeStep, dt);
+        this->network->update();
     }
 
     // update motors  (act)
-    this->takeStepWithEntities(actuatorIDs, timeStep, dt);
+    this->takeStepWithEntities(this->stepActuators, timeStep, physicsDt);
     // update other physics (simulate)
-    this->takeStepWithEntities( jointIDs, timeStep, dt );
-    this->takeStepWithEntities(bodyIDs, timeStep, dt);
+    this->takeStepWithEntities(this->stepJoints, timeStep, physicsDt);
+    this->takeStepWithEntities(this->stepBodies, timeStep, physicsDt);
 }
 
-void Environment::writeToPython(void){
+void Environment::takeSubstep(int timeStep, dReal physicsDt){
+    // the network is not updated, actuators hold its last output
+    this->takeStepWithEntities(this->stepActuators, timeStep, physicsDt);
+    this->takeStepWithEntities(this->stepJoints, timeStep, physicsDt);
+}
+
+void Environment::writeToPython(int timeSteps){
     for (auto entity : this->entities){
         entity->writeToPython();
     }
+
+    std::cout << timeSteps << " " << this->recordedSensors.size();
+    for (unsigned int i=0; i<this->recordedSensors.size(); i++){
+        Sensor *sensor = this->recordedSensors[i];
+        int numRecords = sensor->numRecords(timeSteps);
+        std::cout << " " << sensor->getID() << " " << numRecords;
+
+        const float *values = &this->sensorStore[this->recordOffsets[i]];
+        for (int r=0; r<numRecords; r++){
+            std::cout << " " << values[r];
+        }
+    }
+
+    std::vector<double> reduced = this->getReducedValues(timeSteps);
+    std::cout << " " << reduced.size();
+    std::streamsize precision = std::cout.precision(17);
+    for (unsigned int i=0; i<reduced.size(); i++){
+        std::cout << " " << this->reducedSensors[i]->getID()
+                  << " " << this->reducerOps[i]
+                  << " " << reduced[i];
+    }
+    std::cout.precision(precision);
+}
+
+std::vector<double> Environment::getReducedValues(int timeSteps){
+    std::vector<double> reduced(this->reducerValues);
+    for (unsigned int i=0; i<reduced.size(); i++){
+        if (this->reducerOps[i] == REDUCE_MEAN){
+            reduced[i] /= timeSteps;
+        }
+    }
+    return reduced;
+}
+
+void Environment::writeBinaryToPython(int timeSteps){
+    // header is padded so the values start on an 8 byte boundary
+    std::vector<int32_t> header;
+    header.push_back(timeSteps);
+    header.push_back(this->recordedSensors.size());
+    for (auto sensor : this->recordedSensors){
+        header.push_back(sensor->getID());
+    }
+    for (auto sensor : this->recordedSensors){
+        header.push_back(sensor->numRecords(timeSteps));
+    }
+    if (header.size() % 2 == 1){
+        header.push_back(0);
+    }
+    std::cout.write(reinterpret_cast<const char*>(header.data()),
+                    header.size() * sizeof(int32_t));
+
+    size_t numValues = 0;
+    for (unsigned int i=0; i<this->recordedSensors.size(); i++){
+        int numRecords = this->recordedSensors[i]->numRecords(timeSteps);
+        numValues += numRecords;
+        const float *values = &this->sensorStore[this->recordOffsets[i]];
+        std::cout.write(reinterpret_cast<const char*>(values),
+                        numRecords * sizeof(float));
+    }
+    if (numValues % 2 == 1){
+        const float padding = 0.0f;
+        std::cout.write(reinterpret_cast<const char*>(&padding), sizeof(float));
+    }
+
+    std::vector<int32_t> reducerHeader;
+    reducerHeader.push_back(this->reducedSensors.size());
+    reducerHeader.push_back(0);
+    for (auto sensor : this->reducedSensors){
+        reducerHeader.push_back(sensor->getID());
+    }
+    for (int op : this->reducerOps){
+        reducerHeader.push_back(op);
+    }
+    std::cout.write(reinterpret_cast<const char*>(reducerHeader.data()),
+                    reducerHeader.size() * sizeof(int32_t));
+
+    std::vector<double> reduced = this->getReducedValues(timeSteps);
+    std::cout.write(reinterpret_cast<const char*>(reduced.data()),
+                    reduced.size() * sizeof(double));
+    std::cout.flush();
 }
\ No newline at end of file
@@ -4,17 +4,33 @@
 #pragma once
 
 // standard
+#include <algorithm>
 #include <iostream>
 #include <string>
 #include <vector>
 #include <map>
 #include <utility>
+#include <stdint.h>
 
 // ode
 #include <ode/ode.h>
 
 // local
 #include "entity.hpp"
+#include "geomData.hpp"
+#include "sceneTemplate.hpp"
+
+// broadphase collision spaces
+enum CollisionSpace {HASH_SPACE=0, SAP_SPACE, QUADTREE_SPACE};
+
+// deepest quadtree built by configureSpaces, 4^depth leaf blocks
+#define QUADTREE_MAX_DEPTH 8
+
+class CTRNN;
+class LightSensor;
+class RigidBody;
+class Sensor;
+struct StopCondition;
 
 class Environment{
 public:
@@ -22,12 +38,67 @@ public:
     dSpaceID topspace;
     // useful to split this into seperate maps
     std::vector<Entity*> entities; // general entities (bodies, joints, etc)
+    std::vector<SceneTemplate> templates; // groups of entities instantiated by python
 
     // ENTITY, ACTUATOR, JOINT, NEURON, SYNAPSE, BODY, SENSOR
     std::vector< std::vector<int> > entityVectors;
 
+    // entities which need to take a step, built once in createInODE
+    // so stepping does not look up entities or allocate
+    std::vector<Sensor*> stepSensors;
+    CTRNN *network; // neurons and synapses compiled into one network
+
+    // bodies emitting light and the sensors sensing it, registered when
+    // created. Source positions are gathered once per step into
+    // lightPositions, x y z per source
+    std::vector<RigidBody*> lightSources;
+    std::vector<dReal> lightIntensities;
+    std::vector<dReal> lightPositions;
+    std::vector<LightSensor*> lightSensors;
+
+    // values of write back sensors in one buffer preallocated in
+    // createInODE. Row i holds the values of recordedSensors[i]
+    // recorded every recordEvery[i] steps and starts at recordOffsets[i].
+    // Rows have room for recordCapacity time steps
+    std::vector<float> sensorStore;
+    std::vector<Sensor*> recordedSensors;
+    std::vector<int> recordEvery;
+    std::vector<size_t> recordOffsets;
+    int recordCapacity;
+
+    // running statistics of sensors reduced to a single value,
+    // one entry per reducer. Updated every step whether or not
+    // the sensor records values
+    std::vector<Sensor*> reducedSensors;
+    std::vector<int> reducerOps;
+    std::vector<double> reducerValues;
+
+    // conditions on sensor values which end the simulation early
+    std::vector<Sensor*> stopSensors;
+    std::vector<StopCondition> stopConditions;
+
+    std::vector<Entity*> stepActuators;
+    std::vector<Entity*> stepJoints;
+    std::vector<Entity*> stepBodies;
+
     std::map<std::string, dSpaceID> subspaces;
-    std::vector< std::pair <int, int> > collisions;
+    // collision space types of named spaces, see CollisionSpace.
+    // Spaces not named here have the type of the top space
+    std::map<std::string, int> spaceTypes;
+    // space of the geoms of static bodies, created when first used.
+    // It is never collided with itself
+    dSpaceID staticSpace;
+    // number of geom pairs each entity is in contact with, indexed by
+    // entity id, and the entities with a non zero count this step
+    std::vector<int> contactCounts;
+    std::vector<int> touchedEntities;
+
+    // collision group names interned to ids and a flattened
+    // numCollisionGroups x numCollisionGroups matrix of which
+    // groups collide
+    std::map<std::string, int> collisionGroupIDs;
+    int numCollisionGroups;
+    std::vector<char> collisionMatrix;
 
     Environment(dWorldID world, dSpaceID topspace, int numEntities = 50);
     ~Environment();
@@ -38,21 +109,102 @@ public:
     void addToEntityFromPython(void);
 
     /**
-        Adds a collision pair between groups to the `collisions` map
+        Records a contact between two entities. Called once for
+        each pair of colliding geoms, ids of -1 are ignored
 
-        @param firstID  - the id of the first group
-        @param secondID - the id of the second collision group
+        @param firstID  - the id of the first entity
+        @param secondID - the id of the second entity
     */
     void addCollisionPair(int firstID, int secondID);
 
-    // Clears all collision pairs
+    // Registers a body emitting light
+    void addLightSource(RigidBody *body);
+
+    // Registers a light sensor to be updated by senseLight
+    void addLightSensor(LightSensor *sensor);
+
+    /**
+        Resizes the sensor store to hold the values of timeSteps
+        time steps, keeping values already recorded
+
+        @param timeSteps - the number of time steps to make room for
+    */
+    void reserveRecords(int timeSteps);
+
+    // Copies the values of write back sensors into the sensor store
+    void recordSensors(int timeStep);
+
+    // Updates the statistics of reduced sensors
+    void reduceSensors(dReal dt);
+
+    /**
+        Checks the stop conditions against the values sensed this step
+
+        @param timeStep - the current time step
+        @param stopAll  - If true, all conditions have to be met,
+                          otherwise any one of them
+        @return True if the simulation should stop
+    */
+    bool stopConditionsMet(int timeStep, bool stopAll);
+
+    // Returns the value of each reducer after timeSteps steps
+    std::vector<double> getReducedValues(int timeSteps);
+
+    // Computes the light sensed by every light sensor in one pass
+    void senseLight(void);
+
+    // Returns true if the entity was in contact during the last collision step
+    bool isTouching(int entityID){
+        return this->contactCounts[entityID] > 0;
+    };
+
+    // Clears all contacts, in the number of touched entities
     void emptyCollisionPairs(void);
+
+    /**
+        Gets the id of a collision group, interning the name
+        the first time it is seen. The "Collide" group is always
+        id COLLIDE_ALWAYS and collides with every group.
+
+        @param name - the name of the collision group
+        @return The id of the group
+    */
+    int getCollisionGroupID(std::string name);
+
+    /**
+        Specifies that members of two collision groups should collide
+
+        @param firstName  - the name of the first group
+        @param secondName - the name of the second group
+    */
+    void assignCollision(std::string firstName, std::string secondName);
+
+    // Returns true if members of the two collision groups collide
+    bool groupsCollide(int firstGroup, int secondGroup){
+        return this->collisionMatrix[firstGroup * this->numCollisionGroups + secondGroup];
+    };
     
     // Reads an entities contents from python
     void readEntityFromPython(void);
 
-    // create entities in simualiton
-    void createInODE(void);
+    // Reads a template of entities from python, see sceneTemplate.hpp
+    void readTemplateFromPython(void);
+
+    /**
+        Reads values replacing the synapse weights or the alpha or tau
+        of neurons sent before. The entity ids are followed by packed
+        float32 values, a NaN value keeps the value sent with the entity
+    */
+    void readOverrideFromPython(void);
+
+    /**
+        Create entities in simulation and build the arrays
+        of entities stepped by takeStep
+
+        @param evalSteps - the number of steps to preallocate sensor
+                           storage for, non positive if unknown
+    */
+    void createInODE(int evalSteps);
 
     /**
         Draws entities to graphics window
@@ -80,6 +232,47 @@ public:
     */
     void createSpace(std::string name);
 
+    /**
+        Gets the space of static bodies, named "Static", creating it
+        in the top space when first used
+
+        @return The static space
+    */
+    dSpaceID getStaticSpace(void);
+
+    /**
+        Sets the type of collision space a named space becomes
+        in configureSpaces
+
+        @param name - the name of the space
+        @param type - the CollisionSpace type
+    */
+    void setSpaceType(std::string name, int type){
+        this->spaceTypes[name] = type;
+    };
+
+    /**
+        Turns the top space and the named spaces into the requested
+        types of collision space once all geoms are created. Spaces are
+        created as hash spaces, whose levels are then fit to the sizes
+        of their geoms. Sweep and prune and quadtree spaces are built over
+        the bounds of the geoms and replace the hash space.
+
+        @param topspaceType - the CollisionSpace type of the top space
+                              and of named spaces without a type
+        @return The top space, which may have been replaced
+    */
+    dSpaceID configureSpaces(int topspaceType);
+
+    /**
+        Configures a single space, see configureSpaces
+
+        @param space - the hash space holding the geoms
+        @param type  - the CollisionSpace type
+        @return The configured space, either space or its replacement
+    */
+    dSpaceID configureSpace(dSpaceID space, int type);
+
     // Returns entity with id i
     Entity* getEntity(int i);
 
@@ -89,20 +282,52 @@ public:
         @param timeStep      - the current time step
         @param dt            - the space between steps
         @param updateNetwork - whether or not to update network during step
+        @param physicsDt     - the length of the first physics substep
     */      
-    void takeStep(int timeStep, dReal dt, int updateNetwork);
+    void takeStep(int timeStep, dReal dt, int updateNetwork, dReal physicsDt);
 
     /**
-        Take a step with the specified entities
+        Applies the forces of actuators and joints again before each
+        physics substep after the first, since every world step clears
+        them. Bodies only apply their impulses in takeStep.
 
-        @param entityIDs - the entities to step with
         @param timeStep  - the current time step
-        @param dt        - the space between steps
+        @param physicsDt - the length of the substep
     */
-    void takeStepWithEntities(std::vector<int> entityIDs, int timeStep, dReal dt);
+    void takeSubstep(int timeStep, dReal physicsDt);
+
+    /**
+        Take a step with the specified entities
+
+        @param entities - the entities to step with
+        @param timeStep - the current time step
+        @param dt       - the space between steps
+    */
+    void takeStepWithEntities(const std::vector<Entity*> &entities, int timeStep, dReal dt);
     
-    // write entities to python
-    void writeToPython(void);
+    /**
+        Write sensor data to python as text. The time steps and the
+        number of sensors are followed by the id, the number of values
+        and the values of each sensor. Then the number of reducers is
+        followed by the sensor id, op and value of each reducer
+
+        @param timeSteps - the number of time steps simulated
+    */
+    void writeToPython(int timeSteps);
+
+    /**
+        Write sensor data to python as a packed binary block.
+        The block starts with a header of int32 values (time steps,
+        number of sensors, sensor ids, number of values of each sensor,
+        padded to a multiple of 8 bytes) followed by the values of each
+        sensor, padded to 8 bytes. Reducers follow with an int32 header
+        (number of reducers, padding, the sensor id and the op of each
+        reducer) and a float64 value each. Values are written in host
+        byte order which python reads as little-endian.
+
+        @param timeSteps - the number of time steps simulated
+    */
+    void writeBinaryToPython(int timeSteps);
 
 };
 
@@ -3,9 +3,40 @@
 
 #pragma once
 
+#include <vector>
+
+// collision group id of geoms which collide with everything,
+// interned by the environment for the "Collide" group name
+const int COLLIDE_ALWAYS = 0;
+
+// category bit of geoms which never move, the ground and static
+// bodies. They collide with everything but each other
+const unsigned long STATIC_CATEGORY = 1;
+
 struct GeomData{
     int entityID;
+    int collisionGroup; // interned collision group id, see Environment
     float color[3];
 };
 
+// user data of every geom of the scene. Freed together when the scene
+// is torn down, quadtree spaces cannot list the geoms they hold
+inline std::vector<GeomData*> &getAllGeomData(void){
+    static std::vector<GeomData*> allGeomData;
+    return allGeomData;
+}
+
+inline GeomData* createGeomData(void){
+    GeomData* geomData = new GeomData();
+    getAllGeomData().push_back(geomData);
+    return geomData;
+}
+
+inline void destroyAllGeomData(void){
+    for (auto geomData : getAllGeomData()){
+        delete geomData;
+    }
+    getAllGeomData().clear();
+}
+
 #endif
\ No newline at end of file
@@ -58,6 +58,10 @@ public:
         return this->joint;
     }
 
+    virtual bool needsStep(void){
+        return false;
+    }
+
     virtual EntityType getEntityType(void){
         return JOINT;
     }
@@ -82,6 +86,11 @@ public:
         this->readStopsFromPython();
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformPoint(this->anchor, offset, R);
+        transformDirection(this->axis, R);
+    }
+
     void create(Environment *environment){
         this->setBodies(environment);
         this->joint = dJointCreateHinge(environment->getWorld(), 0);
@@ -151,6 +160,10 @@ public:
         this->readStopsFromPython();
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformDirection(this->axis, R);
+    }
+
     void create(Environment *environment){
         this->setBodies(environment);
         this->joint = dJointCreateSlider(environment->getWorld(), 0);
@@ -237,6 +250,10 @@ public:
         readValueFromPython<dReal>(this->anchor, 3, "Ball and Socket Anchor");
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformPoint(this->anchor, offset, R);
+    }
+
     void create(Environment *environment){
         this->setBodies(environment);
         this->joint = dJointCreateBall(environment->getWorld(), 0);
@@ -282,6 +299,12 @@ public:
         readValueFromPython<dReal>(this->axis2, 3, "Universal Axis 2 Added");
     }
 
+    void transform(const dReal *offset, const dMatrix3 R){
+        transformPoint(this->anchor, offset, R);
+        transformDirection(this->axis1, R);
+        transformDirection(this->axis2, R);
+    }
+
     void create(Environment *environment){
         this->setBodies(environment);
         this->joint = dJointCreateUniversal(environment->getWorld(), 0);
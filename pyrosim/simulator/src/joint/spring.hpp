@@ -128,7 +128,7 @@ public:
     void create( Environment *environment ){
         // linear spring joint uses a slider joint to
         // maintain rotational relationship between bodies
-        std::cerr << "Creating Linear Spring" << std::endl;
+        LOG_INFO("Creating Linear Spring" << std::endl);
         this->setBodies( environment );
 
         // create slider joint connecting bodies
@@ -200,7 +200,7 @@ public:
     HingeSpringJoint(){};
 
     void create( Environment *environment ){
-        std::cerr << "Creating Hinge Spring" << std::endl;
+        LOG_INFO("Creating Hinge Spring" << std::endl);
         this->setBodies( environment );
 
         // create slider joint connecting bodies
@@ -231,6 +231,11 @@ public:
         readValueFromPython<float>( &this->damping, "Damping" );
     }
 
+    void transform( const dReal *offset, const dMatrix3 R ){
+        transformDirection( this->axis1, R );
+        transformDirection( this->axis2, R );
+    }
+
     void takeStep( int timeStep, dReal dt ){
         // maintain straightness
         dReal angle1, angle2;
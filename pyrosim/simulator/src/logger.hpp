@@ -0,0 +1,24 @@
+#ifndef _LOGGER_HPP
+#define _LOGGER_HPP
+
+#pragma once
+
+#include <iostream>
+
+// verbosity of the simulator's stderr output
+// set with the -loglevel command line argument
+enum LogLevel {LOG_LEVEL_QUIET=0, LOG_LEVEL_INFO, LOG_LEVEL_DEBUG};
+
+// current log level, defined in simulator.cpp
+extern int logLevel;
+
+// the streamed expression is only evaluated when the level is enabled
+// so disabled logging costs a single comparison, even in per step code.
+// Errors are always written to std::cerr directly.
+#define LOG_INFO(message) \
+    do { if (logLevel >= LOG_LEVEL_INFO){ std::cerr << message; } } while (0)
+
+#define LOG_DEBUG(message) \
+    do { if (logLevel >= LOG_LEVEL_DEBUG){ std::cerr << message; } } while (0)
+
+#endif
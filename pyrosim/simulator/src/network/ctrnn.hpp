@@ -4,6 +4,10 @@
 #pragma once
 
 #include <math.h>
+#include <algorithm>
+#include <cmath>
+#include <map>
+#include <utility>
 #include <vector>
 
 #include "entity.hpp"
@@ -11,38 +15,28 @@
 #include "actuator/actuator.hpp"
 #include "sensor/sensor.hpp"
 
-class Synapse;
+// BIAS, SENSOR, USER neurons are inputs, HIDDEN, MOTOR are targetable
+enum NeuronType {BIAS_NEURON=0, SENSOR_NEURON, USER_NEURON, HIDDEN_NEURON, MOTOR_NEURON};
 
+// Neuron and synapse entities only hold what is read from python.
+// The network is stepped by the CTRNN they are compiled into.
 class Neuron : public Entity
 {
 protected:
-    int lastUpdated;
-    std::vector<Synapse *> outSynapses;
     float value;
-    float cachedValue;
 public:
-    virtual void addSynapticInput(float inputValue, float weight) {};
-    virtual void readFromPython(void) =0;
-    virtual void create(Environment *environment) =0;
-
-    virtual void addSynapse(Synapse *synapse){
-        // adds synapse to vector of synapses
-        this->outSynapses.push_back(synapse);
+    Neuron(){
+        this->value = 0.0f;
     }
 
-    virtual void takeStep(int timeStep, dReal dt){
-        if (this->lastUpdated != timeStep){
-            this->fireStep();
-            this->lastUpdated = timeStep;
-        }
-        else{
-            this->updateStep();
-        }
-    }
+    virtual void readFromPython(void) =0;
+    virtual void create(Environment *environment) =0;
 
     virtual EntityType getEntityType(void){return NEURON;};
-    virtual void fireStep() =0;
-    virtual void updateStep() =0;
+    virtual NeuronType getNeuronType(void) =0;
+
+    // value of the neuron when the simulation starts
+    float getValue(void){ return this->value; }
 };
 
 
@@ -62,32 +56,23 @@ public:
     }
 
     void create(Environment *environment){
-        // add to source neuron
         this->sourceNeuron = (Neuron *) environment->getEntity(this->sourceNeuronID);
         this->targetNeuron = (Neuron *) environment->getEntity(this->targetNeuronID);
-        this->sourceNeuron->addSynapse(this);
     }
 
     virtual EntityType getEntityType(void){return SYNAPSE;};
     Neuron* getSourceNeuron(void){ return this->sourceNeuron;}
     Neuron* getTargetNeuron(void){ return this->targetNeuron;}
     float getWeight(void){ return this->weight;}
+    void setWeight(float weight){ this->weight = weight;}
 };
 
 // INPUT NEURONS ---- Bias, Sensor, User --------------------------
 class InputNeuron : public Neuron
 {
 public:
-    virtual void create(Environment* environment) {this->lastUpdated=-1;};
-    virtual void fire(){
-        for (Synapse* synapse : this->outSynapses){
-            Neuron* targetNeuron = synapse->getTargetNeuron();
-            targetNeuron->addSynapticInput(this->value, synapse->getWeight()); 
-        }
-    }
-    virtual void fireStep(){ this->fire(); }
+    virtual void create(Environment* environment) {};
     virtual void readFromPython(void) =0;
-    virtual void updateStep()=0;
 };
 
 
@@ -98,7 +83,7 @@ public:
     virtual void readFromPython(void){
         readValueFromPython(&this->value, "Bias Value");
     }
-    virtual void updateStep(){cachedValue = 0.0f; };
+    virtual NeuronType getNeuronType(void){ return BIAS_NEURON; }
 };
 
 class SensorNeuron : public InputNeuron
@@ -108,20 +93,18 @@ protected:
     int sensorID;
 public:
     SensorNeuron(){};
-    virtual void updateStep(){
-        cachedValue = 0.0f;
-        this->value = this->sensor->getSensorValue();
-    }
 
     virtual void create(Environment *environment){
         sensor = (Sensor *) environment->getEntity(this->sensorID);
-        this->lastUpdated = -1;
     }
 
     virtual void readFromPython(){
         // read in motor's entity ID
         readValueFromPython<int>(&sensorID, "Sensor ID");
     }
+
+    virtual NeuronType getNeuronType(void){ return SENSOR_NEURON; }
+    Sensor* getSensor(void){ return this->sensor; }
 };
 
 
@@ -137,22 +120,20 @@ public:
         int n;
         readValueFromPython<int>(&n, "Size of Input");
 
-        // create array to store input
-        float inValues[n];
-        readValueFromPython<float>(inValues, n, "Value Inputs");
-
-        for (int i=0; i<n; i++){
-            this->inputValues.push_back(inValues[i]);
-        }
+        // read input directly into storage
+        this->inputValues.resize(n);
+        readValueFromPython<float>(this->inputValues.data(), n, "Value Inputs");
         this->indexValue = 0;
     }
-    virtual void updateStep(){
-        this->cachedValue = 0.0f;
-        // set value from inputValues
-        this->value = this->inputValues[this->indexValue];
-        // set next index value
+
+    virtual NeuronType getNeuronType(void){ return USER_NEURON; }
+
+    float nextInputValue(void){
+        // get value from inputValues and move to the next one
+        float nextValue = this->inputValues[this->indexValue];
         this->indexValue = (this->indexValue + 1) % this->inputValues.size();
-    };
+        return nextValue;
+    }
 };
 
 
@@ -160,50 +141,20 @@ public:
 class TargetableNeuron : public Neuron
 {
 protected:
-    float lastValue;
-    float cachedValue;
     float alpha, tau;
     float startingValue;
 public:
-    virtual void addSynapticInput(float neuronValue, float weight){
-        // sets cached value to the sum of the synaptic weight multiplied
-        // by source neuron value
-        this->cachedValue += neuronValue * weight;
-    }
-
-    void updateNeuronFromCache(){
-        // ctrnn update. then reset cache
-        this->value = this->alpha * this->value + this->tau * this->cachedValue;
-        this->cachedValue = 0.0f;
-    }
-
     void readParamsFromPython(){
         // read in necessary params for CTRNN neurons
         readValueFromPython<float>(&this->alpha, "Alpha");
         readValueFromPython<float>(&this->tau, "Tau");
         readValueFromPython<float>(&this->startingValue, "Starting Value");
     }
-    virtual void threshold(){
-        // use tanh to threshold
-        this->value = tanh(this->value);
-    }
 
-    virtual void fire(){
-        // loop through synapse and update cach
-        for (Synapse* synapse : this->outSynapses){
-            Neuron* targetNeuron = synapse->getTargetNeuron();
-            targetNeuron->addSynapticInput(this->value, synapse->getWeight()); 
-        }
-    }
-
-    virtual void fireStep(){
-        this->fire();
-    }
-
-    virtual void updateStep(){
-        this->updateNeuronFromCache();
-        this->threshold();
-    }
+    float getAlpha(void){ return this->alpha; }
+    float getTau(void){ return this->tau; }
+    void setAlpha(float alpha){ this->alpha = alpha; }
+    void setTau(float tau){ this->tau = tau; }
 };
 
 
@@ -213,12 +164,11 @@ public:
     HiddenNeuron(){};
     virtual void create(Environment *environment){
         this->value = 0.0;
-        this->cachedValue = 0.0;
-        this->lastUpdated = -1;
     }
     virtual void readFromPython(){
         this->readParamsFromPython();
     }
+    virtual NeuronType getNeuronType(void){ return HIDDEN_NEURON; }
 };
 
 
@@ -230,17 +180,9 @@ protected:
 public:
     MotorNeuron(){};
 
-    virtual void updateStep(){
-        this->updateNeuronFromCache();
-        this->threshold();
-        motor->setNextInput(this->value);
-    }
-
     virtual void create(Environment *environment){
         motor = (Actuator *) environment->getEntity(this->motorID);
         this->value = 0.0;
-        this->cachedValue = 0.0;
-        this->lastUpdated = -1;
     }
 
     virtual void readFromPython(){
@@ -249,6 +191,215 @@ public:
         // read in params
         this->readParamsFromPython();
     }
+
+    virtual NeuronType getNeuronType(void){ return MOTOR_NEURON; }
+    Actuator* getMotor(void){ return this->motor; }
+};
+
+
+// Compiled Network ----------------------------------------------
+class CTRNN
+{
+protected:
+    // value of every neuron, in entity order
+    int numNeurons;
+    std::vector<float> values;
+
+    // per targetable (hidden and motor) neuron
+    int numTargetable;
+    std::vector<int> targetColumns;
+    std::vector<float> alpha, tau;
+    std::vector<float> synapticInput;
+
+    // weights of synapses into targetable neurons. A row per
+    // targetable neuron, a column per neuron. Always stored in
+    // compressed sparse row form, and also dense if that is faster.
+    // The dense product multiplies the zero weight of every missing
+    // synapse too, which turns a non finite value into nan in every
+    // row, so updates with a non finite value use the sparse form
+    bool isDense;
+    std::vector<float> denseWeights;
+    std::vector<int> rowStarts;
+    std::vector<int> columns;
+    std::vector<float> sparseWeights;
+
+    // where input neurons get their values from
+    std::vector<int> sensorColumns;
+    std::vector<Sensor*> sensors;
+    std::vector<int> userColumns;
+    std::vector<UserNeuron*> users;
+
+    // where motor neurons send their values
+    std::vector<int> motorRows;
+    std::vector<Actuator*> motors;
+
+public:
+    CTRNN(){
+        this->numNeurons = 0;
+        this->numTargetable = 0;
+        this->isDense = false;
+    };
+
+    /**
+        Builds the network from created neuron and synapse entities.
+        Synapses into input neurons have no effect and are dropped.
+
+        Synaptic input is summed in the same order as when neurons fired
+        into each other one at a time, by source neuron then synapse, so
+        results are identical to stepping the neurons individually.
+
+        @param neurons  - the neurons of the network
+        @param synapses - the synapses between them
+    */
+    void compile(const std::vector<Neuron*> &neurons, const std::vector<Synapse*> &synapses){
+        this->numNeurons = neurons.size();
+
+        std::map<Neuron*, int> columnOf;
+        std::map<Neuron*, int> rowOf;
+        for (int i=0; i<this->numNeurons; i++){
+            Neuron *neuron = neurons[i];
+            columnOf[neuron] = i;
+            this->values.push_back(neuron->getValue());
+
+            switch (neuron->getNeuronType()){
+                case HIDDEN_NEURON:
+                case MOTOR_NEURON:
+                    rowOf[neuron] = this->targetColumns.size();
+                    if (neuron->getNeuronType() == MOTOR_NEURON){
+                        this->motorRows.push_back(this->targetColumns.size());
+                        this->motors.push_back(((MotorNeuron *) neuron)->getMotor());
+                    }
+                    this->targetColumns.push_back(i);
+                    this->alpha.push_back(((TargetableNeuron *) neuron)->getAlpha());
+                    this->tau.push_back(((TargetableNeuron *) neuron)->getTau());
+                    break;
+                case SENSOR_NEURON:
+                    this->sensorColumns.push_back(i);
+                    this->sensors.push_back(((SensorNeuron *) neuron)->getSensor());
+                    break;
+                case USER_NEURON:
+                    this->userColumns.push_back(i);
+                    this->users.push_back((UserNeuron *) neuron);
+                    break;
+                case BIAS_NEURON:
+                    break;
+            }
+        }
+        this->numTargetable = this->targetColumns.size();
+        this->synapticInput.assign(this->numTargetable, 0.0f);
+
+        // gather (column, weight) entries of each row in synapse
+        // order then order them by source neuron
+        std::vector< std::vector< std::pair<int, float> > > rows(this->numTargetable);
+        for (Synapse *synapse : synapses){
+            if (rowOf.count(synapse->getTargetNeuron()) == 0){
+                continue;
+            }
+            rows[rowOf[synapse->getTargetNeuron()]].push_back(
+                std::make_pair(columnOf[synapse->getSourceNeuron()], synapse->getWeight()));
+        }
+
+        int numWeights = 0;
+        bool parallelSynapses = false;
+        for (auto &row : rows){
+            std::stable_sort(row.begin(), row.end(),
+                             [](const std::pair<int, float> &a, const std::pair<int, float> &b){
+                                 return a.first < b.first;
+                             });
+            for (unsigned int k=1; k<row.size(); k++){
+                parallelSynapses |= row[k].first == row[k-1].first;
+            }
+            numWeights += row.size();
+        }
+
+        // a dense row is cheaper once about a quarter of it is filled.
+        // Parallel synapses need a weight each to keep the summation order
+        this->isDense = !parallelSynapses &&
+                        numWeights * 4 >= this->numTargetable * this->numNeurons;
+        if (this->isDense){
+            this->denseWeights.assign(this->numTargetable * this->numNeurons, 0.0f);
+            for (int r=0; r<this->numTargetable; r++){
+                for (auto const &entry : rows[r]){
+                    this->denseWeights[r * this->numNeurons + entry.first] = entry.second;
+                }
+            }
+        }
+        this->rowStarts.push_back(0);
+        for (int r=0; r<this->numTargetable; r++){
+            for (auto const &entry : rows[r]){
+                this->columns.push_back(entry.first);
+                this->sparseWeights.push_back(entry.second);
+            }
+            this->rowStarts.push_back(this->columns.size());
+        }
+    }
+
+    bool valuesAreFinite(void){
+        for (float value : this->values){
+            if (!std::isfinite(value)){
+                return false;
+            }
+        }
+        return true;
+    }
+
+    void update(void){
+        float *value = this->values.data();
+        float *input = this->synapticInput.data();
+        const int n = this->numNeurons;
+        const int t = this->numTargetable;
+
+        // synaptic input from the values of the last update
+        if (this->isDense && this->valuesAreFinite()){
+            for (int r=0; r<t; r++){
+                const float *weights = &this->denseWeights[r * n];
+                float sum = 0.0f;
+                for (int c=0; c<n; c++){
+                    sum += weights[c] * value[c];
+                }
+                input[r] = sum;
+            }
+        }
+        else{
+            const int *rowStart = this->rowStarts.data();
+            const int *column = this->columns.data();
+            const float *weights = this->sparseWeights.data();
+            for (int r=0; r<t; r++){
+                float sum = 0.0f;
+                for (int k=rowStart[r]; k<rowStart[r+1]; k++){
+                    sum += weights[k] * value[column[k]];
+                }
+                input[r] = sum;
+            }
+        }
+
+        // input neurons take their new values, bias neurons are constant
+        for (unsigned int i=0; i<this->sensors.size(); i++){
+            value[this->sensorColumns[i]] = this->sensors[i]->getSensorValue();
+        }
+        for (unsigned int i=0; i<this->users.size(); i++){
+            value[this->userColumns[i]] = this->users[i]->nextInputValue();
+        }
+
+        // ctrnn update of targetable neurons, thresholded with tanh
+        // in one pass over the contiguous synaptic input
+        const int *target = this->targetColumns.data();
+        const float *a = this->alpha.data();
+        const float *b = this->tau.data();
+        for (int r=0; r<t; r++){
+            input[r] = a[r] * value[target[r]] + b[r] * input[r];
+        }
+        for (int r=0; r<t; r++){
+            input[r] = tanh(input[r]);
+        }
+        for (int r=0; r<t; r++){
+            value[target[r]] = input[r];
+        }
+
+        for (unsigned int i=0; i<this->motors.size(); i++){
+            this->motors[i]->setNextInput(input[this->motorRows[i]]);
+        }
+    }
 };
 
-#endif
\ No newline at end of file
+#endif
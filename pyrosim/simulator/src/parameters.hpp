@@ -0,0 +1,141 @@
+#ifndef _PARAMETERS_HPP
+#define _PARAMETERS_HPP
+
+#pragma once
+
+#include <algorithm>
+#include <string>
+
+#include <ode/ode.h>
+
+// camera tracking modes
+enum CameraTracker { NONE, PAN, FOLLOW };
+
+// world steppers
+enum Solver { EXACT_SOLVER, QUICK_SOLVER };
+
+// global simulation parameters sent from python.
+// Names are only resolved while reading the scene, the
+// simulation loop reads the typed fields directly.
+struct SimulationParameters{
+    dReal dt;
+    int evalSteps;
+    int physicsSubsteps; // world steps of dt / physicsSubsteps per step
+
+    float cameraXYZ[3];
+    float cameraHPR[3];
+    int cameraTracking;
+    int cameraBody;
+
+    dReal gravity[3];
+
+    int collisionSpace; // see CollisionSpace in environment.hpp
+
+    int solver;
+    int quickIterations;
+    // negative keeps the default of ODE
+    dReal sorW;
+    dReal erp;
+    dReal cfm;
+    dReal contactSurfaceLayer;
+
+    int nContacts;
+    dReal friction; // negative for infinite friction
+
+    bool drawJoints;
+    int networkUpdate; // steps between network updates
+
+    // 0 : text, 1 : binary float32
+    int sensorFormat;
+
+    // stop when all stop conditions are met instead of any
+    bool stopWhenAll;
+
+    SimulationParameters(){
+        this->setDefaults();
+    };
+
+    void setDefaults(void){
+        // C.C while this function is not strictly
+        // necessary, I think it helps to have correspondence
+        // between here and python
+        this->dt = 0.01;
+        this->evalSteps = 200;
+        this->physicsSubsteps = 1;
+
+        this->cameraXYZ[0] = 0.0f;
+        this->cameraXYZ[1] = -5.0f;
+        this->cameraXYZ[2] = 2.0f;
+
+        this->cameraHPR[0] = 90.0f;
+        this->cameraHPR[1] = -10.0f;
+        this->cameraHPR[2] = 0.0f;
+
+        this->cameraTracking = NONE;
+        this->cameraBody = 0;
+
+        this->gravity[0] = 0.0;
+        this->gravity[1] = 0.0;
+        this->gravity[2] = -9.8;
+
+        this->collisionSpace = 0;
+
+        this->solver = EXACT_SOLVER;
+        this->quickIterations = 20;
+        this->sorW = -1.0;
+        this->erp = -1.0;
+        this->cfm = -1.0;
+        this->contactSurfaceLayer = -1.0;
+
+        this->nContacts = 10;
+        this->friction = dInfinity;
+
+        this->drawJoints = false;
+        this->networkUpdate = 1;
+
+        this->sensorFormat = 0;
+
+        this->stopWhenAll = false;
+    };
+
+    /**
+        Sets the parameter with the name used by python
+
+        @param name  - the name of the parameter
+        @param value - the value read from python
+        @return False if there is no parameter with that name
+    */
+    bool set(std::string name, double value){
+        if      (name == "DT")             this->dt = value;
+        else if (name == "EvalSteps")      this->evalSteps = int(value);
+        else if (name == "PhysicsSubsteps") this->physicsSubsteps = std::max(int(value), 1);
+        else if (name == "CameraX")        this->cameraXYZ[0] = value;
+        else if (name == "CameraY")        this->cameraXYZ[1] = value;
+        else if (name == "CameraZ")        this->cameraXYZ[2] = value;
+        else if (name == "CameraH")        this->cameraHPR[0] = value;
+        else if (name == "CameraP")        this->cameraHPR[1] = value;
+        else if (name == "CameraR")        this->cameraHPR[2] = value;
+        else if (name == "CameraTracking") this->cameraTracking = int(value);
+        else if (name == "CameraBody")     this->cameraBody = int(value);
+        else if (name == "GravityX")       this->gravity[0] = value;
+        else if (name == "GravityY")       this->gravity[1] = value;
+        else if (name == "GravityZ")       this->gravity[2] = value;
+        else if (name == "CollisionSpace") this->collisionSpace = int(value);
+        else if (name == "Solver")         this->solver = int(value);
+        else if (name == "QuickIterations") this->quickIterations = int(value);
+        else if (name == "SORW")           this->sorW = value;
+        else if (name == "ERP")            this->erp = value;
+        else if (name == "CFM")            this->cfm = value;
+        else if (name == "ContactSurfaceLayer") this->contactSurfaceLayer = value;
+        else if (name == "nContacts")      this->nContacts = int(value);
+        else if (name == "Friction")       this->friction = value;
+        else if (name == "DrawJoints")     this->drawJoints = value > 0;
+        else if (name == "NetworkUpdate")  this->networkUpdate = int(value);
+        else if (name == "SensorFormat")   this->sensorFormat = int(value);
+        else if (name == "StopWhenAll")    this->stopWhenAll = value > 0;
+        else return false;
+        return true;
+    };
+};
+
+#endif
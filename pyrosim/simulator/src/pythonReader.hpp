@@ -6,23 +6,36 @@
 #include <iostream>
 #include <string>
 
+#include "logger.hpp"
 
 // C.C. : Possible better way is to overload 
 // template but I can't figure  it out
 inline void readStringFromPython(std::string &inStr, std::string name="String"){
     std::getline(std::cin, inStr);
-    std::cerr << "Read in " << name << ": " << inStr << std::endl;
+    LOG_DEBUG("Read in " << name << ": " << inStr << std::endl);
+}
+
+// reads n bytes of raw binary data, sent by python followed by a newline
+inline void readBytesFromPython(char *data, size_t n, std::string name="Bytes"){
+    std::cin.read(data, n);
+    std::cin.ignore();
+    LOG_DEBUG("Read in " << name << ": " << n << " bytes" << std::endl);
 }
 
 
 template<class T> inline void readValueFromPython(T *val, int n, std::string name){
-    std::cerr << "Read in "<< name << ": ";
     for(int i=0; i<n; i++){
         std::cin >> val[i];
-        std::cerr << val[i] << " ";
     }
     std::cin.ignore();
-    std::cerr << std::endl;
+
+    if (logLevel >= LOG_LEVEL_DEBUG){
+        std::cerr << "Read in "<< name << ": ";
+        for(int i=0; i<n; i++){
+            std::cerr << val[i] << " ";
+        }
+        std::cerr << std::endl;
+    }
 }
 
 
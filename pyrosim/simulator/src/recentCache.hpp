@@ -0,0 +1,48 @@
+#ifndef _RECENT_CACHE_HPP
+#define _RECENT_CACHE_HPP
+
+#pragma once
+
+#include <list>
+#include <utility>
+
+/**
+    The most recently used values by key, for data built once and
+    reused by later scenes of the same process. Values are shared
+    pointers, which stay valid for as long as they are held, even
+    when they leave the cache.
+*/
+template<class Key, class Value> class RecentCache{
+protected:
+    std::list<std::pair<Key, Value> > entries;
+    size_t capacity;
+public:
+    RecentCache(size_t capacity){
+        this->capacity = capacity;
+    }
+
+    /**
+        Returns the value of the key
+
+        @return NULL if the key is not cached
+    */
+    Value find(const Key &key){
+        for (auto it = this->entries.begin(); it != this->entries.end(); ++it){
+            if (it->first == key){
+                // move to front as most recently used
+                this->entries.splice(this->entries.begin(), this->entries, it);
+                return it->second;
+            }
+        }
+        return Value();
+    }
+
+    void add(const Key &key, const Value &value){
+        this->entries.push_front(std::make_pair(key, value));
+        if (this->entries.size() > this->capacity){
+            this->entries.pop_back();
+        }
+    }
+};
+
+#endif
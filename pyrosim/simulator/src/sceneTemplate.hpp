@@ -0,0 +1,58 @@
+#ifndef _SCENE_TEMPLATE_HPP
+#define _SCENE_TEMPLATE_HPP
+
+#pragma once
+
+#include <string>
+#include <vector>
+
+#include "pythonReader.hpp"
+
+// A group of entities sent once by python and read again for each
+// instance. The commands are kept as sent, with the id of each entity
+// of the template written as a marker '@k' on its own line which is
+// replaced by the id of the entity in the instance.
+class SceneTemplate{
+protected:
+    std::string commands;
+    std::vector<long> markerOffsets; // offset of each marker
+    std::vector<int> markerIDs;      // local entity id of each marker
+    int numEntities;
+
+public:
+    SceneTemplate(){ this->numEntities = 0; }
+
+    void readFromPython(void){
+        int numMarkers;
+        long size;
+        readValueFromPython<int>(&this->numEntities, "Template Entities");
+        readValueFromPython<int>(&numMarkers, "Template Markers");
+        this->markerOffsets.resize(numMarkers);
+        this->markerIDs.resize(numMarkers);
+        readValueFromPython<long>(this->markerOffsets.data(), numMarkers, "Marker Offsets");
+        readValueFromPython<int>(this->markerIDs.data(), numMarkers, "Marker IDs");
+        readValueFromPython<long>(&size, "Template Size");
+        this->commands.resize(size);
+        readBytesFromPython(&this->commands[0], size, "Template");
+    }
+
+    int getNumEntities(void){ return this->numEntities; }
+
+    // commands of an instance whose entities start at id base
+    std::string expand(int base){
+        std::string text;
+        text.reserve(this->commands.size() + 4 * this->markerIDs.size() + 5);
+        size_t last = 0;
+        for (size_t i=0; i<this->markerIDs.size(); i++){
+            const std::string marker = std::to_string(this->markerIDs[i]);
+            text.append(this->commands, last, this->markerOffsets[i] - last);
+            text += std::to_string(base + this->markerIDs[i]);
+            last = this->markerOffsets[i] + 1 + marker.size();
+        }
+        text.append(this->commands, last, std::string::npos);
+        text += "Done\n";
+        return text;
+    }
+};
+
+#endif
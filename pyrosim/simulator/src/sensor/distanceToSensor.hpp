@@ -42,7 +42,6 @@ public:
                                pow( pos1[1] - pos2[1], 2 ) +
                                pow( pos1[2] - pos2[2], 2 ) );
         this->currentSensorValue = distance;
-        this->sensorValues.push_back(this->currentSensorValue);
     }
 };
 
@@ -23,7 +23,6 @@ public:
 
     void sense(){
         this->currentSensorValue = this->body->getIsSeen();
-        this->sensorValues.push_back( this->currentSensorValue );
         this->body->setIsSeen( false );
     }
 };
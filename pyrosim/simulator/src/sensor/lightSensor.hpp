@@ -11,8 +11,12 @@ class LightSensor : public Sensor
 protected:
     RigidBody *body;
     int bodyID;
-    Environment *environment;
+    dReal lightSense;
 public:
+    LightSensor(){
+        this->lightSense = 0.0;
+    }
+
     virtual void readFromPython( void ){
         readValueFromPython<int>( &this->bodyID, "Body ID" );
         this->readWriteBackFromPython();
@@ -20,36 +24,20 @@ public:
 
     virtual void create( Environment *environment ){
         this->body = (RigidBody *) environment->getEntity( this->bodyID );
-        this->environment = environment;
+        environment->addLightSensor( this );
     }
 
+    RigidBody* getBody( void ){ return this->body; }
+
+    // set by the environment, which evaluates all light sensors at once
+    void setLightSense( dReal lightSense ){ this->lightSense = lightSense; }
+
     void sense(){
-        // get all light sources
-        dReal lightSense = 0.0;
-
-        const dReal *myPosition = this->body->getPosition();
-
-        for (auto entity : environment->entities){
-            if ( entity->getEntityType() == BODY ){
-                RigidBody *otherBody = (RigidBody *) entity;
-                std::cerr << "Body light intensity " << otherBody->lightIntensity << std::endl;
-                if ( otherBody->lightIntensity > 0.0 ){
-                    const dReal *otherPosition = otherBody->getPosition();
-
-                    dReal distanceSquared = pow( myPosition[0] - otherPosition[0], 2.0 ) + 
-                                            pow( myPosition[1] - otherPosition[1], 2.0 ) +
-                                            pow( myPosition[2] - otherPosition[2], 2.0 );
-                    dReal intensity = otherBody->lightIntensity * ( 1.0 / distanceSquared );
-                    lightSense += intensity;
-                }
-            }
-        }
-        std::cerr << "Light sense " << lightSense << std::endl;
-
-        this->currentSensorValue = lightSense;
-        this->sensorValues.push_back( this->currentSensorValue );
+        LOG_DEBUG("Light sense " << this->lightSense << std::endl);
+
+        this->currentSensorValue = this->lightSense;
     }
 };
 
 
-#endif
\ No newline at end of file
+#endif
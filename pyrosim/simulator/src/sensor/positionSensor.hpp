@@ -35,7 +35,6 @@ public:
     void sense(){
         const dReal* pos = this->body->getPosition();
         this->currentSensorValue = pos[this->whichDimension];
-        this->sensorValues.push_back(this->currentSensorValue);
     }
 };
 
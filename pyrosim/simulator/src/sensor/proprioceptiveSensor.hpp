@@ -33,7 +33,6 @@ public:
     void sense(){
         const dReal prop = this->joint->getProprioception();
         this->currentSensorValue = prop;
-        this->sensorValues.push_back(this->currentSensorValue);
     }
 };
 
@@ -42,7 +42,6 @@ public:
         else{
             this->currentSensorValue = ray->getColorComponent(this->whichSense - 1);
         }
-        this->sensorValues.push_back(this->currentSensorValue);
         // const dReal* pos = this->body->getPosition();
         // this->currentSensorValue = pos[this->whichDimension];
         // this->sensorValues.push_back(this->currentSensorValue);
@@ -3,32 +3,83 @@
 
 #pragma once
 
+#include <iostream>
 #include <vector>
 
 #include "entity.hpp"
 
+// statistics a sensor can be reduced to by the environment
+enum ReducerOp {REDUCE_FINAL=0, REDUCE_MEAN, REDUCE_MAX, REDUCE_MIN, REDUCE_INTEGRAL};
+
+// comparisons of a sensor value with the threshold of a stop condition
+enum StopOp {STOP_LESS=0, STOP_LESS_EQUAL, STOP_GREATER, STOP_GREATER_EQUAL};
+
+struct StopCondition{
+    int op;
+    double threshold;
+    int afterStep; // first time step the condition is checked at
+};
+
 class Sensor : public Entity
 {
 protected:
     float currentSensorValue;
-    std::vector<float> sensorValues;
     int writeBack;
+    int recordEvery; // steps between recorded values
+    std::vector<int> reducerOps;
+    std::vector<StopCondition> stopConditions;
 public:
+    Sensor(){
+        this->currentSensorValue = 0.0f;
+        this->recordEvery = 1;
+    }
+
     float getSensorValue(){ return this->currentSensorValue; }
+    int getWriteBack(){ return this->writeBack; }
+    int getRecordEvery(){ return this->recordEvery; }
     void readWriteBackFromPython( void ){
         readValueFromPython<int>(&this->writeBack, "Write Back");
+        readValueFromPython<int>(&this->recordEvery, "Record Every");
+    }
+
+    void readAdditionFromPython(void){
+        std::string addition;
+        readStringFromPython(addition, "Adding");
+        if (addition == "Reducer"){
+            int op;
+            readValueFromPython<int>(&op, "Reducer Op");
+            if (op < REDUCE_FINAL || op > REDUCE_INTEGRAL){
+                std::cerr << "ERROR: Unknown reducer " << op << std::endl;
+                exit(0);
+            }
+            this->reducerOps.push_back(op);
+        }
+        else if (addition == "StopCondition"){
+            StopCondition condition;
+            readValueFromPython<int>(&condition.op, "Stop Op");
+            readValueFromPython<double>(&condition.threshold, "Threshold");
+            readValueFromPython<int>(&condition.afterStep, "After Step");
+            if (condition.op < STOP_LESS || condition.op > STOP_GREATER_EQUAL){
+                std::cerr << "ERROR: Unknown stop condition " << condition.op << std::endl;
+                exit(0);
+            }
+            this->stopConditions.push_back(condition);
+        }
+    }
+
+    const std::vector<int>& getReducerOps(void){ return this->reducerOps; }
+    const std::vector<StopCondition>& getStopConditions(void){ return this->stopConditions; }
+
+    // number of values recorded in timeSteps steps, at steps 0, k, 2k, ...
+    int numRecords(int timeSteps){
+        return (timeSteps + this->recordEvery - 1) / this->recordEvery;
     }
+
     virtual EntityType getEntityType(void){ return SENSOR; }
+
+    // sets currentSensorValue, recorded by the environment
     virtual void sense() =0;
     virtual void takeStep(int timeStep, dReal dt){ this->sense(); }
-    virtual void writeToPython(void){
-        if ( this->writeBack == true ){
-            std::cout << " " << this->entityID;
-            for (auto val : this->sensorValues){
-                std::cout << " " << val;
-            }           
-        }
-    };
 };
 
 #endif
\ No newline at end of file
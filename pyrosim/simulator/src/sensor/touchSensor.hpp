@@ -12,28 +12,23 @@ class TouchSensor : public Sensor
 {
 protected:
     int bodyID;
-    std::vector< std::pair<int, int> >* collisions;
+    Environment *environment;
 
 public:
     TouchSensor(){};
 
     void sense(void){
-        std::cerr << "Sensing " << std::endl;
-        for (auto const &collisionPair : *this->collisions){
-            if (collisionPair.first == this->bodyID or
-                collisionPair.second == this->bodyID){
-
-                this->sensorValues.push_back(1.0);
-                this->currentSensorValue = 1.0;
-                return;
-            }
+        LOG_DEBUG("Sensing " << std::endl);
+        if (this->environment->isTouching(this->bodyID)){
+            this->currentSensorValue = 1.0f;
+        }
+        else{
+            this->currentSensorValue = 0.0f;
         }
-        this->currentSensorValue = 0.0f;
-        this->sensorValues.push_back(0.0f);
     };
 
     void create(Environment *environment){
-        this->collisions = &environment->collisions;
+        this->environment = environment;
     };
 
     void readFromPython(void){
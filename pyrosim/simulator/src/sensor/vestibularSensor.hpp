@@ -35,7 +35,6 @@ public:
         const dReal * quat = this->body->getQuaternion();
         // const dReal * quat = dBodyGetQuaternion(this->bodyID);
         this->currentSensorValue = quat[this->whichDimension];
-        this->sensorValues.push_back(this->currentSensorValue);
     }
 };
 
@@ -1,5 +1,6 @@
 // std headers
 #include <iostream>
+#include <sstream>
 #include <map>
 #include <cmath>
 #include <utility>
@@ -8,74 +9,78 @@
 
 // ode headers
 #include <ode/ode.h>
-#include <drawstuff/drawstuff.h>
 
 // local headers
 #include "pythonReader.hpp"
 #include "environment.hpp"
 #include "body/rigidBody.hpp"
 #include "body/ray.hpp"
+#include "network/ctrnn.hpp"
 #include "geomData.hpp"
+#include "parameters.hpp"
+#include "drawing.hpp"
 
+#ifndef HEADLESS
 // glut stupidity
 #ifdef __APPLE__
 #include <GLUT/glut.h>
 #else
 #include <GL/glut.h>
 #endif
-
-// drawing necessity
-#ifdef dDOUBLE
-#define dsDrawLine dsDrawLineD
-#define dsDrawBox dsDrawBoxD
-#define dsDrawSphere dsDrawSphereD
-#define dsDrawCylinder dsDrawCylinderD
-#define dsDrawCapsule dsDrawCapsuleD
 #endif
 
 #define PI 3.14159265
 
 // global variables
-std::map<std::string, float> parameters; // maps of parameters useful to the simulator
+SimulationParameters parameters; // parameters useful to the simulator
 int evalStep; // current evaluation step
 float evalTime; // current eval time in simulated seconds
 Environment *environment;
-enum CameraTracker { NONE, PAN, FOLLOW };
 
+#ifndef HEADLESS
 std::string texturePathStr = "../external/ode-0.12/drawstuff/textures";
 dsFunctions fn; // drawstuff pointers
+#endif
 
 dWorldID world; // the entire world
 dSpaceID topspace; // top space
 dJointGroupID contactgroup; // contact joints group
 
 // collision map
-typedef std::pair<std::string, std::string> collisionPair;
-std::map<collisionPair, int> collisionMap;
 
 // various flags
 int firstStep = true;
 int drawJoints = false;
 int drawSpaces = false;
 int playBlind = false;
+int serverMode = false;
+int simulationFinished = false;
 
-std::string COLLIDE_ALWAYS_STR = "Collide";
-int COLLIDE_ALWAYS = -1;
+// verbosity of stderr output, see logger.hpp
+int logLevel = LOG_LEVEL_INFO;
 
 void readCollisionFromPython(void);
-static void command(void);
+void readSpaceTypeFromPython(void);
+void readInstanceFromPython(void);
 void createEnvironment(void);
-static void drawLoop(int pause);
+void destroyODE(void);
 void endSimulation();
 void handleRayCollision();
 static void nearCallback(void *callbackData, dGeomID o1, dGeomID o2);
 void readFromPython(void);
-void initializeDrawStuff(void);
+void resetSimulation(void);
+void runServer(void);
 void initializeEnvironment(void);
 void initializeODE(void);
 void initializeParameters(void);
+#ifndef HEADLESS
+static void command(int cmd);
+static void drawLoop(int pause);
+void initializeDrawStuff(void);
 static void start(void);
+#endif
 void simulationStep(void);
+void writeSimulationOutput(void);
 
 int main(int argc, char **argv){
     // initialize everything and run
@@ -87,6 +92,22 @@ int main(int argc, char **argv){
         if (strcmp(argv[i], "-blind") == 0){
             playBlind = true;
         }
+        // server mode evaluates many scenes blind
+        // without restarting the process
+        else if (strcmp(argv[i], "-server") == 0){
+            playBlind = true;
+            serverMode = true;
+        }
+        else if (strcmp(argv[i], "-loglevel") == 0 && i+1 < argc){
+            logLevel = atoi(argv[++i]);
+        }
+    }
+
+    dInitODE2(0);
+
+    if (serverMode){
+        runServer();
+        return 0;
     }
 
     // these functions cannot use input parameters
@@ -99,38 +120,116 @@ int main(int argc, char **argv){
     createEnvironment();
     dWorldSetAutoDisableFlag(world, 1);
 
-    std::cerr << "Simulation Starting" << std::endl;
+    LOG_INFO("Simulation Starting" << std::endl);
 
     simulationStep();
     if (playBlind){
-        while(1){
+        while(!simulationFinished){
             simulationStep();
         }
+        endSimulation();
     }
     else{
+#ifdef HEADLESS
+        std::cerr << "ERROR: The headless simulator can only play blind" << std::endl;
+        exit(0);
+#else
         initializeDrawStuff();
-        if ( parameters["DrawJoints"] > 0 ){
+        if ( parameters.drawJoints ){
             drawJoints = true;
         }
         // can't set camera here :(
         dsSimulationLoop(argc, argv, 900, 700, &fn);
+#endif
     }
 }
 
 void readCollisionFromPython(void){
-    // creates entry into map to specify collision
+    // marks the two groups as colliding in the environment
     std::string group1, group2;
 
-    std::cerr << "Reading Collision Assignment" << std::endl;
+    LOG_DEBUG("Reading Collision Assignment" << std::endl);
     readStringFromPython(group1, "Collision Group 1");
     readStringFromPython(group2, "Collision Group 2");
 
-    collisionPair pair1 = std::make_pair(group1, group2);
-    collisionMap[pair1] = true;
-    collisionPair pair2 = std::make_pair(group2, group1);
-    collisionMap[pair2] = true;
+    environment->assignCollision(group1, group2);
+}
+
+void readSpaceTypeFromPython(void){
+    // sets the type of collision space of a named space
+    std::string name;
+    int type;
+
+    LOG_DEBUG("Reading Space Type" << std::endl);
+    readStringFromPython(name, "Space");
+    readValueFromPython<int>(&type, "Space Type");
+
+    environment->setSpaceType(name, type);
+}
+
+void readInstanceFromPython(void){
+    // reads the commands of a template again with its entities
+    // renumbered after the existing ones, then moves them to the
+    // position and rotation of the instance
+    int index, numOverrides;
+    dReal position[3], orientation[3], heading;
+
+    LOG_DEBUG("Reading Instance" << std::endl);
+    readValueFromPython<int>(&index, "Template");
+    readValueFromPython<dReal>(position, 3, "Position");
+    readValueFromPython<dReal>(orientation, 3, "Orientation");
+    readValueFromPython<dReal>(&heading, "Heading");
+    readValueFromPython<int>(&numOverrides, "Weight Overrides");
+    std::vector<int> synapseIDs(numOverrides);
+    std::vector<float> weights(numOverrides);
+    readValueFromPython<int>(synapseIDs.data(), numOverrides, "Synapse IDs");
+    readValueFromPython<float>(weights.data(), numOverrides, "Weights");
+
+    if (index < 0 || index >= (int) environment->templates.size()){
+        std::cerr << "ERROR: Template " << index << " does not exist" << std::endl;
+        exit(0);
+    }
+    SceneTemplate &sceneTemplate = environment->templates[index];
+
+    // turn by the heading about z, then tilt z onto the orientation
+    dMatrix3 R, headingR, orientationR;
+    dRFromAxisAndAngle(headingR, 0, 0, 1, heading);
+    if (orientation[0] == 0.0 and orientation[1] == 0.0 and orientation[2] == 1.0){
+        dRSetIdentity(orientationR);
+    } else{
+        dRFromZAxis(orientationR, orientation[0], orientation[1], orientation[2]);
+    }
+    dMultiply0_333(R, orientationR, headingR);
+
+    // read the expanded commands as if they came from python
+    int base = environment->entities.size();
+    std::istringstream commands(sceneTemplate.expand(base));
+    std::streambuf *pythonInput = std::cin.rdbuf(commands.rdbuf());
+    readFromPython();
+    std::cin.rdbuf(pythonInput);
+
+    if ((int) environment->entities.size() - base != sceneTemplate.getNumEntities()){
+        std::cerr << "ERROR: Instance of template " << index << " has "
+                  << environment->entities.size() - base << " entities instead of "
+                  << sceneTemplate.getNumEntities() << std::endl;
+        exit(0);
+    }
+    for (size_t i=base; i<environment->entities.size(); i++){
+        environment->entities[i]->transform(position, R);
+    }
+    for (int i=0; i<numOverrides; i++){
+        int local = synapseIDs[i];
+        if (local < 0 || local >= sceneTemplate.getNumEntities() ||
+            environment->getEntity(base + local)->getEntityType() != SYNAPSE){
+            std::cerr << "ERROR: Weight override of entity " << local
+                      << " of template " << index << " is not a synapse" << std::endl;
+            exit(0);
+        }
+        ((Synapse *) environment->getEntity(base + local))->setWeight(weights[i]);
+    }
 }
 
+#ifndef HEADLESS
 static void command(int cmd){
     // 'x' for exit
     if (cmd == 'x'){
@@ -145,30 +244,52 @@ static void command(int cmd){
         drawSpaces = !drawSpaces;
     }
 }
+#endif
 
 void createEnvironment(void){
     // set gravity
     dWorldSetGravity(world,
-                     parameters["GravityX"],
-                     parameters["GravityY"],
-                     parameters["GravityZ"]);
+                     parameters.gravity[0],
+                     parameters.gravity[1],
+                     parameters.gravity[2]);
+    // set solver, negative values keep the defaults of ODE
+    dWorldSetQuickStepNumIterations(world, parameters.quickIterations);
+    if (parameters.sorW >= 0.0){
+        dWorldSetQuickStepW(world, parameters.sorW);
+    }
+    if (parameters.erp >= 0.0){
+        dWorldSetERP(world, parameters.erp);
+    }
+    if (parameters.cfm >= 0.0){
+        dWorldSetCFM(world, parameters.cfm);
+    }
+    if (parameters.contactSurfaceLayer >= 0.0){
+        dWorldSetContactSurfaceLayer(world, parameters.contactSurfaceLayer);
+    }
     // send ground plane
     dGeomID plane = dCreatePlane(topspace, 0, 0, 1, 0);
     // dGeomSetData(plane, static_cast<void*>(&COLLIDE_ALWAYS));
-    GeomData* planeData = new GeomData();
+    GeomData* planeData = createGeomData();
     planeData->entityID = -1;
+    planeData->collisionGroup = COLLIDE_ALWAYS;
     planeData->color[0] = 0.0;
     planeData->color[1] = 0.0;
     planeData->color[2] = 0.0;
     dGeomSetData(plane, static_cast<void*>(planeData));
+    // static bodies resting on the ground are not tested against it
+    dGeomSetCategoryBits(plane, STATIC_CATEGORY);
+    dGeomSetCollideBits(plane, ~STATIC_CATEGORY);
     // GeomData planeData = (GeomData) {-1, 0.0, 0.0, 0.0};
     // dGeomSetData(plane, static_cast<void*>(&planeData));
     // create bodies, joints, ANN, etc
-    environment->createInODE();
+    environment->createInODE(parameters.evalSteps);
+    // fit the collision spaces to the created geoms
+    topspace = environment->configureSpaces(parameters.collisionSpace);
 
-    std::cerr << "Completed Creation" << std::endl;
+    LOG_INFO("Completed Creation" << std::endl);
 }
 
+#ifndef HEADLESS
 static void drawLoop(int pause){
     if (firstStep){
         // float xyz[] = {parameters["CameraX"], parameters["CameraY"], parameters["CameraZ"]};
@@ -180,7 +301,7 @@ static void drawLoop(int pause){
     double elapsed = dsElapsedTime();
 
     // variable frame rate
-    int nsteps = (int) ceilf(elapsed / parameters["DT"]);
+    int nsteps = (int) ceil(elapsed / parameters.dt);
     for(int i=0; i < nsteps && !pause; i++){
         simulationStep();
     }
@@ -229,12 +350,12 @@ static void drawLoop(int pause){
             dsDrawLine(topPoint, bottomPoint);
         }
     } else {
-        if ( CameraTracker ( parameters["CameraTracking"] ) == PAN ){
+        if ( parameters.cameraTracking == PAN ){
             
             dsGetViewpoint(xyz, hpr);
             // panning
             float direction[3];
-            const dReal* bodyPosition = ((RigidBody * )environment->getEntity( int( parameters["CameraBody"] ) ))->getPosition();
+            const dReal* bodyPosition = ((RigidBody * )environment->getEntity( parameters.cameraBody ))->getPosition();
             for ( int i = 0; i < 3; i++ ){
                 direction[i] = bodyPosition[i] - xyz[i];
             }
@@ -252,27 +373,47 @@ static void drawLoop(int pause){
                 float newPitch = asin( zDrop / magnitude ) * 180.0 / 3.14159;
                 
                 float newHPR[3] = { newHeading, newPitch, hpr[2] };
-                std::cerr << newHPR[0] << " " << newHPR[1] << " " << newHPR[2] << std::endl;
+                LOG_DEBUG(newHPR[0] << " " << newHPR[1] << " " << newHPR[2] << std::endl);
                 dsSetViewpoint( xyz, newHPR );
             }
-        } else if ( CameraTracker ( parameters["CameraTracking"] ) == FOLLOW ){
+        } else if ( parameters.cameraTracking == FOLLOW ){
             // NOT YET IMPLEMENTED
         }
     }
 
     environment->draw(drawJoints, drawSpaces);
 }
+#endif
+
+void destroyODE(void){
+    // spaces clean up their geoms and sub spaces,
+    // the world cleans up bodies and joints
+    destroyAllGeomData();
+    dJointGroupDestroy(contactgroup);
+    dSpaceDestroy(topspace);
+    dWorldDestroy(world);
+}
 
 void endSimulation(void){
     // std::cerr << "Successful Exit" << std::endl;
-    std::cerr << "Simulation Completed" << std::endl << std::endl;
-    // write out total time steps to cout for sensory collection
-    std::cout << evalStep;
-    environment->writeToPython();
-    std::cerr << "Success" << std::endl;
+    LOG_INFO("Simulation Completed" << std::endl << std::endl);
+    writeSimulationOutput();
+    LOG_INFO("Success" << std::endl);
     exit(0);
 }
 
+void writeSimulationOutput(void){
+    if ( parameters.sensorFormat > 0 ){
+        // packed binary float32 columns
+        environment->writeBinaryToPython(evalStep);
+    }
+    else{
+        // total time steps followed by the values of each sensor
+        environment->writeToPython(evalStep);
+    }
+}
+
+#ifndef HEADLESS
 void initializeDrawStuff(void){
     fn.version = DS_VERSION;
     fn.start = &start;
@@ -281,68 +422,50 @@ void initializeDrawStuff(void){
     fn.stop = 0;
     fn.path_to_textures = texturePathStr.c_str();
 }
+#endif
 
 void initializeEnvironment(void){
     environment = new Environment(world, topspace);
 }
 
 void initializeODE(void){
-    dInitODE2(0);
+    // ODE's random number generator is global, reseed it
+    // so every scene in server mode starts from the same state
+    dRandSetSeed(0);
     world = dWorldCreate();
     topspace = dHashSpaceCreate(0);
     contactgroup = dJointGroupCreate(0);
 }
 
 void initializeParameters(void){
-    // C.C while this function is not strictly 
-    // necessary, I think it helps to have correspondence
-    // between here and python
-    parameters["DT"] = 0.01;
-    parameters["EvalSteps"] = 200;
-
-    // parameters["ERP"];
-    
-    // C.C. heavy here to split arrays into different
-    // entries in map but maybe necessary
-    // to reduce bloat in readFromPython
-    // I don't know of other ways other then
-    // different parameter maps. aka 
-    // v3Parameters, iParameters, fParameters, etc.
-    parameters["CameraX"] = 0.0;
-    parameters["CameraY"] = -5.0;
-    parameters["CameraZ"] = 2.0;
-
-    parameters["CameraH"] = 90.0f;
-    parameters["CameraP"] = -10.0f;
-    parameters["CameraR"] = 0.0f;
-
-    parameters["CameraTracking"] = 0.0f;
-    parameters["CameraBody"] = 0.0f;
-
-    parameters["GravityX"] = 0.0f;
-    parameters["GravityY"] = 0.0f;
-    parameters["GravityZ"] = -9.8f;
-
-    parameters["nContacts"] = 10;
-
-    parameters["Friction"] = dInfinity;
-
-    parameters["DrawJoints"] = 0.0;
-
-    parameters["NetworkUpdate"] = 1.0;
+    parameters.setDefaults();
 }
 
 void simulationStep(void){
     // check if correct time to update network
     int updateNetwork = false;
-    if ( evalStep % int( parameters["NetworkUpdate"] ) == 0 ){
+    if ( evalStep % parameters.networkUpdate == 0 ){
         updateNetwork = true;
     }
-    environment->takeStep(evalStep, parameters["DT"], updateNetwork );
+    // sense and think once per step, the physics may
+    // take several shorter substeps for stable contacts
+    dReal physicsDt = parameters.dt / parameters.physicsSubsteps;
+    environment->takeStep(evalStep, parameters.dt, updateNetwork, physicsDt);
     environment->emptyCollisionPairs();
-    dSpaceCollide(topspace, 0, &nearCallback); // run collision
-    dWorldStep(world, parameters["DT"]); // take time step
-    dJointGroupEmpty(contactgroup);
+    for (int substep=0; substep<parameters.physicsSubsteps; substep++){
+        if (substep > 0){
+            environment->takeSubstep(evalStep, physicsDt);
+        }
+        dSpaceCollide(topspace, 0, &nearCallback); // run collision
+        // take time step
+        if (parameters.solver == QUICK_SOLVER){
+            dWorldQuickStep(world, physicsDt);
+        }
+        else{
+            dWorldStep(world, physicsDt);
+        }
+        dJointGroupEmpty(contactgroup);
+    }
     // // empty collision pairs
     
     // place action before collision detection?
@@ -354,24 +477,30 @@ void simulationStep(void){
     // dJointGroupEmpty(contactgroup);
     // empty collision pairs
 
-    evalTime += parameters["DT"];
+    // stop conditions see the values sensed at the start of this step
+    bool stopConditionsMet = environment->stopConditionsMet(evalStep, parameters.stopWhenAll);
+
+    evalTime += parameters.dt;
     evalStep ++;
-    if (evalStep == parameters["EvalSteps"]){
-        endSimulation();
+    if (evalStep == parameters.evalSteps || stopConditionsMet){
+        simulationFinished = true;
+        if (!playBlind){
+            endSimulation();
+        }
     }
     else{
         // std::cerr << evalStep << std::endl;
     }
 }
 
+#ifndef HEADLESS
 static void start(void)
 {
   dAllocateODEDataForThread(dAllocateMaskAll);
   // set camera here?
-    float xyz[] = {parameters["CameraX"], parameters["CameraY"], parameters["CameraZ"]};
-    float hpr[] = {parameters["CameraH"], parameters["CameraP"], parameters["CameraR"]};
-    dsSetViewpoint(xyz, hpr);
+    dsSetViewpoint(parameters.cameraXYZ, parameters.cameraHPR);
 }
+#endif
 
 void handleRayCollision(dGeomID ray, dGeomID o2){
     // handles ray collisions
@@ -408,11 +537,12 @@ void nearCallback(void *callbackData, dGeomID o1, dGeomID o2){
         // collide space with other objects
         dSpaceCollide2(o1, o2, callbackData, &nearCallback);
 
-        // collide with spaces
-        if (dGeomIsSpace(o1)){
+        // collide with spaces, the geoms of
+        // the static space never collide with each other
+        if (dGeomIsSpace(o1) && (dSpaceID) o1 != environment->staticSpace){
             dSpaceCollide((dSpaceID) o1, callbackData, &nearCallback);
         }
-        if (dGeomIsSpace(o2)){
+        if (dGeomIsSpace(o2) && (dSpaceID) o2 != environment->staticSpace){
             dSpaceCollide((dSpaceID) o2, callbackData, &nearCallback);
         }
 
@@ -430,46 +560,27 @@ void nearCallback(void *callbackData, dGeomID o1, dGeomID o2){
     GeomData* g1 = static_cast<GeomData*> (dGeomGetData(o1));
     GeomData* g2 = static_cast<GeomData*> (dGeomGetData(o2));
 
-    if (g1->entityID == -1 or g2->entityID == -1){
-        // an entity ID of -1 indicates always collide
-        // contitne
+    // the ground and height maps are in the always colliding group
+    if (!environment->groupsCollide(g1->collisionGroup, g2->collisionGroup)){
+        return;
     }
-    else{
-        RigidBody *body1 = (RigidBody *) environment->getEntity(g1->entityID);
-        RigidBody *body2 = (RigidBody *) environment->getEntity(g2->entityID);
 
-        if (dAreConnected(body1->getBody(), body2->getBody())){ // exit early if connected
-            return;
-        }
-
-        std::string group1 = body1->getCollisionGroupName();
-        std::string group2 = body2->getCollisionGroupName();
-        if (group1 != COLLIDE_ALWAYS_STR and group2 != COLLIDE_ALWAYS_STR){
-            collisionPair pair = std::make_pair(group1, group2);
-            if (collisionMap.count(pair) == 0){ // no collision entry, exit early
-                return;
-            }
-            else{
-                if (collisionMap[pair] == false){ // collision entry specifies no collision should occur
-                    return;
-                }
-            }
-        }
+    dBodyID body1 = dGeomGetBody(o1);
+    dBodyID body2 = dGeomGetBody(o2);
+    if (body1 && body2 && dAreConnected(body1, body2)){ // exit early if connected
+        return;
     }
 
     // generate at most n contacts per collision
-    const int N = parameters["nContacts"];
+    const int N = parameters.nContacts;
     dContact contact[N];
     int n = dCollide(o1, o2, N, &contact[0].geom, sizeof(dContact));
     if (n > 0){
+        const dReal mu = parameters.friction < 0.0 ? dInfinity : parameters.friction;
         for(int i=0; i<n; i++){
             // set friction parameters for contact
             contact[i].surface.mode = dContactSlip1 | dContactSlip2 | dContactApprox1;
-            if ( parameters["Friction"] < 0.0 ){
-                contact[i].surface.mu = dInfinity;
-            } else {
-                contact[i].surface.mu = parameters["Friction"];
-            }
+            contact[i].surface.mu = mu;
             // contact[i].surface.mu = dInfinity;
             // contact[i].surface.mu = 0.0;
             contact[i].surface.slip1 = 0.01;
@@ -477,21 +588,26 @@ void nearCallback(void *callbackData, dGeomID o1, dGeomID o2){
 
             dJointID c = dJointCreateContact(world, contactgroup, &contact[i]);
             dJointAttach(c, dGeomGetBody(contact[i].geom.g1), dGeomGetBody(contact[i].geom.g2));
-            // create collision pair and append to environment.collisions
-            environment->addCollisionPair(g1->entityID, g2->entityID);
         }
+        // record the contact once per pair of geoms
+        environment->addCollisionPair(g1->entityID, g2->entityID);
     }
 }
 
 void readParameterFromPython(void){
     // reads in parameter from python string
-    // and sets it as in the global map parameters
+    // and sets the matching field of the global parameters
     std::string paramName;
+    double value;
     readStringFromPython(paramName);
-    readValueFromPython<float>(&parameters[paramName]);
-    std::cerr << paramName << " set to "
-              << parameters[paramName]
-              << std::endl << std::endl;
+    readValueFromPython<double>(&value);
+    if (!parameters.set(paramName, value)){
+        std::cerr << "INVALID PARAMETER " << paramName << std::endl;
+        exit(0);
+    }
+    LOG_DEBUG(paramName << " set to "
+              << value
+              << std::endl << std::endl);
               // double space for clarity
 }
 
@@ -524,6 +640,18 @@ void readFromPython(void){
         else if(incomingString == "AssignCollision"){
             readCollisionFromPython();
         }
+        else if(incomingString == "SpaceType"){
+            readSpaceTypeFromPython();
+        }
+        else if(incomingString == "Template"){
+            environment->readTemplateFromPython();
+        }
+        else if(incomingString == "Instance"){
+            readInstanceFromPython();
+        }
+        else if(incomingString == "Override"){
+            environment->readOverrideFromPython();
+        }
         else{
             std::cerr << "INVALID READ IN " << incomingString << std::endl;
             exit(0);
@@ -531,5 +659,59 @@ void readFromPython(void){
         // read in next string
         readStringFromPython(incomingString);
     }
-    std::cerr << "Finished Reading In From Python" << std::endl << std::endl;
+    LOG_DEBUG("Finished Reading In From Python" << std::endl << std::endl);
+}
+
+void resetSimulation(void){
+    // tear down the environment of the last scene
+    // and return to the same state as a fresh process
+    destroyODE();
+    delete environment;
+
+    evalStep = 0;
+    evalTime = 0.0f;
+    simulationFinished = false;
+
+    initializeODE();
+    initializeParameters();
+    initializeEnvironment();
+}
+
+void runServer(void){
+    // evaluate a stream of scenes, each followed by a
+    // Reset command, until python sends Exit or closes stdin
+    initializeODE();
+    initializeParameters();
+    initializeEnvironment();
+
+    std::string incomingString = "Reset";
+    while (incomingString == "Reset"){
+        readFromPython();
+        createEnvironment();
+        dWorldSetAutoDisableFlag(world, 1);
+
+        LOG_INFO("Simulation Starting" << std::endl);
+        while(!simulationFinished){
+            simulationStep();
+        }
+        LOG_INFO("Simulation Completed" << std::endl << std::endl);
+
+        // buffer the output so it can be sent with its size
+        std::ostringstream output;
+        std::streambuf *coutBuffer = std::cout.rdbuf(output.rdbuf());
+        writeSimulationOutput();
+        std::cout.rdbuf(coutBuffer);
+
+        const std::string &result = output.str();
+        std::cout << "Result " << result.size() << std::endl;
+        std::cout.write(result.data(), result.size());
+        std::cout.flush();
+
+        readStringFromPython(incomingString);
+        if (incomingString == "Reset"){
+            resetSimulation();
+        }
+    }
+    destroyODE();
+    delete environment;
 }
\ No newline at end of file